@@ -0,0 +1,104 @@
+import os
+import sys
+import random
+import pathlib
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pvzuser import PLANT_COLOR, PLANT_DIR, PLANT_LOCATION, PLANT_TYPE_NAMES, FileBinaryWriter, USER_ENTRY
+from pvzuser.user_layout import FLAG, HEADER, NONZERO, PLANT_COUNT, PLANT_COUNT_OFFSET, PLANT_SIZE, PLANTS_OFFSET, TAIL, encode_plant, tail_offset
+from pvzuser.users import USERS_VERSION
+
+# the game keeps at most 200 potted plants (zen garden, mushroom garden, aquarium, wheelbarrow and storage)
+MAX_PLANTS = 200
+# every decoded tail field plus the zombatar data the editor leaves alone
+TAIL_SIZE = 0x80
+EPOCH_RANGE = (1_200_000_000, 1_700_000_000)
+
+RAW_RANGES = {
+  'level': (1, 50),
+  'money': (0, 99999),
+  'slots': (0, 4),
+  'x': (0, 800),
+  'y': (0, 600),
+}
+
+def _raw_value(field, rng):
+  if field.transform is FLAG or field.transform is NONZERO:
+    return rng.randint(0, 1)
+
+  name = field.path[-1]
+  if name.endswith('_date') or name.startswith('last_'):
+    return rng.choice((0, rng.randint(*EPOCH_RANGE)))
+  return rng.randint(*RAW_RANGES.get(name, (0, 100)))
+
+def _pack_fields(buffer, layout, base, rng):
+  for field in layout.fields:
+    field.struct.pack_into(buffer, base + field.offset, *(_raw_value(field, rng) for _ in range(field.count)))
+
+def make_plant(rng):
+  return {
+    'type': rng.randrange(len(PLANT_TYPE_NAMES)),
+    'location': rng.randrange(len(PLANT_LOCATION)),
+    'pos': (rng.randint(0, 7), rng.randint(0, 3)),
+    'dir': rng.randrange(len(PLANT_DIR)),
+    'last_watered': rng.randint(*EPOCH_RANGE),
+    'color': rng.randrange(len(PLANT_COLOR)),
+    'fertilized_amount': rng.randint(0, 3),
+    'watered_amount': rng.randint(0, 3),
+    'watered_need_amount': rng.randint(0, 3),
+    'happiness_need': rng.randint(0, 3),
+    'last_phono': rng.randint(*EPOCH_RANGE),
+    'last_fertilized': rng.randint(*EPOCH_RANGE),
+    'last_choco': rng.randint(*EPOCH_RANGE),
+  }
+
+def make_user(plants=0, seed=0):
+  if not 0 <= plants <= MAX_PLANTS:
+    raise ValueError(f"plant count must be between 0 and {MAX_PLANTS}")
+
+  rng = random.Random(seed)
+  buffer = bytearray(tail_offset(plants) + TAIL_SIZE)
+  _pack_fields(buffer, HEADER, 0, rng)
+  PLANT_COUNT.pack_into(buffer, PLANT_COUNT_OFFSET, plants)
+  for index in range(plants):
+    offset = PLANTS_OFFSET + index * PLANT_SIZE
+    buffer[offset:(offset + PLANT_SIZE)] = encode_plant(make_plant(rng))
+  _pack_fields(buffer, TAIL, tail_offset(plants), rng)
+  return bytes(buffer)
+
+def make_users_index(count, seed=0):
+  rng = random.Random(seed)
+  writer = FileBinaryWriter()
+  writer.write_uint32(USERS_VERSION)
+  writer.write_uint16(count)
+  for index in range(count):
+    writer.write_string(f"Player{index}" + ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(0, 6))))
+    writer.write_struct(USER_ENTRY, rng.randint(0, 10), index)
+  return writer.getvalue()
+
+def write_userdata(directory, users, plants=(0,), seed=0):
+  directory = pathlib.Path(directory)
+  directory.mkdir(parents=True, exist_ok=True)
+  directory.joinpath('users.dat').write_bytes(make_users_index(users, seed))
+  for index in range(users):
+    directory.joinpath(f"user{index}.dat").write_bytes(make_user(plants[index % len(plants)], seed + index))
+  return directory
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="Write a userdata folder of synthetic but valid users.dat and userN.dat files")
+  parser.add_argument('output')
+  parser.add_argument('--users', type=int, default=10)
+  parser.add_argument('--plants', default='0,1,32,200', help="comma separated plant counts, assigned to the users in turn")
+  parser.add_argument('--seed', type=int, default=0)
+  args = parser.parse_args(argv)
+
+  plants = tuple(int(count) for count in args.plants.split(','))
+  write_userdata(args.output, args.users, plants, args.seed)
+  print(f"wrote {args.users} user(s) to {args.output}")
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,73 @@
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# cumulative import time of main.py in milliseconds, measured before QApplication exists
+BUDGET_MS = 350
+# modules only the edit window or the user summaries need, they must not be imported at startup
+DEFERRED = (
+  'ui.ui_edit_window', 'numpy', 'pvzuser.plant_table', 'pvzuser.user_view', 'pvzuser.user_save',
+  'pvzuser.records', 'pvzuser.user_layout', 'pvzuser.user_summary',
+)
+
+def import_times(module, python=sys.executable):
+  result = subprocess.run([python, '-X', 'importtime', '-c', f"import {module}"], cwd=ROOT, capture_output=True, text=True, check=True)
+  times = {}
+  for line in result.stderr.splitlines():
+    if not line.startswith('import time:') or 'cumulative' in line:
+      continue
+
+    self_us, cumulative_us, name = line[len('import time:'):].split('|')
+    depth = (len(name) - len(name.lstrip())) // 2
+    times[name.strip()] = (int(self_us), int(cumulative_us), depth)
+  return times
+
+def measure(module, runs, python=sys.executable):
+  samples = [import_times(module, python) for _ in range(runs)]
+  names = set.intersection(*(set(sample) for sample in samples))
+  return {name: (statistics.median(sample[name][1] for sample in samples), samples[0][name][2]) for name in names}
+
+def main():
+  parser = argparse.ArgumentParser(description="Measure the cold import time of the editor with -X importtime")
+  parser.add_argument('--module', default='main')
+  parser.add_argument('--runs', type=int, default=5)
+  parser.add_argument('--budget-ms', type=float, default=BUDGET_MS)
+  parser.add_argument('--top', type=int, default=15)
+  parser.add_argument('--output', help="write the results as JSON to this file")
+  args = parser.parse_args()
+
+  times = measure(args.module, args.runs)
+  total_ms = times[args.module][0] / 1000
+  slowest = sorted(((name, cumulative) for name, (cumulative, depth) in times.items() if depth == 1), key=lambda item: item[1], reverse=True)
+  imported = [name for name in DEFERRED if name in times]
+
+  results = {
+    'module': args.module,
+    'python': sys.version.split()[0],
+    'runs': args.runs,
+    'total_ms': round(total_ms, 2),
+    'budget_ms': args.budget_ms,
+    'within_budget': total_ms <= args.budget_ms,
+    'deferred_imported': imported,
+    'slowest': [{ 'module': name, 'cumulative_ms': round(cumulative / 1000, 2) } for name, cumulative in slowest[:args.top]],
+  }
+
+  for entry in results['slowest']:
+    print(f"{entry['cumulative_ms']:10.2f} ms  {entry['module']}")
+  print(f"{total_ms:10.2f} ms  total for {args.module} (budget {args.budget_ms:g} ms)")
+  if imported:
+    print(f"imported too early: {', '.join(imported)}")
+
+  if args.output:
+    with open(args.output, 'w') as file:
+      json.dump(results, file, indent=2)
+
+  return 0 if results['within_budget'] and not imported else 1
+
+if __name__ == "__main__":
+  sys.exit(main())
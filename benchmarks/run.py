@@ -0,0 +1,183 @@
+import os
+import sys
+import copy
+import json
+import time
+import shutil
+import timeit
+import argparse
+import platform
+import tempfile
+import statistics
+
+from fixtures import MAX_PLANTS, make_user, make_users_index, write_userdata
+from pvzuser import FileBinaryReader, deep_equals, load_user, read_users_index, save_user
+
+PLANT_COUNTS = (0, 32, MAX_PLANTS)
+# timings of the dict based loader before the layout and lazy view rewrite (9b98500), the eager decode and
+# deep_equals must stay at or below them
+BUDGETS_US = {
+  'load_user[0]': 65,
+  f"load_user[{MAX_PLANTS}]": 960,
+  f"deep_equals[{MAX_PLANTS}]": 972,
+}
+
+def bench_load_user(filepath):
+  return lambda: load_user('bench', 0, filepath).to_dict()
+
+def bench_load_general(filepath):
+  return lambda: load_user('bench', 0, filepath).data.general.to_dict()
+
+def bench_read_strings(index_bytes):
+  def read():
+    reader = FileBinaryReader(index_bytes)
+    reader.read_uint32()
+    for _ in range(reader.read_uint16()):
+      reader.read_string()
+      reader.cursor += 8
+  return read
+
+def bench_users_index(directory):
+  return lambda: read_users_index(directory)
+
+def bench_deep_equals(filepath):
+  value0 = load_user('bench', 0, filepath).to_dict()
+  value1 = load_user('bench', 0, filepath).to_dict()
+  return lambda: deep_equals(value0, value1)
+
+def bench_deepcopy(filepath):
+  user = load_user('bench', 0, filepath)
+  user.to_dict()
+  return lambda: copy.deepcopy(user)
+
+def bench_snapshot(filepath):
+  user = load_user('bench', 0, filepath)
+  user.data.general.money = 12340
+  user.data.zen_garden.plants[0] = user.data.zen_garden.plants[-1]
+  return user.snapshot
+
+# saving rewrites the user, so every call gets a fresh copy of the file and a fresh edit
+def bench_save_field(filepath, workdir):
+  target = os.path.join(workdir, 'save_field.dat')
+  shutil.copyfile(filepath, target)
+  user = load_user('bench', 0, target)
+  user.data.general.money = 12340
+  return lambda: save_user(user, target)
+
+def bench_save_plants(filepath, workdir):
+  target = os.path.join(workdir, 'save_plants.dat')
+  shutil.copyfile(filepath, target)
+  user = load_user('bench', 0, target)
+  user.data.zen_garden.plants.duplicate(0)
+  return lambda: save_user(user, target)
+
+def benchmarks(workdir, users):
+  userdata = write_userdata(os.path.join(workdir, 'userdata'), 0)
+  index_bytes = make_users_index(users)
+  userdata.joinpath('users.dat').write_bytes(index_bytes)
+
+  files = {}
+  for plants in PLANT_COUNTS:
+    files[plants] = os.path.join(workdir, f"plants{plants}.dat")
+    with open(files[plants], 'wb') as file:
+      file.write(make_user(plants, plants))
+
+  # (name, prepare, number of calls per sample, None to calibrate)
+  cases = []
+  for plants, filepath in files.items():
+    cases.append((f"load_user[{plants}]", lambda filepath=filepath: bench_load_user(filepath), None))
+  cases += [
+    (f"load_user_general[{MAX_PLANTS}]", lambda: bench_load_general(files[MAX_PLANTS]), None),
+    (f"FileBinaryReader.read_string[{users}]", lambda: bench_read_strings(index_bytes), None),
+    (f"read_users_index[{users}]", lambda: bench_users_index(userdata), None),
+    (f"deep_equals[{MAX_PLANTS}]", lambda: bench_deep_equals(files[MAX_PLANTS]), None),
+    (f"deepcopy[{MAX_PLANTS}]", lambda: bench_deepcopy(files[MAX_PLANTS]), None),
+    (f"snapshot[{MAX_PLANTS}]", lambda: bench_snapshot(files[MAX_PLANTS]), None),
+    (f"save_user_field[{MAX_PLANTS}]", lambda: bench_save_field(files[MAX_PLANTS], workdir), 1),
+    (f"save_user_plants[{MAX_PLANTS}]", lambda: bench_save_plants(files[MAX_PLANTS], workdir), 1),
+  ]
+  return cases
+
+def measure(prepare, number, repeat):
+  fn = prepare()
+  if number is None:
+    number, _ = timeit.Timer(fn).autorange()
+
+  samples = []
+  for index in range(repeat):
+    if index and number == 1:
+      fn = prepare()
+    samples.append(timeit.Timer(fn).timeit(number) / number)
+
+  return {
+    'number': number,
+    'repeat': repeat,
+    'best_us': round(min(samples) * 1e6, 3),
+    'median_us': round(statistics.median(samples) * 1e6, 3),
+    'mean_us': round(statistics.fmean(samples) * 1e6, 3),
+  }
+
+def compare(results, baseline, max_slowdown):
+  previous = { entry['name']: entry for entry in baseline['results'] }
+  regressions = []
+  for entry in results:
+    before = previous.get(entry['name'])
+    if before is None:
+      continue
+
+    entry['baseline_us'] = before['best_us']
+    entry['ratio'] = round(entry['best_us'] / before['best_us'], 3) if before['best_us'] else None
+    if entry['ratio'] is not None and entry['ratio'] > max_slowdown:
+      regressions.append(entry['name'])
+  return regressions
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="Time the user file hot paths on synthetic fixtures")
+  parser.add_argument('--users', type=int, default=5000, help="profiles in the generated users.dat")
+  parser.add_argument('--repeat', type=int, default=7)
+  parser.add_argument('--filter', default='', help="only run benchmarks whose name contains this")
+  parser.add_argument('--output', help="write the results as JSON to this file")
+  parser.add_argument('--baseline', help="JSON from an earlier run to compare against")
+  parser.add_argument('--max-slowdown', type=float, default=1.25)
+  args = parser.parse_args(argv)
+
+  results = []
+  with tempfile.TemporaryDirectory() as workdir:
+    for name, prepare, number in benchmarks(workdir, args.users):
+      if args.filter not in name:
+        continue
+
+      entry = { 'name': name, **measure(prepare, number, args.repeat) }
+      results.append(entry)
+      print(f"{entry['best_us']:12.2f} us  {name}", flush=True)
+
+  over_budget = [entry['name'] for entry in results if entry['best_us'] > BUDGETS_US.get(entry['name'], float('inf'))]
+  for name in over_budget:
+    print(f"over budget: {name} takes more than {BUDGETS_US[name]:g} us")
+
+  regressions = []
+  if args.baseline:
+    with open(args.baseline) as file:
+      regressions = compare(results, json.load(file), args.max_slowdown)
+    for entry in results:
+      if 'ratio' in entry:
+        print(f"{entry['ratio']:8.3f}x  {entry['name']}")
+    if regressions:
+      print(f"slower than {args.max_slowdown:g}x the baseline: {', '.join(regressions)}")
+
+  if args.output:
+    with open(args.output, 'w') as file:
+      json.dump({
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+        'regressions': regressions,
+        'budgets_us': BUDGETS_US,
+        'over_budget': over_budget,
+      }, file, indent=2)
+
+  return 1 if regressions or over_budget else 0
+
+if __name__ == "__main__":
+  sys.exit(main())
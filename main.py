@@ -1,125 +1,248 @@
-import copy
 import sys
+import argparse
 import struct
+import importlib
 import pathlib
 from typing import Optional
 from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtCore import QItemSelection, Qt
 from PySide6.QtGui import QCloseEvent, QKeyEvent
 from PySide6.QtWidgets import QWidget
-import ui.ui_select_dialog
-import ui.ui_edit_window
 from utils import *
 from select_user_dialog import SelectUserDialog
+from workers import Worker, start
+import tracing
+from plant_model import PlantListModel
+from widget_bindings import BINDINGS, EPOCH, SECTION_BINDINGS, connect_bindings, load_bindings, store_bindings
+
+# section shown by each page of tabWidget, in tab order
+TAB_SECTIONS = ('general', 'zen_garden', 'achievements', 'challenges', 'limbo', 'zombatar')
+# generated form building the widgets of each page, in tab order
+TAB_FORMS = (
+  ('ui.ui_edit_window_general', 'Ui_GeneralTab'),
+  ('ui.ui_edit_window_zen_garden', 'Ui_ZenGardenTab'),
+  ('ui.ui_edit_window_achievements', 'Ui_AchievementsTab'),
+  ('ui.ui_edit_window_challenges', 'Ui_ChallengesTab'),
+  ('ui.ui_edit_window_limbo', 'Ui_LimboTab'),
+  ('ui.ui_edit_window_zombatars', 'Ui_ZombatarsTab'),
+)
+
+def read_user(user, progress=None, is_cancelled=None):
+  with tracing.span('load_user', user=user['name']):
+    data = load_user(user['name'], user['user_index'], user['filepath'], progress=progress, is_cancelled=is_cancelled)
+  if data is not None:
+    # decode the first tab off the GUI thread, the other sections are decoded when their tab is shown
+    with tracing.span('decode_section', section='general'):
+      data['data']['general'].to_dict()
+  return data
+
+class FirstPaintProbe(QtCore.QObject):
+  def __init__(self, widget, name) -> None:
+    super().__init__(widget)
+    self.name = name
+    widget.installEventFilter(self)
+
+  def eventFilter(self, watched, event):
+    if event.type() == QtCore.QEvent.Type.Paint:
+      watched.removeEventFilter(self)
+      tracing.instant(self.name)
+      self.deleteLater()
+    return False
 
 class MainWindow(QtWidgets.QMainWindow):
   def __init__(self, user) -> None:
     super().__init__()
     self.user = user
-    self.data = load_user(user['name'], user['user_index'], user['filepath'])
-    self.original_data = copy.deepcopy(self.data)
-    self.ui = ui.ui_edit_window.Ui_MainWindow()
-    self.ui.setupUi(self)
+    self.data = None
+    self.bound = {}
+    self.populated_tabs = set()
+    self.built_tabs = set()
+    self.loader = None
+    # the generated forms are only imported once a user has been picked, each tab is built the first time it is shown
+    with tracing.span('setupUi'):
+      import ui.ui_edit_window
+      self.ui = ui.ui_edit_window.Ui_MainWindow()
+      self.ui.setupUi(self)
     self.setWindowTitle("User File Editor")
     self.ui.tabWidget.setTabEnabled(4, False)
     self.ui.tabWidget.setTabVisible(4, False)
 
-    self.uiAchievements = [
-      self.ui.a_1,
-      self.ui.a_2,
-      self.ui.a_3,
-      self.ui.a_4,
-      self.ui.a_5,
-      self.ui.a_6,
-      self.ui.a_7,
-      self.ui.a_8,
-      self.ui.a_9,
-      self.ui.a_10,
-      self.ui.a_11,
-      self.ui.a_12,
-      self.ui.a_13,
-      self.ui.a_14,
-      self.ui.a_15,
-      self.ui.a_16,
-      self.ui.a_17,
-      self.ui.a_18,
-      self.ui.a_19,
-      self.ui.a_20
-    ]
-
-    self.ui.zg_plant_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+    self.plant_model = PlantListModel(self)
+
+    self.load_progress = QtWidgets.QProgressBar()
+    self.load_progress.setMaximumWidth(160)
+    self.load_progress.setTextVisible(False)
+    self.load_cancel = QtWidgets.QPushButton("Cancel")
+    self.load_cancel.clicked.connect(self.__cancel_loading)
+    self.statusBar().addPermanentWidget(self.load_progress)
+    self.statusBar().addPermanentWidget(self.load_cancel)
+    self.load_progress.hide()
+    self.load_cancel.hide()
+
     self.__setup_callbacks()
+    self.__build_tab(self.ui.tabWidget.currentIndex())
+    self.__start_loading()
+
+  def __set_busy(self, busy: bool):
+    self.ui.tabWidget.setEnabled(not busy)
+    self.ui.save.setEnabled(not busy)
+    self.ui.reload.setEnabled(not busy)
+    self.load_progress.setVisible(busy)
+    self.load_cancel.setVisible(busy)
+    if busy:
+      self.load_progress.setRange(0, 0)
+      self.statusBar().showMessage("Loading user file...")
+
+  def __start_loading(self):
+    self.__set_busy(True)
+    self.loader = Worker(read_user, self.user)
+    self.loader.signals.progress.connect(self.__loading_progress)
+    self.loader.signals.finished.connect(self.__loading_finished)
+    self.loader.signals.failed.connect(self.__loading_failed)
+    start(self.loader)
+
+  def __loading_progress(self, done: int, total: int):
+    self.load_progress.setRange(0, total)
+    self.load_progress.setValue(done)
+
+  def __loading_finished(self, data):
+    self.loader = None
+    if data is None:
+      self.__loading_cancelled()
+      return
+
+    if self.data is not None:
+      self.data.close()
+    self.data = data
+    self.__set_busy(False)
     self.__load_data()
+    self.__update_modified_indicator()
+
+  def __loading_failed(self, error):
+    self.loader = None
+    QtWidgets.QMessageBox.critical(self, "Failed to load user file", f"Could not read {self.user['filepath']}:\n{error}")
+    self.__loading_cancelled()
+
+  def __cancel_loading(self):
+    if self.loader is not None:
+      self.loader.cancel()
+      self.loader = None
+    self.__loading_cancelled()
+
+  def __loading_cancelled(self):
+    if self.data is None:
+      self.close()
+      return
+
+    self.__set_busy(False)
+    self.__update_modified_indicator()
 
   def __setup_callbacks(self):
-    self.ui.a_all.clicked.connect(lambda : self.__change_achievements_selection(0))
-    self.ui.a_invert.clicked.connect(lambda : self.__change_achievements_selection(1))
-    self.ui.a_none.clicked.connect(lambda : self.__change_achievements_selection(2))
-
-    self.ui.zg_mg1_never.stateChanged.connect(lambda state : self.ui.zg_mg1_date.setEnabled(state == 0))
-    self.ui.zg_mg2_never.stateChanged.connect(lambda state : self.ui.zg_mg2_date.setEnabled(state == 0))
-    self.ui.zg_mg3_never.stateChanged.connect(lambda state : self.ui.zg_mg3_date.setEnabled(state == 0))
-    
-    self.ui.zg_fertilizer_np.stateChanged.connect(lambda state : self.ui.zg_fertilizer.setEnabled(state == 0))
-    self.ui.zg_bugspray_np.stateChanged.connect(lambda state : self.ui.zg_bugspray.setEnabled(state == 0))
-    
-    self.ui.zg_snail_lchoco_never.stateChanged.connect(lambda state : self.ui.zg_snail_lchoco.setEnabled(state == 0))
-    self.ui.zg_snail_purchased.stateChanged.connect(lambda state : self.__update_snail_widgets(state == 2))
-    self.ui.zg_food_purchased.stateChanged.connect(lambda state : self.ui.zg_tree_food.setEnabled(state == 2))
-
-    self.ui.g_money.editingFinished.connect(lambda : self.ui.g_money.setValue(int(self.ui.g_money.value() / 10) * 10) if self.ui.g_money.value() % 10 != 0 else None)
+    self.ui.tabWidget.currentChanged.connect(self.__populate_tab)
 
     self.ui.save.clicked.connect(self.__save_btn)
     self.ui.reload.clicked.connect(self.__reload_btn)
 
-    self.ui.zg_plant_list.itemSelectionChanged.connect(self.__plant_list_selection_changed)
-    self.ui.zg_del_plant.clicked.connect(self.__plant_delete)
-    self.ui.zg_dup_plant.clicked.connect(self.__plant_duplicate)
+  def __build_tab(self, index: int):
+    if index in self.built_tabs:
+      return
+
+    with tracing.span('build_tab', section=TAB_SECTIONS[index]):
+      module, form = TAB_FORMS[index]
+      tab_ui = getattr(importlib.import_module(module), form)()
+      tab_ui.setupUi(self.ui.tabWidget.widget(index))
+      # widget names are unique across the tabs, so self.ui keeps exposing every widget by name
+      vars(self.ui).update(vars(tab_ui))
+      self.built_tabs.add(index)
+      self.__setup_tab_callbacks(TAB_SECTIONS[index])
+      connect_bindings(self.ui, SECTION_BINDINGS.get(TAB_SECTIONS[index], ()), self.__binding_changed)
+
+  def __setup_tab_callbacks(self, section: str):
+    if section == 'general':
+      self.ui.g_money.editingFinished.connect(lambda : self.ui.g_money.setValue(int(self.ui.g_money.value() / 10) * 10) if self.ui.g_money.value() % 10 != 0 else None)
+
+    if section == 'zen_garden':
+      # the dates are stored as days since 2000-01-01 in an unsigned field
+      for date_edit in (self.ui.zg_mg1_date, self.ui.zg_mg2_date, self.ui.zg_mg3_date):
+        date_edit.setMinimumDate(EPOCH)
+
+      self.ui.zg_mg1_never.stateChanged.connect(lambda state : self.ui.zg_mg1_date.setEnabled(state == 0))
+      self.ui.zg_mg2_never.stateChanged.connect(lambda state : self.ui.zg_mg2_date.setEnabled(state == 0))
+      self.ui.zg_mg3_never.stateChanged.connect(lambda state : self.ui.zg_mg3_date.setEnabled(state == 0))
+
+      self.ui.zg_fertilizer_np.stateChanged.connect(lambda state : self.ui.zg_fertilizer.setEnabled(state == 0))
+      self.ui.zg_bugspray_np.stateChanged.connect(lambda state : self.ui.zg_bugspray.setEnabled(state == 0))
+
+      self.ui.zg_snail_lchoco_never.stateChanged.connect(lambda state : self.ui.zg_snail_lchoco.setEnabled(state == 0))
+      self.ui.zg_snail_purchased.stateChanged.connect(lambda state : self.__update_snail_widgets(state == 2))
+      self.ui.zg_food_purchased.stateChanged.connect(lambda state : self.ui.zg_tree_food.setEnabled(state == 2))
+
+      self.ui.zg_plant_list.setModel(self.plant_model)
+      self.ui.zg_plant_list.setUniformItemSizes(True)
+      self.ui.zg_plant_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+      self.ui.zg_plant_list.selectionModel().selectionChanged.connect(self.__plant_list_selection_changed)
+      self.plant_model.rowsInserted.connect(self.__update_plant_list)
+      self.plant_model.rowsRemoved.connect(self.__update_plant_list)
+      self.plant_model.modelReset.connect(self.__update_plant_list)
+      self.ui.zg_del_plant.clicked.connect(self.__plant_delete)
+      self.ui.zg_dup_plant.clicked.connect(self.__plant_duplicate)
+
+    if section == 'achievements':
+      self.uiAchievements = [
+        self.ui.a_1,
+        self.ui.a_2,
+        self.ui.a_3,
+        self.ui.a_4,
+        self.ui.a_5,
+        self.ui.a_6,
+        self.ui.a_7,
+        self.ui.a_8,
+        self.ui.a_9,
+        self.ui.a_10,
+        self.ui.a_11,
+        self.ui.a_12,
+        self.ui.a_13,
+        self.ui.a_14,
+        self.ui.a_15,
+        self.ui.a_16,
+        self.ui.a_17,
+        self.ui.a_18,
+        self.ui.a_19,
+        self.ui.a_20
+      ]
+
+      self.ui.a_all.clicked.connect(lambda : self.__change_achievements_selection(0))
+      self.ui.a_invert.clicked.connect(lambda : self.__change_achievements_selection(1))
+      self.ui.a_none.clicked.connect(lambda : self.__change_achievements_selection(2))
 
   def __plant_duplicate(self):
-    index = self.ui.zg_plant_list.selectedIndexes()[0].row()
-    plant = copy.deepcopy(self.data['data']['zen_garden']['plants'][index])
-    color = get_plant_color_name(plant['color']) 
-    dup_index = index + 1
-
-    self.data['data']['zen_garden']['plants'].insert(dup_index, plant)
-    self.ui.zg_plants_label.setText(f"Plants ({len(self.data['data']['zen_garden']['plants'])})")
-    self.ui.zg_plant_list.insertItem(dup_index,
-                                     f"{get_plant_type_name(plant['type'])}{"" if color == 'None' else f' ({color})'}, {PLANT_DIR[plant['dir']]} [{plant['pos'][0]}, {plant['pos'][1]}] {PLANT_LOCATION[plant['location']]}")
+    index = self.ui.zg_plant_list.selectionModel().selectedRows()[0].row()
+    dup_index = self.plant_model.duplicate(index)
 
-    self.__update_plant_list()
-    self.ui.zg_plant_list.setCurrentItem(self.ui.zg_plant_list.item(dup_index))
+    self.ui.zg_plant_list.setCurrentIndex(self.plant_model.index(dup_index))
 
   def __update_plant_list(self):
-    self.ui.zg_plant_list.clear()
-    self.ui.zg_plants_label.setText(f"Plants ({len(self.data['data']['zen_garden']['plants'])})")
-    for i in range(len(self.data['data']['zen_garden']['plants'])):
-      plant = self.data['data']['zen_garden']['plants'][i]
-      color = get_plant_color_name(plant['color'])
-      self.ui.zg_plant_list.addItem(f"{get_plant_type_name(plant['type'])}{"" if color == 'None' else f' ({color})'}, {PLANT_DIR[plant['dir']]} [{plant['pos'][0]}, {plant['pos'][1]}] {PLANT_LOCATION[plant['location']]}")
+    with tracing.span('update_plant_list'):
+      self.__update_modified_indicator()
+      self.ui.zg_plants_label.setText(f"Plants ({self.plant_model.rowCount()})")
 
   def __plant_delete(self):
     indices = []
-    for m in self.ui.zg_plant_list.selectedIndexes():
+    for m in self.ui.zg_plant_list.selectionModel().selectedRows():
       indices.append(m.row())
 
-    indices.sort(reverse=True)
-
-    for index in indices:
-      self.data['data']['zen_garden']['plants'].pop(index)
-
-    self.__update_plant_list()
+    self.plant_model.delete(indices)
 
   def __plant_list_selection_changed(self):
-    sel_items = self.ui.zg_plant_list.selectedItems()
+    sel_rows = self.ui.zg_plant_list.selectionModel().selectedRows()
 
-    self.ui.zg_del_plant.setEnabled(len(sel_items) >= 1)
-    self.ui.zg_dup_plant.setEnabled(len(sel_items) == 1)
+    self.ui.zg_del_plant.setEnabled(len(sel_rows) >= 1)
+    self.ui.zg_dup_plant.setEnabled(len(sel_rows) == 1)
 
-    self.ui.groupBox_11.setEnabled(len(sel_items) == 1)
+    self.ui.groupBox_11.setEnabled(len(sel_rows) == 1)
 
-    if len(sel_items) == 1:
-      plant = self.data['data']['zen_garden']['plants'][self.ui.zg_plant_list.selectedIndexes()[0].row()]
+    if len(sel_rows) == 1:
+      plant = self.data['data']['zen_garden']['plants'][sel_rows[0].row()]
       self.ui.zg_plant_type.setCurrentIndex(plant['type'])
       self.ui.zg_plant_loc.setCurrentIndex(plant['location'])
       self.ui.zg_plant_hn.setCurrentIndex(plant['happiness_need'])
@@ -143,9 +266,30 @@ class MainWindow(QtWidgets.QMainWindow):
       if action == 2:
         checkbox.setChecked(False)
 
+  # widgets write their field as soon as they change, so the indicator follows every edit
+  def __binding_changed(self, binding):
+    if self.data is None or binding[0] not in self.bound:
+      return
+
+    store_bindings(self.ui, self.data['data'], self.bound, (binding,))
+    self.__update_modified_indicator()
+
+  def __update_modified_indicator(self):
+    changed = self.data.changed_paths()
+    self.setWindowTitle(f"User File Editor{' *' if len(changed) > 0 else ''}")
+    self.statusBar().showMessage(f"{len(changed)} modified field(s)" if len(changed) > 0 else "")
+
   def closeEvent(self, event: QCloseEvent):
+    if self.loader is not None:
+      self.loader.cancel()
+      self.loader = None
+
+    if self.data is None:
+      return super().closeEvent(event)
+
     self.__update_data()
-    if not deep_equals(self.original_data, self.data):
+    self.__update_modified_indicator()
+    if self.data.has_changes:
       event.ignore()
       message_box = QtWidgets.QMessageBox(QtWidgets.QMessageBox.Icon.Warning, "Unsaved changes", "You have made changes but not saved them to the user file.\nAre you sure you want to quit without saving?")
       message_box.setStandardButtons(QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No)
@@ -156,12 +300,20 @@ class MainWindow(QtWidgets.QMainWindow):
     return super().closeEvent(event)
 
   def __save_btn(self):
-    pass
+    self.__update_data()
+    try:
+      with tracing.span('save_user'):
+        save_user(self.data, self.user['filepath'])
+    except (OSError, struct.error, ValueError) as error:
+      QtWidgets.QMessageBox.critical(self, "Failed to save user file", f"Could not write {self.user['filepath']}:\n{error}")
+    else:
+      # fields sharing bytes with a saved field were refreshed from the file, their widgets follow
+      from pvzuser.user_layout import ALIASES
+      self.bound.update(load_bindings(self.ui, self.data['data'], [binding for binding in BINDINGS if binding[0] in ALIASES and binding[0] in self.bound]))
+    self.__update_modified_indicator()
 
   def __reload_btn(self):
-    self.data = load_user(self.user['name'], self.user['user_index'], self.user['filepath'])
-    self.original_data = copy.deepcopy(self.data)
-    self.__load_data()
+    self.__start_loading()
 
   def keyPressEvent(self, event: QKeyEvent) -> None:
     super().keyPressEvent(event)
@@ -169,200 +321,71 @@ class MainWindow(QtWidgets.QMainWindow):
       self.ui.tabWidget.setTabEnabled(4, True)
       self.ui.tabWidget.setTabVisible(4, True)
 
+  @tracing.traced('store_bindings')
   def __update_data(self):
-    self.data['data']['general']['has_taco'] = self.ui.g_taco.isChecked()
-
+    store_bindings(self.ui, self.data['data'], self.bound)
+
+  def __update_dependent_widgets(self):
+    self.ui.zg_mg1_date.setEnabled(not self.ui.zg_mg1_never.isChecked())
+    self.ui.zg_mg2_date.setEnabled(not self.ui.zg_mg2_never.isChecked())
+    self.ui.zg_mg3_date.setEnabled(not self.ui.zg_mg3_never.isChecked())
+    self.ui.zg_fertilizer.setEnabled(not self.ui.zg_fertilizer_np.isChecked())
+    self.ui.zg_bugspray.setEnabled(not self.ui.zg_bugspray_np.isChecked())
+    self.ui.zg_snail_lchoco.setEnabled(not self.ui.zg_snail_lchoco_never.isChecked())
+    self.__update_snail_widgets(self.ui.zg_snail_purchased.isChecked())
+    self.ui.zg_tree_food.setEnabled(self.ui.zg_food_purchased.isChecked())
+
+  def __populate_tab(self, index: int):
+    section = TAB_SECTIONS[index]
+    self.setUpdatesEnabled(False)
+    try:
+      self.__build_tab(index)
+      if self.data is not None and index not in self.populated_tabs:
+        with tracing.span('populate_tab', section=section):
+          self.bound.update(load_bindings(self.ui, self.data['data'], SECTION_BINDINGS.get(section, ())))
+          if section == 'zen_garden':
+            self.plant_model.set_plants(self.data['data']['zen_garden']['plants'])
+            self.__update_dependent_widgets()
+          self.populated_tabs.add(index)
+    finally:
+      self.setUpdatesEnabled(True)
+
+  @tracing.traced('load_data')
   def __load_data(self):
-    self.ui.g_name.setText(self.data['data']['general']['name'])
-    level = self.data['data']['general']['level']
-    self.ui.g_level.setCurrentIndex(((level % 10) - 1) + (int(level / 11) * 10))
-    self.ui.g_completed.setValue(self.data['data']['general']['completed'])
-    self.ui.g_money.setValue(self.data['data']['general']['money'])
-    self.ui.g_minigames_unlocked.setChecked(self.data['data']['general']['minigames_unlocked'])
-    self.ui.g_puzzle_unlocked.setChecked(self.data['data']['general']['puzzles_unlocked'])
-    self.ui.g_taco.setChecked(self.data['data']['general']['has_taco'])
-    self.ui.g_slots.setValue(self.data['data']['general']['shop']['slots'])
-    self.ui.g_pool_cleaner.setChecked(self.data['data']['general']['shop']['pool_cleaner'])
-    self.ui.g_roof_cleaner.setChecked(self.data['data']['general']['shop']['roof_cleaner'])
-    self.ui.g_rake_uses.setValue(self.data['data']['general']['shop']['rake_uses'])
-
-    self.ui.g_plants_1.setChecked(self.data['data']['general']['shop']['plants']['gatling_pea'])
-    self.ui.g_plants_2.setChecked(self.data['data']['general']['shop']['plants']['twin_sunflower'])
-    self.ui.g_plants_3.setChecked(self.data['data']['general']['shop']['plants']['gatling_pea'])
-    self.ui.g_plants_4.setChecked(self.data['data']['general']['shop']['plants']['gloom_shroom'])
-    self.ui.g_plants_5.setChecked(self.data['data']['general']['shop']['plants']['cattail'])
-    self.ui.g_plants_6.setChecked(self.data['data']['general']['shop']['plants']['winter_melon'])
-    self.ui.g_plants_7.setChecked(self.data['data']['general']['shop']['plants']['gold_magnet'])
-    self.ui.g_plants_8.setChecked(self.data['data']['general']['shop']['plants']['spikerock'])
-    self.ui.g_plants_9.setChecked(self.data['data']['general']['shop']['plants']['cob_cannon'])
-    self.ui.g_plants_10.setChecked(self.data['data']['general']['shop']['plants']['imitater'])
-
-    self.ui.zg_golden_can.setChecked(self.data['data']['zen_garden']['golden_can'])
-    self.ui.zg_phonograph.setChecked(self.data['data']['zen_garden']['phonograph'])
-    self.ui.zg_glove.setChecked(self.data['data']['zen_garden']['glove'])
-    self.ui.zg_aquarium_g.setChecked(self.data['data']['zen_garden']['aquarium_garden'])
-    self.ui.zg_mushroom_g.setChecked(self.data['data']['zen_garden']['mushroom_garden'])
-    self.ui.zg_wheelbarrow.setChecked(self.data['data']['zen_garden']['wheel_barrow'])
-
-    self.ui.zg_mg1_date.setDate(QtCore.QDate(2000, 1, 1).addDays(self.data['data']['zen_garden']['marigold1_date']));
-    self.ui.zg_mg2_date.setDate(QtCore.QDate(2000, 1, 1).addDays(self.data['data']['zen_garden']['marigold2_date']));
-    self.ui.zg_mg3_date.setDate(QtCore.QDate(2000, 1, 1).addDays(self.data['data']['zen_garden']['marigold3_date']));
-
-    if self.data['data']['zen_garden']['marigold1_date'] == 0:
-      self.ui.zg_mg1_date.setEnabled(False)
-      self.ui.zg_mg1_never.setChecked(True)
-    else:
-      self.ui.zg_mg1_date.setEnabled(True)
-      self.ui.zg_mg1_never.setChecked(False)
-
-    if self.data['data']['zen_garden']['marigold2_date'] == 0:
-      self.ui.zg_mg2_date.setEnabled(False)
-      self.ui.zg_mg2_never.setChecked(True)
-    else:
-      self.ui.zg_mg2_date.setEnabled(True)
-      self.ui.zg_mg2_never.setChecked(False)
-
-    if self.data['data']['zen_garden']['marigold3_date'] == 0:
-      self.ui.zg_mg3_date.setEnabled(False)
-      self.ui.zg_mg3_never.setChecked(True)
-    else:
-      self.ui.zg_mg3_date.setEnabled(True)
-      self.ui.zg_mg3_never.setChecked(False)
-
-    if self.data['data']['zen_garden']['fertilizer'] == 0:
-      self.ui.zg_fertilizer.setValue(0)
-      self.ui.zg_fertilizer_np.setChecked(True)
-    else:
-      self.ui.zg_fertilizer.setValue(self.data['data']['zen_garden']['fertilizer'] - 1000)
-      self.ui.zg_fertilizer_np.setChecked(False)
-
-    if self.data['data']['zen_garden']['bug_spray'] == 0:
-      self.ui.zg_bugspray.setValue(0)
-      self.ui.zg_bugspray_np.setChecked(True)
-    else:
-      self.ui.zg_bugspray.setValue(self.data['data']['zen_garden']['bug_spray'] - 1000)
-      self.ui.zg_bugspray_np.setChecked(False)
-
-    self.ui.zg_snail_purchased.setChecked(self.data['data']['zen_garden']['snail']['last_awoken'] != 0)
-
-    self.ui.zg_snail_x.setValue(self.data['data']['zen_garden']['snail']['x'])
-    self.ui.zg_snail_y.setValue(self.data['data']['zen_garden']['snail']['y'])
-
-    self.ui.zg_plant_list.clear()
-    self.ui.zg_plants_label.setText(f"Plants ({len(self.data['data']['zen_garden']['plants'])})")
-    for i in range(len(self.data['data']['zen_garden']['plants'])):
-      plant = self.data['data']['zen_garden']['plants'][i]
-      color = get_plant_color_name(plant['color'])
-      self.ui.zg_plant_list.addItem(f"{get_plant_type_name(plant['type'])}{"" if color == 'None' else f' ({color})'}, {PLANT_DIR[plant['dir']]} [{plant['pos'][0]}, {plant['pos'][1]}] {PLANT_LOCATION[plant['location']]}")
-
-    self.ui.a_1.setChecked(self.data['data']['achievements']['home_lawn_security'])
-    self.ui.a_2.setChecked(self.data['data']['achievements']['nobel_peas_prize'])
-    self.ui.a_3.setChecked(self.data['data']['achievements']['better_off_dead'])
-    self.ui.a_4.setChecked(self.data['data']['achievements']['china_shop'])
-    self.ui.a_5.setChecked(self.data['data']['achievements']['spudow!'])
-    self.ui.a_6.setChecked(self.data['data']['achievements']['explodonator'])
-    self.ui.a_7.setChecked(self.data['data']['achievements']['morticulturalist'])
-    self.ui.a_8.setChecked(self.data['data']['achievements']['dont_pea_in_the_pool'])
-    self.ui.a_9.setChecked(self.data['data']['achievements']['roll_some_heads'])
-    self.ui.a_10.setChecked(self.data['data']['achievements']['grounded'])
-    self.ui.a_11.setChecked(self.data['data']['achievements']['zombologist'])
-    self.ui.a_12.setChecked(self.data['data']['achievements']['penny_pitcher'])
-    self.ui.a_13.setChecked(self.data['data']['achievements']['sunny_days'])
-    self.ui.a_14.setChecked(self.data['data']['achievements']['popcorn_party'])
-    self.ui.a_15.setChecked(self.data['data']['achievements']['good_morning'])
-    self.ui.a_16.setChecked(self.data['data']['achievements']['no_fungus_among_us'])
-    self.ui.a_17.setChecked(self.data['data']['achievements']['beyond_the_grave'])
-    self.ui.a_18.setChecked(self.data['data']['achievements']['immortal'])
-    self.ui.a_19.setChecked(self.data['data']['achievements']['towering_wisdom'])
-    self.ui.a_20.setChecked(self.data['data']['achievements']['mustache_mode'])
-
-    self.ui.c_surv_1.setValue(self.data['data']['challenges']['survivals']['normal']['day'])
-    self.ui.c_surv_2.setValue(self.data['data']['challenges']['survivals']['normal']['night'])
-    self.ui.c_surv_3.setValue(self.data['data']['challenges']['survivals']['normal']['pool'])
-    self.ui.c_surv_4.setValue(self.data['data']['challenges']['survivals']['normal']['fog'])
-    self.ui.c_surv_5.setValue(self.data['data']['challenges']['survivals']['normal']['roof'])
-    self.ui.c_survhard_1.setValue(self.data['data']['challenges']['survivals']['hard']['day'])
-    self.ui.c_survhard_2.setValue(self.data['data']['challenges']['survivals']['hard']['night'])
-    self.ui.c_survhard_3.setValue(self.data['data']['challenges']['survivals']['hard']['pool'])
-    self.ui.c_survhard_4.setValue(self.data['data']['challenges']['survivals']['hard']['fog'])
-    self.ui.c_survhard_5.setValue(self.data['data']['challenges']['survivals']['hard']['roof'])
-    self.ui.c_survend.setValue(self.data['data']['challenges']['survivals']['endless'])
-
-    self.ui.c_mg_1.setChecked(self.data['data']['challenges']['minigames']['zombotany'])
-    self.ui.c_mg_2.setChecked(self.data['data']['challenges']['minigames']['wallnut_bowling'])
-    self.ui.c_mg_3.setChecked(self.data['data']['challenges']['minigames']['slot_machine'])
-    self.ui.c_mg_4.setChecked(self.data['data']['challenges']['minigames']['its_raining_seeds'])
-    self.ui.c_mg_5.setChecked(self.data['data']['challenges']['minigames']['beghouled'])
-    self.ui.c_mg_6.setChecked(self.data['data']['challenges']['minigames']['invisighoul'])
-    self.ui.c_mg_7.setChecked(self.data['data']['challenges']['minigames']['seeing_stars'])
-    self.ui.c_mg_8.setChecked(self.data['data']['challenges']['minigames']['zombiquarium'])
-    self.ui.c_mg_9.setChecked(self.data['data']['challenges']['minigames']['beghouled_twist'])
-    self.ui.c_mg_10.setChecked(self.data['data']['challenges']['minigames']['big_trouble_little_zombie'])
-    self.ui.c_mg_11.setChecked(self.data['data']['challenges']['minigames']['portal_combat'])
-    self.ui.c_mg_12.setChecked(self.data['data']['challenges']['minigames']['column_like_you_see_em'])
-    self.ui.c_mg_13.setChecked(self.data['data']['challenges']['minigames']['bobsled_bonanza'])
-    self.ui.c_mg_14.setChecked(self.data['data']['challenges']['minigames']['zombie_n_zombie_q'])
-    self.ui.c_mg_15.setChecked(self.data['data']['challenges']['minigames']['whack_a_zombie'])
-    self.ui.c_mg_16.setChecked(self.data['data']['challenges']['minigames']['last_stand'])
-    self.ui.c_mg_17.setChecked(self.data['data']['challenges']['minigames']['zombotany2'])
-    self.ui.c_mg_18.setChecked(self.data['data']['challenges']['minigames']['wallnut_bowling2'])
-    self.ui.c_mg_19.setChecked(self.data['data']['challenges']['minigames']['pogo_party'])
-    self.ui.c_mg_20.setChecked(self.data['data']['challenges']['minigames']['dr_zomboss_revenge'])
-
-    self.ui.c_pz_1.setChecked(self.data['data']['challenges']['puzzles']['vasebreaker'])
-    self.ui.c_pz_2.setChecked(self.data['data']['challenges']['puzzles']['to_the_left'])
-    self.ui.c_pz_3.setChecked(self.data['data']['challenges']['puzzles']['third_vase'])
-    self.ui.c_pz_4.setChecked(self.data['data']['challenges']['puzzles']['chain_reaction'])
-    self.ui.c_pz_5.setChecked(self.data['data']['challenges']['puzzles']['m_is_for_metal'])
-    self.ui.c_pz_6.setChecked(self.data['data']['challenges']['puzzles']['scary_potter'])
-    self.ui.c_pz_7.setChecked(self.data['data']['challenges']['puzzles']['hokey_pokey'])
-    self.ui.c_pz_8.setChecked(self.data['data']['challenges']['puzzles']['another_chain_reaction'])
-    self.ui.c_pz_9.setChecked(self.data['data']['challenges']['puzzles']['ace_of_vases'])
-    self.ui.c_pz_10.setValue(self.data['data']['challenges']['puzzles']['vasebreaker_endless'])
-    self.ui.c_pz_11.setChecked(self.data['data']['challenges']['puzzles']['izombie'])
-    self.ui.c_pz_12.setChecked(self.data['data']['challenges']['puzzles']['izombie_too'])
-    self.ui.c_pz_13.setChecked(self.data['data']['challenges']['puzzles']['can_you_dig_it'])
-    self.ui.c_pz_14.setChecked(self.data['data']['challenges']['puzzles']['totally_nuts'])
-    self.ui.c_pz_15.setChecked(self.data['data']['challenges']['puzzles']['dead_zeppelin'])
-    self.ui.c_pz_16.setChecked(self.data['data']['challenges']['puzzles']['me_smash'])
-    self.ui.c_pz_17.setChecked(self.data['data']['challenges']['puzzles']['zomboggie'])
-    self.ui.c_pz_18.setChecked(self.data['data']['challenges']['puzzles']['tree_hit_wonder'])
-    self.ui.c_pz_19.setChecked(self.data['data']['challenges']['puzzles']['all_your_brainz'])
-    self.ui.c_pz_20.setValue(self.data['data']['challenges']['puzzles']['izombie_endless'])
-    
-    self.ui.l_survend_1.setValue(self.data['data']['limbo']['survival_endless']['day'])
-    self.ui.l_survend_2.setValue(self.data['data']['limbo']['survival_endless']['night'])
-    self.ui.l_survend_3.setValue(self.data['data']['limbo']['survival_endless']['fog'])
-    self.ui.l_survend_4.setValue(self.data['data']['limbo']['survival_endless']['roof'])
-
-    self.ui.l_mg_1.setChecked(self.data['data']['limbo']['minigames']['art_wallnut'])
-    self.ui.l_mg_2.setChecked(self.data['data']['limbo']['minigames']['sunny_day'])
-    self.ui.l_mg_3.setChecked(self.data['data']['limbo']['minigames']['unsodded'])
-    self.ui.l_mg_4.setChecked(self.data['data']['limbo']['minigames']['buy_time'])
-    self.ui.l_mg_5.setChecked(self.data['data']['limbo']['minigames']['art_sunflower'])
-    self.ui.l_mg_6.setChecked(self.data['data']['limbo']['minigames']['air_raid'])
-    self.ui.l_mg_7.setChecked(self.data['data']['limbo']['minigames']['ice_level'])
-    self.ui.l_mg_8.setChecked(self.data['data']['limbo']['minigames']['zen_garden'])
-    self.ui.l_mg_9.setChecked(self.data['data']['limbo']['minigames']['high_gravity'])
-    self.ui.l_mg_10.setChecked(self.data['data']['limbo']['minigames']['grave_danger'])
-    self.ui.l_mg_11.setChecked(self.data['data']['limbo']['minigames']['can_you_dig_it'])
-    self.ui.l_mg_12.setChecked(self.data['data']['limbo']['minigames']['dark_night'])
-    self.ui.l_mg_13.setChecked(self.data['data']['limbo']['minigames']['bungee_blitz'])
-    self.ui.l_mg_14.setChecked(self.data['data']['limbo']['minigames']['intro'])
-    self.ui.l_mg_15.setChecked(self.data['data']['limbo']['minigames']['tree'])
-    self.ui.l_mg_16.setChecked(self.data['data']['limbo']['minigames']['upsell'])
-
-    self.ui.z_license.setChecked(self.data['data']['zombatar']['license'])
-    self.ui.z_created_before.setChecked(self.data['data']['zombatar']['created_before'])
+    # every tab is stale now, only the visible one is filled straight away
+    self.bound = {}
+    self.populated_tabs.clear()
+    self.plant_model.set_plants(None)
+    self.__populate_tab(self.ui.tabWidget.currentIndex())
+    if tracing.is_enabled():
+      FirstPaintProbe(self.ui.tabWidget.currentWidget(), 'first_paint')
+
+def load_icon(filepath, size=32):
+  reader = QtGui.QImageReader(filepath)
+  # icon.ico holds every size up to 256x256, only decode the smallest one that is big enough
+  for index in range(reader.imageCount()):
+    if reader.jumpToImage(index) and reader.size().width() >= size:
+      break
+  reader.setScaledSize(QtCore.QSize(size, size))
+  return QtGui.QIcon(QtGui.QPixmap.fromImage(reader.read()))
 
 def main():
-  app = QtWidgets.QApplication(sys.argv)
-  app.setWindowIcon(QtGui.QIcon("icon.ico"))
+  parser = argparse.ArgumentParser(description="Edit Plants vs. Zombies user files")
+  parser.add_argument('--trace', metavar='PATH', help=f"write a Chrome trace of the load phases to PATH, also enabled by {tracing.TRACE_ENV}")
+  args, qt_args = parser.parse_known_args()
+  if args.trace:
+    tracing.enable(args.trace)
+  else:
+    tracing.enable_from_env()
+
+  app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+  app.setWindowIcon(load_icon("icon.ico"))
 
   dialog = SelectUserDialog()
   if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
-    win = MainWindow(dialog.user)
-    win.show()
+    with tracing.span('open_window'):
+      win = MainWindow(dialog.user)
+      win.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+from PySide6 import QtCore
+from PySide6.QtCore import Qt
+from utils import plant_label
+import tracing
+
+class PlantListModel(QtCore.QAbstractListModel):
+  def __init__(self, parent=None) -> None:
+    super().__init__(parent)
+    self.plants = None
+
+  @tracing.traced('plant_list.reset')
+  def set_plants(self, plants):
+    self.beginResetModel()
+    self.plants = plants
+    self.endResetModel()
+
+  def rowCount(self, parent=QtCore.QModelIndex()):
+    if parent.isValid() or self.plants is None:
+      return 0
+    return len(self.plants)
+
+  def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+    if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+      return None
+    return plant_label(self.plants[index.row()])
+
+  @tracing.traced('plant_list.duplicate')
+  def duplicate(self, row):
+    self.beginInsertRows(QtCore.QModelIndex(), row + 1, row + 1)
+    row = self.plants.duplicate(row)
+    self.endInsertRows()
+    return row
+
+  @tracing.traced('plant_list.delete')
+  def delete(self, rows):
+    rows = sorted(set(rows), reverse=True)
+    while rows:
+      first = last = rows.pop(0)
+      while rows and rows[0] == first - 1:
+        first = rows.pop(0)
+
+      self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+      self.plants.delete(range(first, last + 1))
+      self.endRemoveRows()
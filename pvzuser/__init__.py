@@ -0,0 +1,29 @@
+import importlib
+from . import names
+from .names import *
+from .binary import UINT16, UINT32, FileBinaryReader, FileBinaryWriter, compiled_struct, read_number
+from .users import USER_ENTRY, load_user, read_users_index, save_user
+
+# records and user_summary compile the layout tables and record types when imported, they are loaded on first use
+# so reading users.dat and the name tables stays cheap
+_LAZY = {
+  'deep_equals': 'records',
+  'UserSummary': 'user_summary',
+  'read_summary': 'user_summary',
+}
+
+# the lazy names stay out of the star export, importing them by name loads their module
+__all__ = [
+  *names.__all__,
+  'UINT16', 'UINT32', 'FileBinaryReader', 'FileBinaryWriter', 'compiled_struct', 'read_number',
+  'USER_ENTRY', 'load_user', 'read_users_index', 'save_user',
+]
+
+def __getattr__(name):
+  module = _LAZY.get(name)
+  if module is None:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+  value = getattr(importlib.import_module(f".{module}", __name__), name)
+  globals()[name] = value
+  return value
@@ -0,0 +1,17 @@
+import sys
+from . import export, patch
+
+COMMANDS = {
+  'export': export.main,
+  'patch': patch.main,
+}
+
+def main(argv=None):
+  argv = sys.argv[1:] if argv is None else argv
+  if not argv or argv[0] not in COMMANDS:
+    print(f"usage: python -m pvzuser {{{','.join(COMMANDS)}}} ...", file=sys.stderr)
+    return 2
+  return COMMANDS[argv[0]](argv[1:])
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,75 @@
+import os
+import mmap
+import stat
+import tempfile
+
+def _umask():
+  mask = os.umask(0)
+  os.umask(mask)
+  return mask
+
+# mkstemp creates its files as 0600, new files get the mode a plain open() would have given them
+NEW_FILE_MODE = 0o666 & ~_umask()
+
+def _fsync_directory(directory):
+  if os.name != 'posix':
+    return
+
+  fd = os.open(directory, os.O_RDONLY)
+  try:
+    os.fsync(fd)
+  finally:
+    os.close(fd)
+
+def write_atomic(filepath, data):
+  directory = os.path.dirname(os.path.abspath(filepath))
+  fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(filepath)}.", suffix=".tmp", dir=directory)
+  try:
+    with os.fdopen(fd, 'wb') as file:
+      file.write(data)
+      file.flush()
+      os.fsync(file.fileno())
+
+    try:
+      mode = stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+      mode = NEW_FILE_MODE
+    os.chmod(temp_path, mode)
+
+    os.replace(temp_path, filepath)
+  except BaseException:
+    try:
+      os.unlink(temp_path)
+    except FileNotFoundError:
+      pass
+    raise
+
+  _fsync_directory(directory)
+  return len(data)
+
+def write_through(filepath, patches, size):
+  with open(filepath, 'r+b') as file:
+    if os.fstat(file.fileno()).st_size != size:
+      return False
+
+    with mmap.mmap(file.fileno(), size, access=mmap.ACCESS_WRITE) as mapped:
+      for offset, data in patches:
+        mapped[offset:(offset + len(data))] = data
+      mapped.flush()
+
+    os.fsync(file.fileno())
+  return True
+
+def apply_patches(buffer, patches):
+  patched = bytearray(buffer)
+  for offset, data in patches:
+    patched[offset:(offset + len(data))] = data
+  return bytes(patched)
+
+def save_file(filepath, data=None, base=None, patches=(), use_mmap=False):
+  if data is None:
+    if use_mmap and patches and write_through(filepath, patches, len(base)):
+      return sum(len(patch) for _, patch in patches)
+    data = apply_patches(base, patches)
+
+  return write_atomic(filepath, data)
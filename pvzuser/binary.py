@@ -0,0 +1,198 @@
+import struct
+import functools
+
+def read_number(file_bytes, format, offset, size):
+  return struct.unpack(format, file_bytes[offset:(offset + size)])[0]
+
+UINT16 = struct.Struct("<H")
+UINT32 = struct.Struct("<I")
+
+@functools.lru_cache(maxsize=None)
+def compiled_struct(format, count=1):
+  if format[0] in "<>!=@":
+    return struct.Struct(format[0] + (f"{count}{format[1:]}" if count != 1 else format[1:]))
+  return struct.Struct(f"<{count}{format}" if count != 1 else "<" + format)
+
+class FileBinaryReader:
+  CHUNK_SIZE = 64 * 1024
+
+  def __init__(self, data) -> None:
+    self.__cursor = 0
+    self.__window_start = 0
+    if hasattr(data, 'readinto'):
+      self.__file = data
+      self.__origin = data.tell()
+      self.__window = memoryview(b'')
+    else:
+      self.__file = None
+      self.__origin = 0
+      self.__window = memoryview(data)
+
+  @property
+  def cursor(self):
+    return self.__cursor
+  
+  @cursor.setter
+  def cursor(self, value):
+    self.__cursor = value
+
+  def __span(self, position, size):
+    start = position - self.__window_start
+    if self.__file is not None and (start < 0 or start + size > len(self.__window)):
+      window = bytearray(max(size, self.CHUNK_SIZE))
+      self.__file.seek(self.__origin + position)
+      read = self.__file.readinto(window)
+      self.__window = memoryview(window)[:read]
+      self.__window_start = position
+      start = 0
+
+    return self.__window, start
+
+  def __read(self, compiled, offset):
+    if offset is None:
+      offset = self.__cursor
+      self.__cursor = offset + compiled.size
+
+    if self.__file is None:
+      return compiled.unpack_from(self.__window, offset)
+
+    window, start = self.__span(offset, compiled.size)
+    return compiled.unpack_from(window, start)
+
+  def read_uint16(self, offset: int | None = None):
+    if self.__file is not None:
+      return self.__read(UINT16, offset)[0]
+
+    if offset is None:
+      offset = self.__cursor
+      self.__cursor = offset + 2
+    return UINT16.unpack_from(self.__window, offset)[0]
+  
+  def read_uint32(self, offset: int | None = None):
+    if self.__file is not None:
+      return self.__read(UINT32, offset)[0]
+
+    if offset is None:
+      offset = self.__cursor
+      self.__cursor = offset + 4
+    return UINT32.unpack_from(self.__window, offset)[0]
+
+  def read_struct(self, compiled: struct.Struct, offset: int | None = None):
+    return self.__read(compiled, offset)
+
+  def read_many(self, format: str, count: int, offset: int | None = None):
+    return self.__read(compiled_struct(format, count), offset)
+
+  def read_records(self, record: struct.Struct | str, count: int, offset: int | None = None):
+    if isinstance(record, str):
+      record = compiled_struct(record)
+
+    position = self.__cursor if offset is None else offset
+    size = record.size * count
+    window, start = self.__span(position, size)
+    if offset is None:
+      self.__cursor += size
+
+    return list(record.iter_unpack(window[start:(start + size)]))
+  
+  def read_string(self, offset: int | None = None):
+    position = self.__cursor if offset is None else offset
+    if self.__file is None:
+      window = self.__window
+      str_len = UINT16.unpack_from(window, position)[0]
+      start = position + 2
+    else:
+      str_len = self.__read(UINT16, position)[0]
+      window, start = self.__span(position + 2, str_len)
+
+    res = str(window[start:(start + str_len)], "utf-8")
+
+    if offset is None:
+      self.__cursor = position + 2 + str_len
+
+    return res
+  
+class FileBinaryWriter:
+  def __init__(self, file=None, capacity: int = 256) -> None:
+    self.__file = file
+    self.__buffer = bytearray(capacity)
+    self.__length = 0
+    self.__written = 0
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.flush()
+
+  @property
+  def pending(self):
+    return self.__length
+
+  @property
+  def bytes_written(self):
+    return self.__written
+
+  # makes room for size more bytes and returns where they start, the length only moves once they are packed so
+  # a value that fails to pack leaves nothing behind
+  def __reserve(self, size):
+    end = self.__length + size
+    if end > len(self.__buffer):
+      self.__buffer.extend(bytes(max(end, len(self.__buffer) * 2) - len(self.__buffer)))
+    return self.__length
+
+  def write_struct(self, compiled: struct.Struct, *values):
+    offset = self.__reserve(compiled.size)
+    compiled.pack_into(self.__buffer, offset, *values)
+    self.__length = offset + compiled.size
+
+  def write_uint16(self, value):
+    offset = self.__reserve(2)
+    UINT16.pack_into(self.__buffer, offset, value)
+    self.__length = offset + 2
+
+  def write_uint32(self, value):
+    offset = self.__reserve(4)
+    UINT32.pack_into(self.__buffer, offset, value)
+    self.__length = offset + 4
+
+  def write_bytes(self, value):
+    offset = self.__reserve(len(value))
+    self.__buffer[offset:(offset + len(value))] = value
+    self.__length = offset + len(value)
+
+  def write_string(self, value: str):
+    str_bytes = value.encode('utf-8')
+    offset = self.__reserve(2 + len(str_bytes))
+    UINT16.pack_into(self.__buffer, offset, len(str_bytes))
+    self.__buffer[(offset + 2):(offset + 2 + len(str_bytes))] = str_bytes
+    self.__length = offset + 2 + len(str_bytes)
+
+  def write_records(self, record: struct.Struct | str, records):
+    if isinstance(record, str):
+      record = compiled_struct(record)
+
+    records = list(records)
+    start = offset = self.__reserve(record.size * len(records))
+    for values in records:
+      record.pack_into(self.__buffer, offset, *values)
+      offset += record.size
+    self.__length = start + record.size * len(records)
+
+  def write_strings(self, values):
+    for value in values:
+      self.write_string(value)
+
+  def getvalue(self):
+    return bytes(self.__buffer[:self.__length])
+
+  def flush(self):
+    length = self.__length
+    if self.__file is None or length == 0:
+      return 0
+
+    with memoryview(self.__buffer) as view:
+      self.__file.write(view[:length])
+    self.__length = 0
+    self.__written += length
+    return length
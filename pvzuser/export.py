@@ -0,0 +1,88 @@
+import os
+import sys
+import json
+import struct
+import argparse
+import collections
+from concurrent.futures import ProcessPoolExecutor
+from .users import load_user, read_users_index
+
+def find_userdata(roots):
+  stack = [os.fspath(root) for root in reversed(roots)]
+  while stack:
+    directory = stack.pop()
+    try:
+      with os.scandir(directory) as entries:
+        entries = sorted(entries, key=lambda entry: entry.name)
+    except OSError:
+      continue
+
+    subdirectories = []
+    for entry in entries:
+      if entry.name == 'users.dat' and entry.is_file():
+        yield directory
+      elif entry.is_dir(follow_symlinks=False):
+        subdirectories.append(entry.path)
+    stack.extend(reversed(subdirectories))
+
+def find_users(roots):
+  for userdata in find_userdata(roots):
+    try:
+      users = read_users_index(userdata)
+    except (OSError, ValueError, IndexError, struct.error) as error:
+      yield { 'userdata': userdata, 'error': f"{type(error).__name__}: {error}" }
+      continue
+
+    for user in users:
+      yield { 'userdata': userdata, 'name': user['name'], 'user_index': user['user_index'], 'filepath': os.fspath(user['filepath']) }
+
+def _json_default(value):
+  if hasattr(value, 'to_dict'):
+    return value.to_dict()
+  return list(value)
+
+def export_user(job):
+  if 'error' in job:
+    return json.dumps(job)
+
+  try:
+    with load_user(job['name'], job['user_index'], job['filepath']) as user:
+      job['data'] = user.to_dict()['data']
+  except Exception as error:
+    job['error'] = f"{type(error).__name__}: {error}"
+  return json.dumps(job, default=_json_default, ensure_ascii=False)
+
+def export_users(roots, output, workers=None, window=None):
+  workers = workers or os.cpu_count() or 1
+  # results are written in discovery order, at most window files are in flight at once
+  window = window or workers * 4
+  count = 0
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    pending = collections.deque()
+    for job in find_users(roots):
+      pending.append(executor.submit(export_user, job))
+      if len(pending) >= window:
+        output.write(pending.popleft().result() + '\n')
+        count += 1
+
+    while pending:
+      output.write(pending.popleft().result() + '\n')
+      count += 1
+
+  return count
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(prog='python -m pvzuser export', description="Export every userN.dat found under the given folders as JSON Lines")
+  parser.add_argument('roots', nargs='+', help="userdata folders or folders containing them")
+  parser.add_argument('-o', '--output', help="write to this file instead of stdout")
+  parser.add_argument('-j', '--workers', type=int, help="worker processes, defaults to the number of cores")
+  args = parser.parse_args(argv)
+
+  if args.output is None:
+    export_users(args.roots, sys.stdout, args.workers)
+    return 0
+
+  with open(args.output, 'w', encoding='utf-8') as output:
+    count = export_users(args.roots, output, args.workers)
+  print(f"exported {count} users to {args.output}", file=sys.stderr)
+  return 0
@@ -0,0 +1,114 @@
+import functools
+
+__all__ = [
+  'PLANT_TYPE_NAMES', 'get_plant_type_name', 'PLANT_COLOR', 'get_plant_color_name', 'PLANT_LOCATION', 'PLANT_DIR',
+  'PLANT_LABEL_KEY', 'format_plant_label', 'plant_label', 'labels_for',
+]
+
+PLANT_TYPE_NAMES = [
+  'Peashooter',
+  'Sunflower',
+  'Cherry Bomb',
+  'Wall-nut',
+  'Potato Mine',
+  'Snow Pea',
+  'Chomper',
+  'Repeater',
+  'Puff-shroom',
+  'Sun-shroom',
+  'Fume-shroom',
+  'Grave Buster',
+  'Hypno-shroom',
+  'Scaredy-shroom',
+  'Ice-shroom',
+  'Doom-shroom',
+  'Lily Pad',
+  'Squash',
+  'Threepeater',
+  'Tangle Kelp',
+  'Jalapeno',
+  'Spikeweed',
+  'Torchwood',
+  'Tall-nut',
+  'Sea-shroom',
+  'Plantern',
+  'Cactus',
+  'Blover',
+  'Split Pea',
+  'Starfruit',
+  'Pumpkin',
+  'Magnet-shroom',
+  'Cabbage-pult',
+  'Flower Pot',
+  'Kernel-pult',
+  'Coffee Bean',
+  'Garlic',
+  'Umbrella Leaf',
+  'Marigold',
+  'Melon-pult',
+  'Gatling Pea',
+  'Twin Sunflower',
+  'Gloom-shroom',
+  'Cattail',
+  'Winter Melon',
+  'Gold Magnet',
+  'Spikerock',
+  'Cob Cannon',
+  'Imitater',
+  'Explode-o-nut',
+  'Giant Wall-nut',
+  'Sprout',
+  'Left-facing Repeater',
+]
+
+def get_plant_type_name(plant_type):
+  return PLANT_TYPE_NAMES[plant_type]
+
+PLANT_COLOR = [
+  'Low saturation',
+  'None',
+  'Magenta',
+  'Orange',
+  'Pink',
+  'Cyan',
+  'Red',
+  'Blue',
+  'Purple',
+  'Light purple',
+  'Yellow',
+  'Light green'
+]
+
+def get_plant_color_name(plant_color):
+  return PLANT_COLOR[1] if plant_color == 0 else PLANT_COLOR[plant_color - 1]
+
+PLANT_LOCATION = [
+  'Zen Garden',
+  'Mushroom Garden',
+  'Wheel Barrow',
+  'Aquarium Garden',
+]
+
+PLANT_DIR = [
+  'Faces right',
+  'Faces left',
+]
+
+PLANT_LABEL_KEY = ('type', 'color', 'dir', 'pos', 'location')
+
+@functools.lru_cache(maxsize=4096)
+def format_plant_label(plant_type, plant_color, plant_dir, pos, location):
+  color = get_plant_color_name(plant_color)
+  return f"{get_plant_type_name(plant_type)}{'' if color == 'None' else f' ({color})'}, {PLANT_DIR[plant_dir]} [{pos[0]}, {pos[1]}] {PLANT_LOCATION[location]}"
+
+def plant_label(plant):
+  return format_plant_label(plant['type'], plant['color'], plant['dir'], tuple(plant['pos']), plant['location'])
+
+def labels_for(plants):
+  if not hasattr(plants, 'column'):
+    return [plant_label(plant) for plant in plants]
+
+  # read whole columns so no per-plant record is built
+  columns = [plants.column(name) for name in PLANT_LABEL_KEY]
+  columns = [column.tolist() if hasattr(column, 'tolist') else column for column in columns]
+  return [format_plant_label(plant_type, plant_color, plant_dir, tuple(pos), location) for plant_type, plant_color, plant_dir, pos, location in zip(*columns)]
@@ -0,0 +1,148 @@
+import os
+import sys
+import json
+import time
+import struct
+import fnmatch
+import argparse
+import collections
+from concurrent.futures import ProcessPoolExecutor
+from .atomic_write import save_file
+from .export import find_users
+from .records import FIELDS_BY_PATH
+from .user_layout import PLANT_COUNT, PLANT_COUNT_OFFSET, tail_offset
+
+class PatchSpecError(ValueError):
+  pass
+
+FIELD_PATHS = {'.'.join(path): spec for path, spec in FIELDS_BY_PATH.items()}
+
+def _parse_value(text):
+  try:
+    return json.loads(text)
+  except ValueError:
+    pass
+
+  try:
+    return int(text, 0)
+  except ValueError:
+    raise PatchSpecError(f"invalid value '{text}'") from None
+
+def _match_paths(pattern):
+  matches = [path for path in FIELD_PATHS if fnmatch.fnmatchcase(path, pattern)]
+  if not matches:
+    # allow leaving out leading sections, e.g. shop.plants.imitater, as long as that names a single field
+    matches = [path for path in FIELD_PATHS if fnmatch.fnmatchcase(path, '*.' + pattern)]
+    if len(matches) > 1 and not any(char in pattern for char in '*?['):
+      raise PatchSpecError(f"'{pattern}' is ambiguous, it matches {', '.join(matches)}")
+  return matches
+
+def parse_spec(spec):
+  assignments = []
+  for assignment in spec.replace('\n', ',').split(','):
+    assignment = assignment.strip()
+    if not assignment:
+      continue
+    if assignment.startswith('set '):
+      assignment = assignment[4:].strip()
+
+    pattern, separator, value = assignment.partition('=')
+    if not separator or not pattern.strip():
+      raise PatchSpecError(f"expected 'path = value', got '{assignment}'")
+    assignments.append((pattern.strip(), _parse_value(value.strip())))
+
+  if not assignments:
+    raise PatchSpecError("the spec is empty")
+  return assignments
+
+def compile_spec(spec):
+  # (whether it is relative to the tail, offset) -> packed bytes, later assignments win, also over other paths
+  # stored at the same offset such as challenges.puzzles.vasebreaker and limbo.minigames.upsell
+  compiled = {}
+  for pattern, value in parse_spec(spec):
+    paths = _match_paths(pattern)
+    if not paths:
+      raise PatchSpecError(f"'{pattern}' does not match any field")
+
+    for path in paths:
+      field, in_tail = FIELD_PATHS[path]
+      try:
+        raw = field.transform.encode(value)
+        packed = field.struct.pack(raw) if field.count == 1 else field.struct.pack(*raw)
+      except (struct.error, TypeError, ValueError) as error:
+        raise PatchSpecError(f"{path}: cannot store {value!r} ({error})") from None
+      compiled.pop((in_tail, field.offset), None)
+      compiled[(in_tail, field.offset)] = packed
+
+  patches = sorted((offset, in_tail, packed) for (in_tail, offset), packed in compiled.items())
+  for (offset0, in_tail0, packed0), (offset1, in_tail1, _) in zip(patches, patches[1:]):
+    if in_tail0 == in_tail1 and offset1 < offset0 + len(packed0):
+      raise PatchSpecError(f"conflicting writes to the bytes at 0x{offset1:X}")
+  return patches
+
+def resolve_patches(patches, buffer):
+  tail = tail_offset(PLANT_COUNT.unpack_from(buffer, PLANT_COUNT_OFFSET)[0])
+  resolved = [(offset + (tail if in_tail else 0), packed) for offset, in_tail, packed in patches]
+  if resolved and max(offset + len(packed) for offset, packed in resolved) > len(buffer):
+    raise ValueError("user file is shorter than its layout")
+  return resolved
+
+def patch_file(filepath, patches, dry_run=False):
+  start = time.perf_counter()
+  result = { 'filepath': os.fspath(filepath) }
+  try:
+    with open(filepath, 'rb') as file:
+      buffer = file.read()
+
+    changed = [(offset, packed) for offset, packed in resolve_patches(patches, buffer) if buffer[offset:(offset + len(packed))] != packed]
+    if changed and not dry_run:
+      save_file(filepath, base=buffer, patches=changed)
+    result['status'] = 'patched' if changed else 'unchanged'
+    result['patches'] = len(changed)
+  except Exception as error:
+    result['status'] = 'failed'
+    result['error'] = f"{type(error).__name__}: {error}"
+
+  result['seconds'] = round(time.perf_counter() - start, 6)
+  return result
+
+# patches come from compile_spec
+def patch_users(patches, roots, workers=None, dry_run=False, window=None):
+  workers = workers or os.cpu_count() or 1
+  window = window or workers * 4
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    pending = collections.deque()
+    for job in find_users(roots):
+      if 'error' in job:
+        yield { 'filepath': job['userdata'], 'status': 'failed', 'error': job['error'], 'seconds': 0 }
+        continue
+
+      pending.append(executor.submit(patch_file, job['filepath'], patches, dry_run))
+      if len(pending) >= window:
+        yield pending.popleft().result()
+
+    while pending:
+      yield pending.popleft().result()
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(prog='python -m pvzuser patch', description="Apply an edit spec such as 'achievements.* = true, general.money = 99990' to every userN.dat found under the given folders")
+  parser.add_argument('spec')
+  parser.add_argument('roots', nargs='+', help="userdata folders or folders containing them")
+  parser.add_argument('-j', '--workers', type=int, help="worker processes, defaults to the number of cores")
+  parser.add_argument('-n', '--dry-run', action='store_true', help="report what would change without writing")
+  args = parser.parse_args(argv)
+
+  try:
+    patches = compile_spec(args.spec)
+  except PatchSpecError as error:
+    parser.error(str(error))
+
+  counts = collections.Counter()
+  start = time.perf_counter()
+  for result in patch_users(patches, args.roots, args.workers, args.dry_run):
+    counts[result['status']] += 1
+    print(json.dumps(result), flush=True)
+
+  summary = ', '.join(f"{count} {status}" for status, count in sorted(counts.items())) or "no user files found"
+  print(f"{summary} in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+  return 1 if counts['failed'] else 0
@@ -0,0 +1,214 @@
+import sys
+from array import array
+from .user_layout import PLANT, PLANT_RECORD, PLANT_SIZE, PLANTS_OFFSET, encode_plant, tail_offset
+from .records import plant_from_values
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+WORDS_PER_PLANT = PLANT_SIZE // 4
+
+# column name -> (first 32-bit word in the record, number of words)
+COLUMNS = {field.path[-1]: (field.offset // 4, field.count) for field in PLANT.fields}
+
+if numpy is not None:
+  PLANT_DTYPE = numpy.dtype({
+    'names': [field.path[-1] for field in PLANT.fields],
+    'formats': ['<u4' if field.count == 1 else ('<u4', field.count) for field in PLANT.fields],
+    'offsets': [field.offset for field in PLANT.fields],
+    'itemsize': PLANT_SIZE,
+  })
+
+def _to_words(data):
+  words = array('I', bytes(data))
+  if sys.byteorder == 'big':
+    words.byteswap()
+  return words
+
+def _to_bytes(words):
+  if sys.byteorder == 'big':
+    words = array('I', words)
+    words.byteswap()
+  return words.tobytes()
+
+class PlantTable:
+  def __init__(self, data=b'') -> None:
+    if len(data) % PLANT_SIZE != 0:
+      raise ValueError(f"plant data is not a multiple of {PLANT_SIZE} bytes")
+
+    if numpy is not None:
+      self.__raw = numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, PLANT_SIZE).copy()
+    else:
+      self.__words = _to_words(data)
+
+    # bumped on every mutation so owners can cheaply tell whether the table changed
+    self.version = 0
+
+  @classmethod
+  def from_buffer(cls, buffer, count):
+    return cls(memoryview(buffer)[PLANTS_OFFSET:tail_offset(count)])
+
+  def __len__(self):
+    if numpy is not None:
+      return len(self.__raw)
+    return len(self.__words) // WORDS_PER_PLANT
+
+  def __index(self, index):
+    length = len(self)
+    if index < 0:
+      index += length
+    if not 0 <= index < length:
+      raise IndexError("plant index out of range")
+    return index
+
+  def record(self, index):
+    index = self.__index(index)
+    if numpy is not None:
+      return self.__raw[index].tobytes()
+    return _to_bytes(self.__words[(index * WORDS_PER_PLANT):((index + 1) * WORDS_PER_PLANT)])
+
+  def tobytes(self):
+    if numpy is not None:
+      return self.__raw.tobytes()
+    return _to_bytes(self.__words)
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return self.filter(range(len(self))[index])
+    return plant_from_values(PLANT_RECORD.unpack(self.record(index)))
+
+  def __setitem__(self, index, plant):
+    index = self.__index(index)
+    record = plant if isinstance(plant, (bytes, bytearray)) else encode_plant(plant, self.record(index))
+    if numpy is not None:
+      self.__raw[index] = numpy.frombuffer(record, dtype=numpy.uint8)
+    else:
+      self.__words[(index * WORDS_PER_PLANT):((index + 1) * WORDS_PER_PLANT)] = _to_words(record)
+    self.version += 1
+
+  def __iter__(self):
+    for values in PLANT_RECORD.iter_unpack(self.tobytes()):
+      yield plant_from_values(values)
+
+  def __eq__(self, other):
+    if isinstance(other, PlantTable):
+      return self.tobytes() == other.tobytes()
+    if isinstance(other, (list, tuple)):
+      return len(self) == len(other) and list(self) == list(other)
+    return NotImplemented
+
+  def __repr__(self) -> str:
+    return f"PlantTable({len(self)} plants)"
+
+  def __deepcopy__(self, memo):
+    return PlantTable(self.tobytes())
+
+  def copy(self):
+    return PlantTable(self.tobytes())
+
+  def to_list(self):
+    return list(self)
+
+  def column(self, name):
+    first, count = COLUMNS[name]
+    if numpy is not None:
+      # read-only, writes have to go through __setitem__ so the version is bumped
+      column = self.__raw.reshape(-1).view(PLANT_DTYPE)[name]
+      column.flags.writeable = False
+      return column
+
+    if count == 1:
+      return self.__words[first::WORDS_PER_PLANT]
+    return list(zip(*(self.__words[(first + i)::WORDS_PER_PLANT] for i in range(count))))
+
+  def mask(self, **conditions):
+    if numpy is not None:
+      if len(self) == 0:
+        return numpy.zeros(0, dtype=bool)
+
+      selected = numpy.ones(len(self), dtype=bool)
+      for name, value in conditions.items():
+        selected &= numpy.all((self.column(name) == value).reshape(len(self), -1), axis=1)
+      return selected
+
+    selected = [True] * len(self)
+    for name, value in conditions.items():
+      for index, cell in enumerate(self.column(name)):
+        selected[index] = selected[index] and cell == value
+    return selected
+
+  def indices(self, selector):
+    if callable(selector):
+      return [index for index, plant in enumerate(self) if selector(plant)]
+
+    if numpy is not None:
+      selector = numpy.asarray(selector)
+      if selector.dtype == bool:
+        self.__check_mask(len(selector))
+        return numpy.flatnonzero(selector).tolist()
+      return selector.tolist()
+
+    selector = list(selector)
+    if selector and all(isinstance(item, bool) for item in selector):
+      self.__check_mask(len(selector))
+      return [index for index, selected in enumerate(selector) if selected]
+    return selector
+
+  def __check_mask(self, length):
+    if length != len(self):
+      raise ValueError(f"boolean mask has {length} entries for {len(self)} plants")
+
+  def filter(self, selector=None, **conditions):
+    if selector is None:
+      selector = self.mask(**conditions)
+
+    indices = self.indices(selector)
+    if numpy is not None:
+      table = PlantTable()
+      table.__raw = self.__raw[numpy.asarray(indices, dtype=numpy.intp)]
+      return table
+
+    return PlantTable(b''.join(self.record(index) for index in indices))
+
+  def where(self, **conditions):
+    return self.filter(**conditions)
+
+  def insert(self, index, plant):
+    length = len(self)
+    index = max(0, min(length, index + length if index < 0 else index))
+    record = plant if isinstance(plant, (bytes, bytearray)) else encode_plant(plant)
+    if numpy is not None:
+      self.__raw = numpy.insert(self.__raw, index, numpy.frombuffer(record, dtype=numpy.uint8), axis=0)
+    else:
+      self.__words[(index * WORDS_PER_PLANT):(index * WORDS_PER_PLANT)] = _to_words(record)
+    self.version += 1
+
+  def append(self, plant):
+    self.insert(len(self), plant)
+
+  def delete(self, indices):
+    indices = sorted({self.__index(index) for index in indices}, reverse=True)
+    if not indices:
+      return
+
+    if numpy is not None:
+      self.__raw = numpy.delete(self.__raw, indices, axis=0)
+    else:
+      for index in indices:
+        del self.__words[(index * WORDS_PER_PLANT):((index + 1) * WORDS_PER_PLANT)]
+    self.version += 1
+
+  def __delitem__(self, index):
+    self.delete(range(len(self))[index] if isinstance(index, slice) else [index])
+
+  def pop(self, index=-1):
+    plant = self[index]
+    self.delete([index])
+    return plant
+
+  def duplicate(self, index):
+    index = self.__index(index)
+    self.insert(index + 1, self.record(index))
+    return index + 1
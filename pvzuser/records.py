@@ -0,0 +1,372 @@
+import copy
+from collections.abc import Mapping
+from .user_layout import HEADER, PLANT, RAW, TAIL, compile_regions, decode_user
+
+class Record:
+  __slots__ = ('_user',)
+  _keys = ()
+  # mapping key -> slot name, they only differ for keys that are not identifiers
+  _attrs = {}
+  # slot name -> callable(user) producing values that are not stored in the layout
+  _loaders = {}
+  # slot name -> (layout field, whether its offset is relative to the tail)
+  _fields = {}
+  # callable(record) decoding every layout field of the record and its child records at once
+  _fill = None
+  # slot name -> full key path from the root of the user data
+  _paths = {}
+
+  def __init__(self, user=None, **values) -> None:
+    object.__setattr__(self, '_user', user)
+    for attr, value in values.items():
+      object.__setattr__(self, attr, value)
+
+  def __getattr__(self, attr):
+    cls = type(self)
+    if attr in cls._fields and cls._fill is not None and self._user is not None:
+      cls._fill(self)
+      return object.__getattribute__(self, attr)
+
+    loader = cls._loaders.get(attr)
+    if loader is None:
+      raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+
+    value = loader(self._user)
+    object.__setattr__(self, attr, value)
+    return value
+
+  def __setattr__(self, attr, value):
+    user = self._user
+    if user is not None:
+      user.track(self._paths[attr], self, attr, value)
+    object.__setattr__(self, attr, value)
+
+  def __getitem__(self, key):
+    try:
+      attr = self._attrs[key]
+    except KeyError:
+      raise KeyError(key) from None
+    return getattr(self, attr)
+
+  def __setitem__(self, key, value):
+    try:
+      attr = self._attrs[key]
+    except KeyError:
+      raise KeyError(key) from None
+    setattr(self, attr, value)
+
+  def __contains__(self, key):
+    return key in self._attrs
+
+  def __iter__(self):
+    return iter(self._keys)
+
+  def __len__(self):
+    return len(self._keys)
+
+  def keys(self):
+    return self._attrs.keys()
+
+  def values(self):
+    return [getattr(self, attr) for attr in self._attrs.values()]
+
+  def items(self):
+    return [(key, getattr(self, attr)) for key, attr in self._attrs.items()]
+
+  def get(self, key, default=None):
+    return self[key] if key in self._attrs else default
+
+  def __eq__(self, other):
+    if type(self) is type(other):
+      return all(getattr(self, attr) == getattr(other, attr) for attr in self._attrs.values())
+    if isinstance(other, Mapping):
+      return len(self) == len(other) and all(key in other and value == other[key] for key, value in self.items())
+    return NotImplemented
+
+  __hash__ = None
+
+  def __repr__(self) -> str:
+    return f"{type(self).__name__}({', '.join(f'{attr}={value!r}' for attr, value in zip(self._attrs.values(), self.values()))})"
+
+  def _loaded(self):
+    for attr in self._attrs.values():
+      try:
+        yield attr, object.__getattribute__(self, attr)
+      except AttributeError:
+        pass
+
+  # copies only carry loaded values, so a record is decoded before it is copied to keep its fields all set or all unset
+  def _ensure_filled(self):
+    if type(self)._fill is not None and self._user is not None:
+      type(self)._fill(self)
+
+  def _peek(self, attr, default=None):
+    try:
+      return object.__getattribute__(self, attr)
+    except AttributeError:
+      return default
+
+  def replace(self, **changes):
+    self._ensure_filled()
+    record = object.__new__(type(self))
+    object.__setattr__(record, '_user', self._user)
+    for attr, value in self._loaded():
+      object.__setattr__(record, attr, value)
+    for attr, value in changes.items():
+      object.__setattr__(record, attr, value)
+    return record
+
+  def __copy__(self):
+    return self.replace()
+
+  def __deepcopy__(self, memo):
+    return self._copy(self._user, memo)
+
+  def _copy(self, user, memo):
+    self._ensure_filled()
+    record = object.__new__(type(self))
+    object.__setattr__(record, '_user', user)
+    for attr, value in self._loaded():
+      object.__setattr__(record, attr, value._copy(user, memo) if isinstance(value, Record) else copy.deepcopy(value, memo))
+    return record
+
+  def to_dict(self):
+    result = {}
+    for key, attr in self._attrs.items():
+      value = getattr(self, attr)
+      if isinstance(value, Record):
+        value = value.to_dict()
+      elif hasattr(value, 'to_list'):
+        value = value.to_list()
+      result[key] = value
+    return result
+
+Mapping.register(Record)
+
+class FrozenRecord(Record):
+  __slots__ = ()
+
+  def __setattr__(self, attr, value):
+    raise AttributeError(f"'{type(self).__name__}' is immutable, use replace()")
+
+  def __hash__(self):
+    return hash(tuple(self.values()))
+
+def _attr(key):
+  return key if key.isidentifier() else ''.join(char for char in key if char.isalnum() or char == '_')
+
+def _record_type(name, path, keys, loaders, fields, base=Record):
+  attrs = {key: _attr(key) for key in keys}
+  return type(name, (base,), {
+    '_paths': {attr: path + (key,) for key, attr in attrs.items()},
+    '__slots__': tuple(attrs.values()),
+    '_keys': tuple(keys),
+    '_attrs': attrs,
+    '_loaders': {attrs[key]: loader for key, loader in loaders.items() if key not in fields},
+    '_fields': {attrs[key]: field for key, field in fields.items()},
+  })
+
+def _container_paths(layout):
+  paths = [()]
+  for parent, key in layout.containers:
+    paths.append(paths[parent] + (key,))
+  return paths
+
+def _section_regions(path, layout, in_tail, records, types):
+  paths = _container_paths(layout)
+  fields = [field for field in layout.fields if field.path[:len(path)] == path]
+  bounds = []
+  for start, end in ((region.start, region.start + region.struct.size) for region in layout.regions):
+    members = [field for field in fields if start <= field.offset < end]
+    if members:
+      bounds.append((min(field.offset for field in members), max(field.offset + field.struct.size for field in members)))
+
+  regions = []
+  for region in compile_regions(fields, bounds):
+    groups = {}
+    for container, key, index, count, decode in region.slots:
+      record = paths[container]
+      # slot descriptors set the value without going through Record.__setattr__ and its change tracking
+      set_value = types[record].__dict__[_attr(key)].__set__
+      groups.setdefault(records.index(record[len(path):]), []).append((set_value, index, count, None if decode is RAW.decode else decode))
+    regions.append((in_tail, region.start, region.struct.unpack_from, tuple((number, tuple(setters)) for number, setters in groups.items())))
+  return regions
+
+# decodes the fields of a record and of its child records with one unpack_from per layout region, records that
+# were decoded before keep their values
+def _section_loader(path, types):
+  fields = [field for layout in (HEADER, TAIL) for field in layout.fields if field.path[:len(path)] == path]
+  records = sorted({field.path[len(path):-1] for field in fields}, key=lambda record: (len(record), record))
+  regions = _section_regions(path, HEADER, False, records, types) + _section_regions(path, TAIL, True, records, types)
+  attr_paths = [tuple(_attr(key) for key in record) for record in records]
+  # a record is decoded as a whole, so checking one of its fields tells whether it was
+  checks = [_attr(next(field.path[-1] for field in fields if field.path[len(path):-1] == record)) for record in records]
+
+  def fill(record):
+    targets = []
+    for attrs, first in zip(attr_paths, checks):
+      target = record
+      for attr in attrs:
+        target = getattr(target, attr)
+      try:
+        object.__getattribute__(target, first)
+        targets.append(None)
+      except AttributeError:
+        targets.append(target)
+
+    if all(target is None for target in targets):
+      return
+
+    user = record._user
+    buffer = user.buffer
+    for in_tail, start, unpack_from, groups in regions:
+      values = None
+      for number, setters in groups:
+        target = targets[number]
+        if target is None:
+          continue
+
+        if values is None:
+          values = unpack_from(buffer, user.tail_offset + start if in_tail else start)
+        for set_value, index, count, decode in setters:
+          value = values[index] if count == 1 else values[index:(index + count)]
+          set_value(target, value if decode is None else decode(value))
+
+  return fill
+
+# the zen garden tree is not read from the file yet
+TREE_DEFAULTS = {
+  'purchased': False,
+  'height': 0,
+  'purchased_food': False,
+  'food': 0,
+}
+
+RECORD_NAMES = {
+  (): 'UserData',
+  ('general',): 'General',
+  ('general', 'shop'): 'Shop',
+  ('general', 'shop', 'plants'): 'ShopPlants',
+  ('zen_garden',): 'ZenGarden',
+  ('zen_garden', 'snail'): 'Snail',
+  ('zen_garden', 'tree'): 'Tree',
+  ('achievements',): 'Achievements',
+  ('challenges',): 'Challenges',
+  ('challenges', 'survivals'): 'Survivals',
+  ('challenges', 'survivals', 'normal'): 'NormalSurvivals',
+  ('challenges', 'survivals', 'hard'): 'HardSurvivals',
+  ('challenges', 'minigames'): 'Minigames',
+  ('challenges', 'puzzles'): 'Puzzles',
+  ('limbo',): 'Limbo',
+  ('limbo', 'survival_endless'): 'LimboSurvivals',
+  ('limbo', 'minigames'): 'LimboMinigames',
+  ('zombatar',): 'Zombatar',
+}
+
+def _user_record_types():
+  loaders = {path: {} for path in RECORD_NAMES}
+  fields = {path: {} for path in RECORD_NAMES}
+  for layout, in_tail in ((HEADER, False), (TAIL, True)):
+    for field in layout.fields:
+      loaders[field.path[:-1]][field.path[-1]] = None
+      fields[field.path[:-1]][field.path[-1]] = (field, in_tail)
+
+  loaders[('general',)]['name'] = lambda user: user.name
+  loaders[('zen_garden', 'tree')].update({key: (lambda user, value=value: value) for key, value in TREE_DEFAULTS.items()})
+  loaders[('zen_garden',)]['plants'] = lambda user: user.load_plants()
+  loaders[('zombatar',)]['zombatars'] = lambda user: []
+
+  types = {}
+  for path in sorted(RECORD_NAMES, key=len, reverse=True):
+    for child, child_type in types.items():
+      if child[:-1] == path:
+        loaders[path][child[-1]] = child_type
+    types[path] = _record_type(RECORD_NAMES[path], path, loaders[path].keys(), loaders[path], fields[path])
+    if fields[path]:
+      types[path]._fill = _section_loader(path, types)
+
+  return types
+
+RECORD_TYPES = _user_record_types()
+
+UserData = RECORD_TYPES[()]
+General = RECORD_TYPES[('general',)]
+Shop = RECORD_TYPES[('general', 'shop')]
+ShopPlants = RECORD_TYPES[('general', 'shop', 'plants')]
+ZenGarden = RECORD_TYPES[('zen_garden',)]
+Snail = RECORD_TYPES[('zen_garden', 'snail')]
+Tree = RECORD_TYPES[('zen_garden', 'tree')]
+Achievements = RECORD_TYPES[('achievements',)]
+Challenges = RECORD_TYPES[('challenges',)]
+Survivals = RECORD_TYPES[('challenges', 'survivals')]
+NormalSurvivals = RECORD_TYPES[('challenges', 'survivals', 'normal')]
+HardSurvivals = RECORD_TYPES[('challenges', 'survivals', 'hard')]
+Minigames = RECORD_TYPES[('challenges', 'minigames')]
+Puzzles = RECORD_TYPES[('challenges', 'puzzles')]
+Limbo = RECORD_TYPES[('limbo',)]
+LimboSurvivals = RECORD_TYPES[('limbo', 'survival_endless')]
+LimboMinigames = RECORD_TYPES[('limbo', 'minigames')]
+Zombatar = RECORD_TYPES[('zombatar',)]
+
+Plant = _record_type('Plant', (), [field.path[-1] for field in PLANT.fields], {}, {field.path[-1]: (field, False) for field in PLANT.fields}, FrozenRecord)
+
+# full decode straight into dicts with the compiled region structs, the same values UserData.to_dict() gives for an
+# untouched user without building the records
+def decode_data(user):
+  data = decode_user(user.buffer)
+  data['general']['name'] = user.name
+  data['zen_garden']['tree'] = dict(TREE_DEFAULTS)
+  data['zombatar']['zombatars'] = []
+  return data
+
+# key path -> (layout field, whether its offset is relative to the tail)
+FIELDS_BY_PATH = {record_type._paths[attr]: field for record_type in RECORD_TYPES.values() for attr, field in record_type._fields.items()}
+
+PLANT_SLOTS = tuple((Plant.__dict__[_attr(key)].__set__, index, count, None if decode is RAW.decode else decode) for _, key, index, count, decode in PLANT.regions[0].slots)
+_set_plant_user = Record.__dict__['_user'].__set__
+
+def plant_from_values(values):
+  plant = object.__new__(Plant)
+  _set_plant_user(plant, None)
+  for set_value, index, count, decode in PLANT_SLOTS:
+    value = values[index] if count == 1 else values[index:(index + count)]
+    set_value(plant, value if decode is None else decode(value))
+  return plant
+
+# leaves are compared in place instead of going through the stack
+_SCALARS = frozenset((int, bool, float, str, bytes))
+
+def deep_equals(value0, value1):
+  stack = [(value0, value1)]
+  pop, push = stack.pop, stack.append
+  while stack:
+    value0, value1 = pop()
+    if value0 is None or value1 is None:
+      return False
+
+    # plain dicts, lists and tuples are matched by type first, only records need the Mapping check
+    type0 = type(value0)
+    if type0 is dict or (type0 is not list and type0 is not tuple and isinstance(value0, Mapping)):
+      if not (type(value1) is dict or isinstance(value1, Mapping)) or len(value0) != len(value1):
+        return False
+      for key in value0:
+        if key not in value1:
+          return False
+      pairs = zip(map(value0.__getitem__, value0), map(value1.__getitem__, value0))
+    elif (isinstance(value0, list) and isinstance(value1, list)) or (isinstance(value0, tuple) and isinstance(value1, tuple)):
+      if len(value0) != len(value1):
+        return False
+      pairs = zip(value0, value1)
+    else:
+      if value0 != value1:
+        return False
+      continue
+
+    for item0, item1 in pairs:
+      if type(item0) in _SCALARS:
+        if item1 is None or item0 != item1:
+          return False
+      else:
+        push((item0, item1))
+
+  return True
@@ -0,0 +1,83 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+from .atomic_write import write_atomic
+
+CACHE_VERSION = 1
+
+class UserCache:
+  def __init__(self, filepath, max_entries=4096) -> None:
+    self.filepath = filepath
+    self.max_entries = max_entries
+    # path -> (mtime_ns, size, {kind: value}), least recently used first
+    self.__entries = OrderedDict()
+    self.__lock = threading.Lock()
+    self.__modified = False
+    self.__load()
+
+  def __load(self):
+    try:
+      with open(self.filepath, 'rb') as file:
+        cache = json.load(file)
+    except (OSError, ValueError):
+      return
+
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+      return
+
+    try:
+      for path, mtime_ns, size, values in cache['entries'][-self.max_entries:]:
+        self.__entries[path] = (mtime_ns, size, values)
+    except (KeyError, TypeError, ValueError):
+      self.__entries.clear()
+
+  def __len__(self):
+    return len(self.__entries)
+
+  def get(self, filepath, kind, stat=None):
+    stat = stat or os.stat(filepath)
+    path = os.path.abspath(filepath)
+    with self.__lock:
+      entry = self.__entries.get(path)
+      if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+        return None
+
+      self.__entries.move_to_end(path)
+      return entry[2].get(kind)
+
+  def put(self, filepath, kind, value, stat=None):
+    stat = stat or os.stat(filepath)
+    path = os.path.abspath(filepath)
+    with self.__lock:
+      entry = self.__entries.get(path)
+      if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+        entry = (stat.st_mtime_ns, stat.st_size, {})
+
+      entry[2][kind] = value
+      self.__entries[path] = entry
+      self.__entries.move_to_end(path)
+      while len(self.__entries) > self.max_entries:
+        self.__entries.popitem(last=False)
+      self.__modified = True
+
+  def cached(self, filepath, kind, compute):
+    # stat before computing so a file changing mid-read is caught on the next lookup
+    stat = os.stat(filepath)
+    value = self.get(filepath, kind, stat)
+    if value is None:
+      value = compute()
+      self.put(filepath, kind, value, stat)
+    return value
+
+  def save(self):
+    with self.__lock:
+      if not self.__modified:
+        return False
+
+      entries = [[path, mtime_ns, size, values] for path, (mtime_ns, size, values) in self.__entries.items()]
+      data = json.dumps({ 'version': CACHE_VERSION, 'entries': entries }, separators=(',', ':')).encode('utf-8')
+      self.__modified = False
+
+    write_atomic(self.filepath, data)
+    return True
@@ -0,0 +1,88 @@
+import hashlib
+from collections.abc import Mapping
+from typing import NamedTuple
+from .plant_table import PlantTable
+
+SECTIONS = ('general', 'zen_garden', 'achievements', 'challenges', 'limbo', 'zombatar')
+
+class Fingerprint(NamedTuple):
+  # canonical bytes for scalars, a blake2b digest of the children for containers
+  digest: bytes
+  # key -> Fingerprint, None for scalars
+  children: dict | None
+
+def _token(value):
+  if isinstance(value, (bool, int)):
+    return b'i' + str(int(value)).encode()
+  if isinstance(value, str):
+    return b's' + value.encode('utf-8')
+  if isinstance(value, float):
+    return b'f' + repr(value).encode()
+  if value is None:
+    return b'n'
+  if isinstance(value, (bytes, bytearray, memoryview)):
+    return b'y' + bytes(value)
+  return b'r' + repr(value).encode()
+
+def _children(value):
+  if isinstance(value, Mapping):
+    return b'm', value.items()
+  if isinstance(value, (list, tuple, PlantTable)):
+    return b'l', enumerate(value)
+  return None, None
+
+def fingerprint(value):
+  result = {}
+  stack = [(value, result, None, None, None)]
+  while stack:
+    value, parent, key, kind, children = stack.pop()
+    if children is not None:
+      digest = hashlib.blake2b(kind, digest_size=16)
+      for child_key, child in sorted(children.items()):
+        for part in (_token(child_key), child.digest):
+          digest.update(len(part).to_bytes(4, 'little'))
+          digest.update(part)
+      parent[key] = Fingerprint(digest.digest(), children)
+      continue
+
+    kind, items = _children(value)
+    if kind is None:
+      parent[key] = Fingerprint(_token(value), None)
+      continue
+
+    children = {}
+    stack.append((value, parent, key, kind, children))
+    for child_key, child in items:
+      stack.append((child, children, child_key, None, None))
+
+  return result[None]
+
+def section_fingerprints(user):
+  data = user['data']
+  return {section: fingerprint(data[section]) for section in SECTIONS if section in data}
+
+def diff_fingerprints(fingerprints0, fingerprints1):
+  paths = []
+  stack = [((section,), fingerprints0.get(section), fingerprints1.get(section)) for section in reversed(SECTIONS)]
+  while stack:
+    path, value0, value1 = stack.pop()
+    if value0 is None and value1 is None:
+      continue
+
+    if value0 is None or value1 is None or value0.children is None or value1.children is None:
+      if value0 != value1:
+        paths.append('.'.join(str(key) for key in path))
+      continue
+
+    if value0.digest == value1.digest:
+      continue
+
+    keys = list(value0.children)
+    keys += [key for key in value1.children if key not in value0.children]
+    for key in sorted(keys, reverse=True):
+      stack.append((path + (key,), value0.children.get(key), value1.children.get(key)))
+
+  return paths
+
+def diff_users(user0, user1):
+  return diff_fingerprints(section_fingerprints(user0), section_fingerprints(user1))
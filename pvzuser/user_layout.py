@@ -0,0 +1,318 @@
+import struct
+from typing import Any, Callable, NamedTuple
+
+class Transform(NamedTuple):
+  decode: Callable[[Any], Any]
+  encode: Callable[[Any], Any]
+
+RAW = Transform(lambda raw: raw, lambda value: value)
+FLAG = Transform(lambda raw: raw == 1, lambda value: 1 if value else 0)
+NONZERO = Transform(lambda raw: raw != 0, lambda value: 1 if value else 0)
+
+def scaled(factor):
+  return Transform(lambda raw: raw * factor, lambda value: int(value) // factor)
+
+def shifted(delta):
+  return Transform(lambda raw: raw + delta, lambda value: int(value) - delta)
+
+PLANT_COUNT_OFFSET = 0x330
+PLANTS_OFFSET = 0x334
+PLANT_SIZE = 0x58
+
+# (path, offset, type, transform) for every field at a fixed position in userN.dat
+HEADER_FIELDS = (
+  ('general.level', 0x004, 'I', RAW),
+  ('general.completed', 0x00C, 'I', RAW),
+  ('general.money', 0x008, 'I', scaled(10)),
+  ('general.minigames_unlocked', 0x300, 'I', FLAG),
+  ('general.puzzles_unlocked', 0x304, 'I', FLAG),
+  ('general.has_taco', 0x320, 'I', FLAG),
+  ('general.shop.slots', 0x1F4, 'I', shifted(6)),
+  ('general.shop.pool_cleaner', 0x1F8, 'I', FLAG),
+  ('general.shop.roof_cleaner', 0x1FC, 'I', FLAG),
+  ('general.shop.rake_uses', 0x200, 'I', RAW),
+  ('general.shop.plants.gatling_pea', 0x1A0, 'I', FLAG),
+  ('general.shop.plants.twin_sunflower', 0x1A4, 'I', FLAG),
+  ('general.shop.plants.gloom_shroom', 0x1A8, 'I', FLAG),
+  ('general.shop.plants.cattail', 0x1AC, 'I', FLAG),
+  ('general.shop.plants.winter_melon', 0x1B0, 'I', FLAG),
+  ('general.shop.plants.gold_magnet', 0x1B4, 'I', FLAG),
+  ('general.shop.plants.spikerock', 0x1B8, 'I', FLAG),
+  ('general.shop.plants.cob_cannon', 0x1BC, 'I', FLAG),
+  ('general.shop.plants.imitater', 0x1C0, 'I', FLAG),
+  ('zen_garden.marigold1_date', 0x1C8, 'I', RAW),
+  ('zen_garden.marigold2_date', 0x1CC, 'I', RAW),
+  ('zen_garden.marigold3_date', 0x1D0, 'I', RAW),
+  ('zen_garden.golden_can', 0x1D4, 'I', FLAG),
+  ('zen_garden.phonograph', 0x1E0, 'I', FLAG),
+  ('zen_garden.glove', 0x1E4, 'I', FLAG),
+  ('zen_garden.fertilizer', 0x1D8, 'I', RAW),
+  ('zen_garden.bug_spray', 0x1DC, 'I', RAW),
+  ('zen_garden.mushroom_garden', 0x1E8, 'I', FLAG),
+  ('zen_garden.aquarium_garden', 0x204, 'I', FLAG),
+  ('zen_garden.wheel_barrow', 0x1EC, 'I', FLAG),
+  ('zen_garden.snail.last_awoken', 0x1F0, 'I', RAW),
+  ('zen_garden.snail.last_chocolate', 0x2F4, 'I', RAW),
+  ('zen_garden.snail.x', 0x2F8, 'I', RAW),
+  ('zen_garden.snail.y', 0x2FC, 'I', RAW),
+  ('challenges.survivals.normal.day', 0x010, 'I', RAW),
+  ('challenges.survivals.normal.night', 0x014, 'I', RAW),
+  ('challenges.survivals.normal.pool', 0x018, 'I', RAW),
+  ('challenges.survivals.normal.fog', 0x01C, 'I', RAW),
+  ('challenges.survivals.normal.roof', 0x020, 'I', RAW),
+  ('challenges.survivals.hard.day', 0x024, 'I', RAW),
+  ('challenges.survivals.hard.night', 0x028, 'I', RAW),
+  ('challenges.survivals.hard.pool', 0x02C, 'I', RAW),
+  ('challenges.survivals.hard.fog', 0x030, 'I', RAW),
+  ('challenges.survivals.hard.roof', 0x034, 'I', RAW),
+  ('challenges.survivals.endless', 0x040, 'I', RAW),
+  ('challenges.minigames.zombotany', 0x04C, 'I', NONZERO),
+  ('challenges.minigames.wallnut_bowling', 0x050, 'I', NONZERO),
+  ('challenges.minigames.slot_machine', 0x054, 'I', NONZERO),
+  ('challenges.minigames.its_raining_seeds', 0x058, 'I', NONZERO),
+  ('challenges.minigames.beghouled', 0x05C, 'I', NONZERO),
+  ('challenges.minigames.invisighoul', 0x060, 'I', NONZERO),
+  ('challenges.minigames.seeing_stars', 0x064, 'I', NONZERO),
+  ('challenges.minigames.zombiquarium', 0x068, 'I', NONZERO),
+  ('challenges.minigames.beghouled_twist', 0x06C, 'I', NONZERO),
+  ('challenges.minigames.big_trouble_little_zombie', 0x070, 'I', NONZERO),
+  ('challenges.minigames.portal_combat', 0x074, 'I', NONZERO),
+  ('challenges.minigames.column_like_you_see_em', 0x078, 'I', NONZERO),
+  ('challenges.minigames.bobsled_bonanza', 0x07C, 'I', NONZERO),
+  ('challenges.minigames.zombie_n_zombie_q', 0x080, 'I', NONZERO),
+  ('challenges.minigames.whack_a_zombie', 0x084, 'I', NONZERO),
+  ('challenges.minigames.last_stand', 0x088, 'I', NONZERO),
+  ('challenges.minigames.zombotany2', 0x08C, 'I', NONZERO),
+  ('challenges.minigames.wallnut_bowling2', 0x090, 'I', NONZERO),
+  ('challenges.minigames.pogo_party', 0x094, 'I', NONZERO),
+  ('challenges.minigames.dr_zomboss_revenge', 0x098, 'I', NONZERO),
+  ('challenges.puzzles.vasebreaker', 0x0D8, 'I', NONZERO),
+  ('challenges.puzzles.to_the_left', 0x0DC, 'I', NONZERO),
+  ('challenges.puzzles.third_vase', 0x0E0, 'I', NONZERO),
+  ('challenges.puzzles.chain_reaction', 0x0E4, 'I', NONZERO),
+  ('challenges.puzzles.m_is_for_metal', 0x0E8, 'I', NONZERO),
+  ('challenges.puzzles.scary_potter', 0x0EC, 'I', NONZERO),
+  ('challenges.puzzles.hokey_pokey', 0x0F0, 'I', NONZERO),
+  ('challenges.puzzles.another_chain_reaction', 0x0F4, 'I', NONZERO),
+  ('challenges.puzzles.ace_of_vases', 0x0F8, 'I', NONZERO),
+  ('challenges.puzzles.vasebreaker_endless', 0x0FC, 'I', RAW),
+  ('challenges.puzzles.izombie', 0x100, 'I', NONZERO),
+  ('challenges.puzzles.izombie_too', 0x104, 'I', NONZERO),
+  ('challenges.puzzles.can_you_dig_it', 0x108, 'I', NONZERO),
+  ('challenges.puzzles.totally_nuts', 0x10C, 'I', NONZERO),
+  ('challenges.puzzles.dead_zeppelin', 0x110, 'I', NONZERO),
+  ('challenges.puzzles.me_smash', 0x114, 'I', NONZERO),
+  ('challenges.puzzles.zomboggie', 0x118, 'I', NONZERO),
+  ('challenges.puzzles.tree_hit_wonder', 0x11C, 'I', NONZERO),
+  ('challenges.puzzles.all_your_brainz', 0x120, 'I', NONZERO),
+  ('challenges.puzzles.izombie_endless', 0x124, 'I', RAW),
+  ('limbo.survival_endless.day', 0x038, 'I', NONZERO),
+  ('limbo.survival_endless.night', 0x03C, 'I', NONZERO),
+  ('limbo.survival_endless.fog', 0x044, 'I', NONZERO),
+  ('limbo.survival_endless.roof', 0x048, 'I', NONZERO),
+  ('limbo.minigames.art_wallnut', 0x09C, 'I', NONZERO),
+  ('limbo.minigames.sunny_day', 0x0A0, 'I', NONZERO),
+  ('limbo.minigames.unsodded', 0x0A4, 'I', NONZERO),
+  ('limbo.minigames.buy_time', 0x0A8, 'I', NONZERO),
+  ('limbo.minigames.art_sunflower', 0x0AC, 'I', NONZERO),
+  ('limbo.minigames.air_raid', 0x0B0, 'I', NONZERO),
+  ('limbo.minigames.ice_level', 0x0B4, 'I', NONZERO),
+  ('limbo.minigames.zen_garden', 0x0B8, 'I', NONZERO),
+  ('limbo.minigames.high_gravity', 0x0BC, 'I', NONZERO),
+  ('limbo.minigames.grave_danger', 0x0C0, 'I', NONZERO),
+  ('limbo.minigames.can_you_dig_it', 0x0C4, 'I', NONZERO),
+  ('limbo.minigames.dark_night', 0x0C8, 'I', NONZERO),
+  ('limbo.minigames.bungee_blitz', 0x0CC, 'I', NONZERO),
+  ('limbo.minigames.intro', 0x0D0, 'I', NONZERO),
+  ('limbo.minigames.tree', 0x0D4, 'I', NONZERO),
+  ('limbo.minigames.upsell', 0x0D8, 'I', NONZERO),
+)
+
+# Fields placed after the plant records, offsets relative to 0x334 + plant_count * 0x58
+TAIL_FIELDS = (
+  ('achievements.home_lawn_security', 0x00, 'H', NONZERO),
+  ('achievements.nobel_peas_prize', 0x02, 'H', NONZERO),
+  ('achievements.better_off_dead', 0x04, 'H', NONZERO),
+  ('achievements.china_shop', 0x06, 'H', NONZERO),
+  ('achievements.spudow!', 0x08, 'H', NONZERO),
+  ('achievements.explodonator', 0x0A, 'H', NONZERO),
+  ('achievements.morticulturalist', 0x0C, 'H', NONZERO),
+  ('achievements.dont_pea_in_the_pool', 0x0E, 'H', NONZERO),
+  ('achievements.roll_some_heads', 0x10, 'H', NONZERO),
+  ('achievements.grounded', 0x12, 'H', NONZERO),
+  ('achievements.zombologist', 0x14, 'H', NONZERO),
+  ('achievements.penny_pitcher', 0x16, 'H', NONZERO),
+  ('achievements.sunny_days', 0x18, 'H', NONZERO),
+  ('achievements.popcorn_party', 0x1A, 'H', NONZERO),
+  ('achievements.good_morning', 0x1C, 'H', NONZERO),
+  ('achievements.no_fungus_among_us', 0x1E, 'H', NONZERO),
+  ('achievements.beyond_the_grave', 0x20, 'H', NONZERO),
+  ('achievements.immortal', 0x22, 'H', NONZERO),
+  ('achievements.towering_wisdom', 0x24, 'H', NONZERO),
+  ('achievements.mustache_mode', 0x26, 'H', NONZERO),
+  ('zombatar.license', 0x28, 'I', FLAG),
+  ('zombatar.created_before', 0x59, 'I', FLAG),
+)
+
+# Fields of one zen garden plant record, offsets relative to the start of the record
+PLANT_FIELDS = (
+  ('type', 0x00, 'I', RAW),
+  ('location', 0x04, 'I', RAW),
+  ('pos', 0x08, '2I', RAW),
+  ('dir', 0x10, 'I', RAW),
+  ('last_watered', 0x18, 'I', RAW),
+  ('color', 0x20, 'I', RAW),
+  ('fertilized_amount', 0x24, 'I', RAW),
+  ('watered_amount', 0x28, 'I', RAW),
+  ('watered_need_amount', 0x2C, 'I', RAW),
+  ('happiness_need', 0x30, 'I', RAW),
+  ('last_phono', 0x38, 'I', RAW),
+  ('last_fertilized', 0x40, 'I', RAW),
+  ('last_choco', 0x48, 'I', RAW),
+)
+
+HEADER_REGIONS = ((0x004, 0x128), (0x1A0, 0x208), (0x2F4, 0x334))
+TAIL_REGIONS = ((0x00, 0x2C), (0x59, 0x5D))
+PLANT_REGIONS = ((0x00, PLANT_SIZE),)
+
+class Field(NamedTuple):
+  path: tuple
+  offset: int
+  struct: struct.Struct
+  transform: Transform
+  container: int
+  # number of values the field unpacks to, 2 for the plant position
+  count: int
+
+class Region(NamedTuple):
+  start: int
+  struct: struct.Struct
+  # (container, key, index into the unpacked values, number of values, decode)
+  slots: tuple
+
+class Layout(NamedTuple):
+  fields: tuple
+  # (parent container, key) of every nested dict, the root being container 0
+  containers: tuple
+  regions: tuple
+
+def compile_regions(fields, regions):
+  compiled = []
+  for start, end in regions:
+    members = sorted((field for field in fields if start <= field.offset < end), key=lambda field: field.offset)
+    format = '<'
+    cursor = start
+    count = 0
+    slots = []
+    by_offset = {}
+    for field in members:
+      if field.offset not in by_offset:
+        if field.offset < cursor:
+          raise ValueError(f"overlapping field at 0x{field.offset:X}")
+
+        if field.offset > cursor:
+          format += f"{field.offset - cursor}x"
+
+        by_offset[field.offset] = (count, field.count)
+        format += field.struct.format[1:]
+        cursor = field.offset + field.struct.size
+        count += field.count
+
+      index, values = by_offset[field.offset]
+      slots.append((field.container, field.path[-1], index, values, field.transform.decode))
+
+    if cursor > end:
+      raise ValueError(f"field crosses region end 0x{end:X}")
+
+    if cursor < end:
+      format += f"{end - cursor}x"
+
+    compiled.append(Region(start, struct.Struct(format), tuple(slots)))
+
+  if sum(len(region.slots) for region in compiled) != len(fields):
+    raise ValueError("fields outside of the declared regions")
+
+  return tuple(compiled)
+
+def compile_layout(table, regions):
+  containers = []
+  container_ids = {(): 0}
+  fields = []
+  for path, offset, type, transform in table:
+    path = tuple(path.split('.'))
+    for depth in range(1, len(path)):
+      if path[:depth] not in container_ids:
+        container_ids[path[:depth]] = len(containers) + 1
+        containers.append((container_ids[path[:(depth - 1)]], path[depth - 1]))
+
+    field_struct = struct.Struct('<' + type)
+    fields.append(Field(path, offset, field_struct, transform, container_ids[path[:-1]], len(field_struct.unpack(bytes(field_struct.size)))))
+
+  return Layout(tuple(fields), tuple(containers), compile_regions(fields, regions))
+
+HEADER = compile_layout(HEADER_FIELDS, HEADER_REGIONS)
+TAIL = compile_layout(TAIL_FIELDS, TAIL_REGIONS)
+PLANT = compile_layout(PLANT_FIELDS, PLANT_REGIONS)
+
+def _aliases(*tables):
+  by_offset = {}
+  for table, in_tail in tables:
+    for path, offset, type, transform in table:
+      by_offset.setdefault((in_tail, offset), []).append(tuple(path.split('.')))
+  return {path: tuple(other for other in paths if other != path) for paths in by_offset.values() if len(paths) > 1 for path in paths}
+
+# key path -> the other key paths stored in the same bytes, e.g. challenges.puzzles.vasebreaker and limbo.minigames.upsell
+ALIASES = _aliases((HEADER_FIELDS, False), (TAIL_FIELDS, True))
+PLANT_RECORD = PLANT.regions[0].struct
+
+PLANT_COUNT = struct.Struct('<I')
+
+def plant_count(buffer):
+  return PLANT_COUNT.unpack_from(buffer, PLANT_COUNT_OFFSET)[0]
+
+def tail_offset(count):
+  return PLANTS_OFFSET + count * PLANT_SIZE
+
+def decode_into(tree, layout, buffer, base=0):
+  nodes = [tree]
+  for parent, key in layout.containers:
+    node = nodes[parent].get(key)
+    if node is None:
+      node = nodes[parent][key] = {}
+    nodes.append(node)
+
+  for region in layout.regions:
+    values = region.struct.unpack_from(buffer, base + region.start)
+    for container, key, index, count, decode in region.slots:
+      nodes[container][key] = decode(values[index] if count == 1 else values[index:(index + count)])
+
+  return tree
+
+def decode_plant(values):
+  plant = {}
+  for _, key, index, count, decode in PLANT.regions[0].slots:
+    plant[key] = decode(values[index] if count == 1 else values[index:(index + count)])
+
+  return plant
+
+def encode_plant(plant, record=None):
+  record = bytearray(record if record is not None else PLANT_SIZE)
+  for field in PLANT.fields:
+    value = field.transform.encode(plant[field.path[-1]])
+    if field.count == 1:
+      field.struct.pack_into(record, field.offset, value)
+    else:
+      field.struct.pack_into(record, field.offset, *value)
+
+  return bytes(record)
+
+def decode_plants(buffer, count):
+  records = memoryview(buffer)[PLANTS_OFFSET:tail_offset(count)]
+  return [decode_plant(values) for values in PLANT_RECORD.iter_unpack(records)]
+
+def decode_user(buffer):
+  data = decode_into({}, HEADER, buffer)
+  count = plant_count(buffer)
+  decode_into(data, TAIL, buffer, tail_offset(count))
+  data['zen_garden']['plants'] = decode_plants(buffer, count)
+  return data
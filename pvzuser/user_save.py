@@ -0,0 +1,130 @@
+from .atomic_write import apply_patches, save_file
+from .records import FIELDS_BY_PATH, Record
+from .user_layout import ALIASES, PLANT_COUNT, PLANT_COUNT_OFFSET, PLANT_SIZE, PLANTS_OFFSET, tail_offset
+
+def _dirty_fields(user):
+  for path in user.dirty:
+    value = user.data
+    for key in path:
+      value = value[key]
+
+    if not isinstance(value, Record):
+      yield path, value
+      continue
+
+    stack = [value]
+    while stack:
+      record = stack.pop()
+      for attr, child in record._loaded():
+        if isinstance(child, Record):
+          stack.append(child)
+        else:
+          yield record._paths[attr], child
+
+def _field_patches(user, old_tail, new_tail):
+  patches = []
+  # aliased path -> bytes it stores, edits to fields sharing their bytes have to agree
+  aliased = {}
+  for path, value in _dirty_fields(user):
+    spec = FIELDS_BY_PATH.get(path)
+    if spec is None:
+      continue
+
+    field, in_tail = spec
+    raw = field.transform.encode(value)
+    packed = field.struct.pack(raw) if field.count == 1 else field.struct.pack(*raw)
+    if path in ALIASES:
+      for alias in ALIASES[path]:
+        if aliased.get(alias, packed) != packed:
+          raise ValueError(f"{'.'.join(path)} and {'.'.join(alias)} are stored in the same bytes and were changed to different values")
+      aliased[path] = packed
+
+    raw = field.struct.unpack_from(user.buffer, field.offset + (old_tail if in_tail else 0))
+    if field.transform.decode(raw[0] if field.count == 1 else raw) == value:
+      continue
+    patches.append((field.offset + (new_tail if in_tail else 0), packed))
+
+  return patches
+
+def _refresh_aliases(user, paths):
+  # fields sharing bytes with a saved field now hold what was written there
+  for path in paths:
+    for alias in ALIASES[path]:
+      record = user.data
+      for key in alias[:-1]:
+        record = record._peek(record._attrs[key])
+        if record is None:
+          break
+      else:
+        attr = record._attrs[alias[-1]]
+        if record._peek(attr) is not None:
+          field, in_tail = FIELDS_BY_PATH[alias]
+          raw = field.struct.unpack_from(user.buffer, field.offset + (user.tail_offset if in_tail else 0))
+          object.__setattr__(record, attr, field.transform.decode(raw[0] if field.count == 1 else raw))
+
+def _record_patches(plants, buffer):
+  patches = []
+  records = plants.tobytes()
+  for start in range(0, len(records), PLANT_SIZE):
+    new = records[start:(start + PLANT_SIZE)]
+    old = buffer[(PLANTS_OFFSET + start):(PLANTS_OFFSET + start + PLANT_SIZE)]
+    if new == old:
+      continue
+
+    first = next(i for i in range(PLANT_SIZE) if new[i] != old[i])
+    last = next(i for i in range(PLANT_SIZE - 1, -1, -1) if new[i] != old[i])
+    patches.append((PLANTS_OFFSET + start + first, new[first:(last + 1)]))
+
+  return patches
+
+def merge_patches(patches):
+  merged = []
+  for offset, data in sorted(patches, key=lambda patch: patch[0]):
+    if merged and offset <= merged[-1][0] + len(merged[-1][1]):
+      start, chunk = merged[-1]
+      chunk[(offset - start):(offset - start + len(data))] = data
+    else:
+      merged.append((offset, bytearray(data)))
+
+  return [(offset, bytes(data)) for offset, data in merged]
+
+def diff_user(user):
+  buffer = user.buffer
+  old_count = user.plant_count
+  zen_garden = user.data._peek('zen_garden')
+  plants = zen_garden._peek('plants') if zen_garden is not None else None
+  new_count = old_count if plants is None else len(plants)
+
+  if new_count != old_count:
+    old_tail = tail_offset(old_count)
+    layout = bytearray()
+    layout += buffer[:PLANTS_OFFSET]
+    PLANT_COUNT.pack_into(layout, PLANT_COUNT_OFFSET, new_count)
+    layout += plants.tobytes()
+    layout += buffer[old_tail:]
+    for offset, patch in _field_patches(user, old_tail, tail_offset(new_count)):
+      layout[offset:(offset + len(patch))] = patch
+    return bytes(layout), []
+
+  patches = _field_patches(user, user.tail_offset, user.tail_offset)
+  if plants is not None:
+    patches += _record_patches(plants, buffer)
+
+  return None, merge_patches(patches)
+
+def save_user(user, filepath, use_mmap=False):
+  layout, patches = diff_user(user)
+  aliased = [path for path, _ in _dirty_fields(user) if path in ALIASES]
+  if layout is not None:
+    written = save_file(filepath, layout)
+    user.rebase(layout)
+    _refresh_aliases(user, aliased)
+    return written
+
+  if not patches:
+    return 0
+
+  written = save_file(filepath, base=user.buffer, patches=patches, use_mmap=use_mmap)
+  user.rebase(apply_patches(user.buffer, patches))
+  _refresh_aliases(user, aliased)
+  return written
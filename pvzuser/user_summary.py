@@ -0,0 +1,27 @@
+from typing import NamedTuple
+from .user_layout import HEADER, PLANT_COUNT, PLANT_COUNT_OFFSET
+
+class UserSummary(NamedTuple):
+  level: int
+  money: int
+  plant_count: int
+
+  def level_name(self):
+    level = max(self.level, 1) - 1
+    return f"{level // 10 + 1}-{level % 10 + 1}"
+
+  def __str__(self) -> str:
+    return f"Level {self.level_name()}, ${self.money:,}, {self.plant_count} plant{'' if self.plant_count == 1 else 's'}"
+
+SUMMARY_FIELDS = tuple(field for field in HEADER.fields if field.path in (('general', 'level'), ('general', 'money')))
+# the summary fields all sit at the start of the file, the plant count is read separately
+SUMMARY_SIZE = max(field.offset + field.struct.size for field in SUMMARY_FIELDS)
+
+def read_summary(filepath):
+  with open(filepath, 'rb') as file:
+    head = file.read(SUMMARY_SIZE)
+    file.seek(PLANT_COUNT_OFFSET)
+    count = file.read(PLANT_COUNT.size)
+
+  values = {field.path[-1]: field.transform.decode(field.struct.unpack_from(head, field.offset)[0]) for field in SUMMARY_FIELDS}
+  return UserSummary(values['level'], values['money'], PLANT_COUNT.unpack(count)[0])
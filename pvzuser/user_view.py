@@ -0,0 +1,175 @@
+import os
+import copy
+import mmap
+from collections.abc import Mapping
+from .user_layout import PLANTS_OFFSET, plant_count, tail_offset
+from .plant_table import PlantTable
+from .records import Record, UserData, decode_data
+
+class UserView(Mapping):
+  def __init__(self, buffer, name='', index=0) -> None:
+    self.name = name
+    self.index = index
+    self.buffer = memoryview(buffer)
+    self.__source = buffer
+    self.__plant_count = None
+    self.__data = None
+    # key path -> value it had in the buffer, for every field written since the last save
+    self.dirty = {}
+    self.__plants_checked = None
+
+  @classmethod
+  def open(cls, filepath, name='', index=0, use_mmap=False):
+    if use_mmap:
+      with open(filepath, 'rb') as file:
+        try:
+          return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), name, index)
+        except ValueError:
+          pass
+
+    return cls(filepath.read_bytes(), name, index)
+
+  @classmethod
+  def read(cls, filepath, name='', index=0, progress=None, is_cancelled=None, chunk_size=0x10000):
+    with open(filepath, 'rb') as file:
+      size = os.fstat(file.fileno()).st_size
+      buffer = bytearray(size)
+      view = memoryview(buffer)
+      done = 0
+      while done < size:
+        if is_cancelled is not None and is_cancelled():
+          return None
+
+        read = file.readinto(view[done:(done + chunk_size)])
+        if not read:
+          break
+        done += read
+        if progress is not None:
+          progress(done, size)
+
+    view.release()
+    del buffer[done:]
+    return cls(bytes(buffer), name, index)
+
+  def rebase(self, buffer):
+    self.close()
+    self.buffer = memoryview(buffer)
+    self.__source = buffer
+    self.__plant_count = None
+    self.mark_clean()
+
+  def track(self, path, record, attr, value):
+    dirty = self.dirty
+    if path in dirty:
+      if dirty[path] == value:
+        del dirty[path]
+      return
+
+    original = getattr(record, attr)
+    if original != value:
+      dirty[path] = original
+
+  def mark_clean(self):
+    self.dirty.clear()
+    self.__plants_checked = None
+
+  def __plants_changed(self):
+    zen_garden = self.data._peek('zen_garden')
+    plants = zen_garden._peek('plants') if zen_garden is not None else None
+    if plants is None:
+      return False
+
+    checked = self.__plants_checked
+    if checked is None or checked[0] is not plants or checked[1] != plants.version:
+      checked = self.__plants_checked = (plants, plants.version, plants.tobytes() != self.buffer[PLANTS_OFFSET:self.tail_offset])
+    return checked[2]
+
+  @property
+  def has_changes(self):
+    return bool(self.dirty) or self.__plants_changed()
+
+  def changed_paths(self):
+    paths = ['.'.join(path) for path in self.dirty]
+    if ('zen_garden', 'plants') not in self.dirty and self.__plants_changed():
+      paths.append('zen_garden.plants')
+    return paths
+
+  def close(self):
+    self.buffer.release()
+    if isinstance(self.__source, mmap.mmap):
+      self.__source.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  @property
+  def plant_count(self):
+    if self.__plant_count is None:
+      self.__plant_count = plant_count(self.buffer)
+    return self.__plant_count
+
+  @property
+  def tail_offset(self):
+    return tail_offset(self.plant_count)
+
+  @property
+  def data(self):
+    if self.__data is None:
+      self.__data = UserData(self)
+    return self.__data
+
+  def load_plants(self):
+    return PlantTable.from_buffer(self.buffer, self.plant_count)
+
+  def __getitem__(self, key):
+    if key == 'index':
+      return self.index
+    if key == 'data':
+      return self.data
+    raise KeyError(key)
+
+  def __iter__(self):
+    return iter(('index', 'data'))
+
+  def __len__(self):
+    return 2
+
+  def __repr__(self) -> str:
+    return f"UserView(name={self.name!r}, index={self.index})"
+
+  def to_dict(self):
+    # nothing was read or edited through the records yet, so the file is decoded eagerly into plain dicts
+    if self.__data is None:
+      return { 'index': self.index, 'data': decode_data(self) }
+    return { 'index': self.index, 'data': self.data.to_dict() }
+
+  @property
+  def baseline(self):
+    return self.__source if isinstance(self.__source, bytes) else bytes(self.buffer)
+
+  def snapshot(self):
+    user = UserView(self.__source, self.name, self.index)
+    user.__plant_count = self.__plant_count
+    for path in self.dirty:
+      value = self.data
+      target = user.data
+      for key in path[:-1]:
+        value = value[key]
+        target = target[key]
+      value = value[path[-1]]
+      target[path[-1]] = value._copy(user, {}) if isinstance(value, Record) else copy.deepcopy(value)
+
+    if ('zen_garden', 'plants') not in self.dirty and self.__plants_changed():
+      user.data.zen_garden.plants = self.data.zen_garden.plants.copy()
+    return user
+
+  def __deepcopy__(self, memo):
+    user = UserView(self.__source, self.name, self.index)
+    user.__plant_count = self.__plant_count
+    user.dirty = copy.deepcopy(self.dirty, memo)
+    if self.__data is not None:
+      user.__data = self.__data._copy(user, memo)
+    return user
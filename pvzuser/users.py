@@ -0,0 +1,36 @@
+import struct
+from .binary import FileBinaryReader
+
+USERS_VERSION = 0x0E
+USER_ENTRY = struct.Struct("<II")
+
+def read_users_index(userdata_path):
+  # pathlib pulls in re, urllib and ipaddress, it is only imported once users.dat is actually read
+  import pathlib
+  userdata_path = pathlib.Path(userdata_path)
+  users = []
+  reader = FileBinaryReader(userdata_path.joinpath("users.dat").read_bytes())
+
+  if reader.read_uint32() != USERS_VERSION:
+    return users
+
+  count = reader.read_uint16()
+  for _ in range(count):
+    name = reader.read_string()
+    unknown0, user_index = reader.read_struct(USER_ENTRY)
+    users.append({ 'name': name, 'user_index': user_index, 'unknown0': unknown0, 'filepath': userdata_path.joinpath(f"user{user_index}.dat") })
+
+  return users
+
+# the user file modules pull in the plant table and numpy, they are imported on first use so
+# reading users.dat and the summaries stays cheap
+def load_user(name, user_index, filepath, use_mmap=False, progress=None, is_cancelled=None):
+  import pathlib
+  from .user_view import UserView
+  if progress is None and is_cancelled is None:
+    return UserView.open(pathlib.Path(filepath), name, user_index, use_mmap)
+  return UserView.read(filepath, name, user_index, progress, is_cancelled)
+
+def save_user(user, filepath, use_mmap=False):
+  from .user_save import save_user
+  return save_user(user, filepath, use_mmap)
@@ -1,9 +1,22 @@
 import os
-import struct
 import pathlib
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 import ui.ui_select_dialog
 from utils import *
+from workers import Worker, start
+import tracing
+from pvzuser.user_cache import UserCache
+
+@tracing.traced('read_user_list')
+def read_user_list(userdata_path, cache, progress=None, is_cancelled=None):
+  users = cache.cached(userdata_path.joinpath("users.dat"), 'users', lambda : [[user['name'], user['user_index'], user['unknown0']] for user in read_users_index(userdata_path)])
+  return [{ 'name': name, 'user_index': user_index, 'unknown0': unknown0, 'filepath': userdata_path.joinpath(f"user{user_index}.dat") } for name, user_index, unknown0 in users]
+
+@tracing.traced('read_user_summary')
+def read_user_summary(filepath, cache, progress=None, is_cancelled=None):
+  # loads the header layout on the first summary instead of at startup
+  from pvzuser import UserSummary, read_summary
+  return UserSummary(*cache.cached(filepath, 'summary', lambda : list(read_summary(filepath))))
 
 class SelectUserDialog(QtWidgets.QDialog, ui.ui_select_dialog.Ui_SelectUserDialog):
   def __init__(self):
@@ -13,6 +26,13 @@ class SelectUserDialog(QtWidgets.QDialog, ui.ui_select_dialog.Ui_SelectUserDialo
     self.setWindowTitle("Select a User")
 
     self.settings_path = pathlib.Path("pvz_user_editor_settings.dat")
+    self.cache = UserCache(self.settings_path.with_name("pvz_user_editor_cache.json"))
+    self.user_list = []
+    self.summaries = {}
+    self.scanner = None
+    self.summary_workers = []
+    self.summary_pool = QtCore.QThreadPool(self)
+    self.summary_pool.setMaxThreadCount(8)
 
     self.add_btn.setVisible(False)
     self.del_btn.setVisible(False)
@@ -27,6 +47,7 @@ class SelectUserDialog(QtWidgets.QDialog, ui.ui_select_dialog.Ui_SelectUserDialo
 
   def __select_user(self):
     self.user = self.user_list[self.listWidget.currentRow()]
+    tracing.instant('select', user=self.user['name'])
     self.accept()
 
   def __browse_folder(self):
@@ -68,35 +89,62 @@ class SelectUserDialog(QtWidgets.QDialog, ui.ui_select_dialog.Ui_SelectUserDialo
       self.__load()
       return
 
-  def __load_user_list(self, filebytes, userdata_path):
-    self.user_list = []
-    reader = FileBinaryReader(filebytes)
-
-    if reader.read_uint32() != 0x0E:
-      return
+  def __cancel_scan(self):
+    if self.scanner is not None:
+      self.scanner.cancel()
+      self.scanner = None
 
-    count = reader.read_uint16()
-    for _ in range(count):
-      name = reader.read_string()
-      unknown0 = reader.read_uint32()
-      user_index = reader.read_uint32()
-      self.user_list.append({ 'name': name, 'user_index': user_index, 'unknown0': unknown0, 'filepath': userdata_path.joinpath(f"user{user_index}.dat") })
+    self.summary_pool.clear()
+    for worker in self.summary_workers:
+      worker.cancel()
+    self.summary_workers = []
 
   def __load(self):
     userdata_path = pathlib.Path(self.userdata_lineedit.text())
     users_path = userdata_path.joinpath("users.dat")
 
     if users_path.exists() and users_path.is_file():
-      filebytes = users_path.read_bytes()
-      
-      self.__load_user_list(filebytes, userdata_path)
-
-      self.listWidget.clear()
-        
-      for user in self.user_list:
-        self.listWidget.addItem(f"{user['name']}")
+      self.__cancel_scan()
+      self.rel_btn.setEnabled(False)
+      self.scanner = Worker(read_user_list, userdata_path, self.cache)
+      self.scanner.signals.finished.connect(self.__users_loaded)
+      self.scanner.signals.failed.connect(lambda error : self.__users_loaded([]))
+      start(self.scanner)
+
+  def __users_loaded(self, user_list):
+    self.scanner = None
+    self.user_list = user_list
+    self.summaries = {}
+
+    self.listWidget.clear()
+
+    for user in self.user_list:
+      self.listWidget.addItem(f"{user['name']}")
+
+    self.rel_btn.setEnabled(True)
+    if len(self.user_list) > 0:
+      self.listWidget.setCurrentItem(self.listWidget.item(0))
+      self.sel_btn.setEnabled(True)
+
+    for row, user in enumerate(self.user_list):
+      worker = Worker(read_user_summary, user['filepath'], self.cache)
+      worker.signals.finished.connect(lambda summary, row=row, worker=worker : self.__summary_loaded(worker, row, summary))
+      worker.signals.failed.connect(lambda error, row=row, worker=worker : self.__summary_loaded(worker, row, None))
+      self.summary_workers.append(worker)
+      start(worker, self.summary_pool)
+
+  def __summary_loaded(self, worker, row, summary):
+    if worker.is_cancelled():
+      return
 
-      if len(self.user_list) > 0:
-        self.listWidget.setCurrentItem(self.listWidget.item(0))
-        self.sel_btn.setEnabled(True)
-        self.rel_btn.setEnabled(True)
\ No newline at end of file
+    self.summaries[row] = summary
+    self.listWidget.item(row).setText(f"{self.user_list[row]['name']}" + (" (unreadable)" if summary is None else f" - {summary}"))
+
+  def done(self, result):
+    self.__cancel_scan()
+    self.summary_pool.waitForDone()
+    try:
+      self.cache.save()
+    except OSError:
+      pass
+    super().done(result)
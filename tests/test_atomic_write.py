@@ -0,0 +1,21 @@
+import os
+import stat
+import pytest
+from pvzuser.atomic_write import NEW_FILE_MODE, write_atomic
+
+@pytest.mark.skipif(os.name != 'posix', reason="permission bits are only kept on posix")
+def test_new_file_follows_umask(tmp_path):
+  filepath = tmp_path / 'new.json'
+  write_atomic(filepath, b'{}')
+  assert filepath.read_bytes() == b'{}'
+  assert stat.S_IMODE(filepath.stat().st_mode) == NEW_FILE_MODE
+
+@pytest.mark.skipif(os.name != 'posix', reason="permission bits are only kept on posix")
+def test_existing_file_keeps_mode(tmp_path):
+  filepath = tmp_path / 'user1.dat'
+  filepath.write_bytes(b'old')
+  filepath.chmod(0o640)
+  write_atomic(filepath, b'new')
+  assert filepath.read_bytes() == b'new'
+  assert stat.S_IMODE(filepath.stat().st_mode) == 0o640
+  assert [path.name for path in tmp_path.iterdir()] == ['user1.dat']
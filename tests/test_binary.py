@@ -0,0 +1,37 @@
+import io
+import struct
+import pytest
+from pvzuser.binary import FileBinaryReader, FileBinaryWriter
+
+def test_round_trip():
+  writer = FileBinaryWriter(capacity=4)
+  writer.write_uint32(7)
+  writer.write_strings(['Player', '', 'Ärger'])
+  writer.write_records('<HI', [(1, 2), (3, 4)])
+  writer.write_bytes(b'\x01\x02')
+
+  reader = FileBinaryReader(writer.getvalue())
+  assert reader.read_uint32() == 7
+  assert [reader.read_string() for _ in range(3)] == ['Player', '', 'Ärger']
+  assert reader.read_uint16() == 1 and reader.read_uint32() == 2
+  assert reader.read_uint16() == 3 and reader.read_uint32() == 4
+  assert reader.read_uint16() == 0x0201
+
+@pytest.mark.parametrize('write', [
+  lambda writer: writer.write_uint16(70000),
+  lambda writer: writer.write_uint32(-1),
+  lambda writer: writer.write_struct(struct.Struct('<HH'), 1, 'x'),
+  lambda writer: writer.write_records('<HI', [(1, 2), (3, -4)]),
+  lambda writer: writer.write_string('x' * 70000),
+])
+def test_failed_write_leaves_nothing(write):
+  file = io.BytesIO()
+  writer = FileBinaryWriter(file)
+  writer.write_string('Player')
+  before = writer.getvalue()
+  with pytest.raises(struct.error):
+    write(writer)
+  assert writer.pending == len(before)
+  writer.write_uint16(5)
+  writer.flush()
+  assert file.getvalue() == before + b'\x05\x00'
@@ -0,0 +1,18 @@
+from fixtures import write_userdata
+from pvzuser.export import find_users
+
+def test_find_users(tmp_path):
+  write_userdata(tmp_path / 'userdata', 3)
+  users = list(find_users([tmp_path]))
+  assert [user['name'][:7] for user in users] == ['Player0', 'Player1', 'Player2']
+  assert [user['user_index'] for user in users] == [0, 1, 2]
+
+def test_truncated_users_index_is_reported(tmp_path):
+  (tmp_path / 'broken').mkdir()
+  (tmp_path / 'broken' / 'users.dat').write_bytes(b'\x0e\x00\x00\x00\x05\x00\x09')
+  write_userdata(tmp_path / 'userdata', 1)
+
+  users = list(find_users([tmp_path]))
+  assert users[0]['userdata'] == str(tmp_path / 'broken')
+  assert users[0]['error'].startswith('error: ')
+  assert users[1]['user_index'] == 0
@@ -0,0 +1,23 @@
+import pytest
+from pvzuser.patch import PatchSpecError, compile_spec
+
+@pytest.mark.parametrize('spec', ['general.money = "abc"', 'general.level = -1', 'general.shop.slots = [1, 2]', 'nothing.here = 1'])
+def test_invalid_values_are_spec_errors(spec):
+  with pytest.raises(PatchSpecError):
+    compile_spec(spec)
+
+# challenges.puzzles.vasebreaker and limbo.minigames.upsell are both stored at 0x0D8
+@pytest.mark.parametrize('spec, expected', [
+  ('challenges.puzzles.vasebreaker = true, limbo.minigames.upsell = false', b'\x00\x00\x00\x00'),
+  ('limbo.minigames.upsell = false, challenges.puzzles.vasebreaker = true', b'\x01\x00\x00\x00'),
+  ('limbo.minigames.upsell = true, challenges.puzzles.vasebreaker = false', b'\x00\x00\x00\x00'),
+])
+def test_last_assignment_wins_on_shared_offsets(spec, expected):
+  patches = [patch for patch in compile_spec(spec) if patch[0] == 0x0D8]
+  assert patches == [(0x0D8, False, expected)]
+
+def test_suffix_names_a_single_field():
+  assert compile_spec('shop.plants.imitater = true') == compile_spec('general.shop.plants.imitater = true')
+  with pytest.raises(PatchSpecError, match='ambiguous'):
+    compile_spec('roof = 3')
+  assert len(compile_spec('hard.* = 3')) > 1
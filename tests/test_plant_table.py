@@ -0,0 +1,31 @@
+import pytest
+from fixtures import make_user
+from pvzuser import plant_table
+from pvzuser.plant_table import PlantTable
+
+@pytest.fixture(params=['numpy', 'array'])
+def plants(request, monkeypatch):
+  if request.param == 'numpy':
+    pytest.importorskip('numpy')
+  else:
+    monkeypatch.setattr(plant_table, 'numpy', None)
+  return PlantTable.from_buffer(make_user(5, 5), 5)
+
+def test_column_does_not_write_through(plants):
+  before = plants.tobytes()
+  column = plants.column('color')
+  try:
+    column[0] = 7
+  except ValueError:
+    pass
+  assert plants.tobytes() == before
+  assert plants.version == 0
+
+def test_boolean_mask_must_cover_the_table(plants):
+  assert plants.indices([False, True, False, False, True]) == [1, 4]
+  with pytest.raises(ValueError):
+    plants.indices([True, False])
+
+def test_index_selector(plants):
+  assert plants.indices([3, 1]) == [3, 1]
+  assert plants.indices([]) == []
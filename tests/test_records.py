@@ -0,0 +1,28 @@
+import pytest
+from fixtures import make_user
+from pvzuser.records import deep_equals
+from pvzuser.user_view import UserView
+
+@pytest.mark.parametrize('value0, value1, equal', [
+  ({'a': 1, 'b': [1, (2, 3)]}, {'a': 1, 'b': [1, (2, 3)]}, True),
+  ({'a': 1}, {'a': 2}, False),
+  ({'a': 1}, {'b': 1}, False),
+  ({'a': 1}, {'a': 1, 'b': 2}, False),
+  ({'a': [1, 2]}, {'a': [1]}, False),
+  ({'a': [1, 2]}, {'a': (1, 2)}, False),
+  ({'a': {'b': 1}}, {'a': [1]}, False),
+  ({'a': 1}, {'a': None}, False),
+  (None, None, False),
+  (1, 1, True),
+])
+def test_deep_equals(value0, value1, equal):
+  assert deep_equals(value0, value1) is equal
+  assert deep_equals(value1, value0) is equal
+
+def test_deep_equals_records():
+  buffer = make_user(2, 2)
+  user0 = UserView(buffer)
+  user1 = UserView(buffer)
+  assert deep_equals(user0.data, user1.to_dict()['data'])
+  user0.data.general.money += 10
+  assert not deep_equals(user0.data.general, user1.to_dict()['data']['general'])
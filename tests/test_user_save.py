@@ -0,0 +1,162 @@
+import struct
+import pytest
+from fixtures import make_user
+from pvzuser import load_user, save_user
+from pvzuser.user_layout import HEADER_FIELDS, PLANT_COUNT_OFFSET, PLANT_FIELDS, PLANT_SIZE, PLANTS_OFFSET, TAIL_FIELDS, tail_offset
+
+# decodes every field on its own straight from the tables, independent of the compiled regions and the records
+def reference_decode(buffer):
+  def decode_fields(tree, fields, base):
+    for path, offset, type, transform in fields:
+      raw = struct.unpack_from('<' + type, buffer, base + offset)
+      node = tree
+      *parents, key = path.split('.')
+      for parent in parents:
+        node = node.setdefault(parent, {})
+      node[key] = transform.decode(raw[0] if len(raw) == 1 else raw)
+    return tree
+
+  count = struct.unpack_from('<I', buffer, PLANT_COUNT_OFFSET)[0]
+  data = decode_fields({}, HEADER_FIELDS, 0)
+  decode_fields(data, TAIL_FIELDS, tail_offset(count))
+  data['zen_garden']['plants'] = [decode_fields({}, PLANT_FIELDS, PLANTS_OFFSET + index * PLANT_SIZE) for index in range(count)]
+  return data
+
+def plant_dict(plant):
+  return {key: plant[key] for key in plant}
+
+@pytest.fixture
+def user_file(tmp_path):
+  def write(plants, seed=0):
+    filepath = tmp_path / f"user{plants}.dat"
+    filepath.write_bytes(make_user(plants, seed))
+    return filepath
+  return write
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+@pytest.mark.parametrize('plants', [0, 1, 200])
+def test_field_patches(user_file, plants, use_mmap):
+  filepath = user_file(plants, plants)
+  original = filepath.read_bytes()
+  expected = reference_decode(original)
+
+  user = load_user('test', 0, filepath, use_mmap)
+  user.data.general.money = expected['general']['money'] + 120
+  user.data.general.shop.plants.cattail = not expected['general']['shop']['plants']['cattail']
+  user.data.challenges.survivals.hard.roof = 3
+  user.data.achievements['spudow!'] = not expected['achievements']['spudow!']
+  user.data.zombatar.license = not expected['zombatar']['license']
+  expected['general']['money'] += 120
+  expected['general']['shop']['plants']['cattail'] = not expected['general']['shop']['plants']['cattail']
+  expected['challenges']['survivals']['hard']['roof'] = 3
+  expected['achievements']['spudow!'] = not expected['achievements']['spudow!']
+  expected['zombatar']['license'] = not expected['zombatar']['license']
+
+  assert save_user(user, filepath, use_mmap) > 0
+  assert not user.has_changes
+  saved = filepath.read_bytes()
+  assert len(saved) == len(original)
+  assert reference_decode(saved) == expected
+  assert saved == bytes(user.buffer)
+  user.close()
+
+  reloaded = load_user('test', 0, filepath)
+  assert reloaded.data.general.money == expected['general']['money']
+  assert reloaded.data.achievements['spudow!'] == expected['achievements']['spudow!']
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_plant_patches(user_file, use_mmap):
+  filepath = user_file(32, 5)
+  expected = reference_decode(filepath.read_bytes())
+
+  user = load_user('test', 0, filepath, use_mmap)
+  plants = user.data.zen_garden.plants
+  plants[3] = plants[3].replace(color=5, pos=(2, 1))
+  expected['zen_garden']['plants'][3].update(color=5, pos=(2, 1))
+
+  save_user(user, filepath, use_mmap)
+  user.close()
+  assert reference_decode(filepath.read_bytes()) == expected
+
+@pytest.mark.parametrize('change', ['duplicate', 'delete', 'clear'])
+def test_plant_count_change_moves_tail(user_file, change):
+  filepath = user_file(7, 7)
+  original = filepath.read_bytes()
+  expected = reference_decode(original)
+  expected_plants = expected['zen_garden']['plants']
+
+  user = load_user('test', 0, filepath)
+  plants = user.data.zen_garden.plants
+  if change == 'duplicate':
+    plants.duplicate(2)
+    expected_plants.insert(3, dict(expected_plants[2]))
+  elif change == 'delete':
+    plants.delete([0, 4, 5])
+    del expected_plants[4:6]
+    del expected_plants[0]
+  else:
+    plants.delete(range(len(plants)))
+    expected_plants.clear()
+  # tail fields written in the same save land at the new tail offset
+  user.data.achievements.grounded = not expected['achievements']['grounded']
+  user.data.general.level = 42
+  expected['achievements']['grounded'] = not expected['achievements']['grounded']
+  expected['general']['level'] = 42
+
+  save_user(user, filepath)
+  saved = filepath.read_bytes()
+  assert len(saved) == len(original) - tail_offset(7) + tail_offset(len(expected_plants))
+  assert reference_decode(saved) == expected
+  assert not user.has_changes
+
+  reloaded = load_user('test', 0, filepath)
+  assert reloaded.plant_count == len(expected_plants)
+  assert [plant_dict(plant) for plant in reloaded.data.zen_garden.plants] == expected_plants
+
+def test_unchanged_user_is_not_written(user_file):
+  filepath = user_file(1)
+  original = filepath.read_bytes()
+  user = load_user('test', 0, filepath)
+  user.data.general.money = user.data.general.money
+
+  assert save_user(user, filepath) == 0
+  assert filepath.read_bytes() == original
+
+def test_consecutive_saves(user_file):
+  filepath = user_file(3, 3)
+  expected = reference_decode(filepath.read_bytes())
+
+  user = load_user('test', 0, filepath)
+  user.data.general.money = 500
+  save_user(user, filepath)
+  user.data.zen_garden.plants.duplicate(0)
+  user.data.general.money = 700
+  save_user(user, filepath)
+  user.data.zen_garden.plants.delete([1])
+  save_user(user, filepath)
+
+  expected['general']['money'] = 700
+  assert reference_decode(filepath.read_bytes()) == expected
+
+def test_aliased_fields_follow_save(user_file):
+  filepath = user_file(0)
+  user = load_user('test', 0, filepath)
+  user.data.challenges.puzzles.vasebreaker = True
+  user.data.limbo.minigames.upsell = True
+  save_user(user, filepath)
+
+  user.data.limbo.minigames.upsell = False
+  assert save_user(user, filepath) > 0
+  assert user.data.challenges.puzzles.vasebreaker is False
+  assert reference_decode(filepath.read_bytes())['challenges']['puzzles']['vasebreaker'] is False
+
+def test_conflicting_aliased_edits(user_file):
+  filepath = user_file(0)
+  original = filepath.read_bytes()
+  user = load_user('test', 0, filepath)
+  minigames = user.data.limbo.minigames
+  user.data.challenges.puzzles.vasebreaker = not minigames.upsell
+  user.data.limbo.minigames = minigames.replace(sunny_day=not minigames.sunny_day)
+  with pytest.raises(ValueError, match='same bytes'):
+    save_user(user, filepath)
+  assert filepath.read_bytes() == original
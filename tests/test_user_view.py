@@ -0,0 +1,19 @@
+import pytest
+from fixtures import make_user
+from pvzuser.records import deep_equals
+from pvzuser.user_view import UserView
+
+@pytest.mark.parametrize('plants', [0, 1, 32, 200])
+def test_eager_decode_matches_records(plants):
+  buffer = make_user(plants, plants)
+  eager = UserView(buffer, 'test', 3).to_dict()
+  user = UserView(buffer, 'test', 3)
+  user.data.general.shop
+  assert deep_equals(eager, user.to_dict())
+  assert eager['data']['general']['name'] == 'test'
+  assert len(eager['data']['zen_garden']['plants']) == plants
+
+def test_to_dict_keeps_edits():
+  user = UserView(make_user(1, 1))
+  user.data.general.money = 4560
+  assert user.to_dict()['data']['general']['money'] == 4560
@@ -0,0 +1,99 @@
+import os
+import json
+import time
+import atexit
+import functools
+import threading
+from pvzuser.atomic_write import write_atomic
+
+TRACE_ENV = 'PVZ_TRACE'
+
+# trace events recorded so far, None while tracing is off so every hook is a single global check
+_events = None
+_origin = 0
+_path = None
+_threads = {}
+
+class _NullSpan:
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    return False
+
+NULL_SPAN = _NullSpan()
+
+class Span:
+  __slots__ = ('name', 'args', 'start')
+
+  def __init__(self, name, args) -> None:
+    self.name = name
+    self.args = args
+    self.start = 0
+
+  def __enter__(self):
+    self.start = time.perf_counter_ns()
+    return self
+
+  def __exit__(self, *args):
+    _record('X', self.name, self.start, time.perf_counter_ns() - self.start, self.args)
+    return False
+
+def enable(path):
+  global _events, _origin, _path
+  if _events is None:
+    _events = []
+    _origin = time.perf_counter_ns()
+    atexit.register(write)
+  _path = path
+
+def enable_from_env():
+  if os.environ.get(TRACE_ENV):
+    enable(os.environ[TRACE_ENV])
+
+def is_enabled():
+  return _events is not None
+
+def span(name, **args):
+  if _events is None:
+    return NULL_SPAN
+  return Span(name, args)
+
+def traced(name):
+  def decorate(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+      if _events is None:
+        return fn(*args, **kwargs)
+      with Span(name, {}):
+        return fn(*args, **kwargs)
+    return wrapper
+  return decorate
+
+def instant(name, **args):
+  if _events is not None:
+    _record('i', name, time.perf_counter_ns(), 0, args)
+
+def _record(phase, name, start, duration, args):
+  thread = threading.current_thread()
+  _threads[thread.ident] = thread.name
+  event = { 'name': name, 'ph': phase, 'ts': (start - _origin) / 1000, 'pid': os.getpid(), 'tid': thread.ident }
+  if phase == 'X':
+    event['dur'] = duration / 1000
+  else:
+    event['s'] = 't'
+  if args:
+    event['args'] = args
+  _events.append(event)
+
+def trace_events():
+  pid = os.getpid()
+  names = [{ 'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': { 'name': name } } for tid, name in list(_threads.items())]
+  return names + list(_events or ())
+
+def write(path=None):
+  path = path or _path
+  if _events is None or path is None:
+    return
+
+  write_atomic(path, json.dumps({ 'traceEvents': trace_events(), 'displayTimeUnit': 'ms' }).encode('utf-8'))
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'edit_window_achievements.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QGridLayout, QHBoxLayout,
+    QLayout, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_AchievementsTab(object):
+    def setupUi(self, tab_3):
+        if not tab_3.objectName():
+            tab_3.setObjectName(u"tab_3")
+        self.gridLayout_15 = QGridLayout(tab_3)
+        self.gridLayout_15.setObjectName(u"gridLayout_15")
+        self.verticalLayout_5 = QVBoxLayout()
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.gridLayout_14 = QGridLayout()
+        self.gridLayout_14.setObjectName(u"gridLayout_14")
+        self.gridLayout_14.setSizeConstraint(QLayout.SetDefaultConstraint)
+        self.gridLayout_14.setVerticalSpacing(4)
+        self.a_1 = QCheckBox(tab_3)
+        self.a_1.setObjectName(u"a_1")
+
+        self.gridLayout_14.addWidget(self.a_1, 0, 0, 1, 1)
+
+        self.a_2 = QCheckBox(tab_3)
+        self.a_2.setObjectName(u"a_2")
+
+        self.gridLayout_14.addWidget(self.a_2, 0, 1, 1, 1)
+
+        self.a_3 = QCheckBox(tab_3)
+        self.a_3.setObjectName(u"a_3")
+
+        self.gridLayout_14.addWidget(self.a_3, 1, 0, 1, 1)
+
+        self.a_4 = QCheckBox(tab_3)
+        self.a_4.setObjectName(u"a_4")
+
+        self.gridLayout_14.addWidget(self.a_4, 1, 1, 1, 1)
+
+        self.a_5 = QCheckBox(tab_3)
+        self.a_5.setObjectName(u"a_5")
+
+        self.gridLayout_14.addWidget(self.a_5, 2, 0, 1, 1)
+
+        self.a_6 = QCheckBox(tab_3)
+        self.a_6.setObjectName(u"a_6")
+
+        self.gridLayout_14.addWidget(self.a_6, 2, 1, 1, 1)
+
+        self.a_7 = QCheckBox(tab_3)
+        self.a_7.setObjectName(u"a_7")
+
+        self.gridLayout_14.addWidget(self.a_7, 3, 0, 1, 1)
+
+        self.a_8 = QCheckBox(tab_3)
+        self.a_8.setObjectName(u"a_8")
+
+        self.gridLayout_14.addWidget(self.a_8, 3, 1, 1, 1)
+
+        self.a_9 = QCheckBox(tab_3)
+        self.a_9.setObjectName(u"a_9")
+
+        self.gridLayout_14.addWidget(self.a_9, 4, 0, 1, 1)
+
+        self.a_10 = QCheckBox(tab_3)
+        self.a_10.setObjectName(u"a_10")
+
+        self.gridLayout_14.addWidget(self.a_10, 4, 1, 1, 1)
+
+        self.a_11 = QCheckBox(tab_3)
+        self.a_11.setObjectName(u"a_11")
+
+        self.gridLayout_14.addWidget(self.a_11, 5, 0, 1, 1)
+
+        self.a_12 = QCheckBox(tab_3)
+        self.a_12.setObjectName(u"a_12")
+
+        self.gridLayout_14.addWidget(self.a_12, 5, 1, 1, 1)
+
+        self.a_13 = QCheckBox(tab_3)
+        self.a_13.setObjectName(u"a_13")
+
+        self.gridLayout_14.addWidget(self.a_13, 6, 0, 1, 1)
+
+        self.a_14 = QCheckBox(tab_3)
+        self.a_14.setObjectName(u"a_14")
+
+        self.gridLayout_14.addWidget(self.a_14, 6, 1, 1, 1)
+
+        self.a_15 = QCheckBox(tab_3)
+        self.a_15.setObjectName(u"a_15")
+
+        self.gridLayout_14.addWidget(self.a_15, 7, 0, 1, 1)
+
+        self.a_16 = QCheckBox(tab_3)
+        self.a_16.setObjectName(u"a_16")
+
+        self.gridLayout_14.addWidget(self.a_16, 7, 1, 1, 1)
+
+        self.a_17 = QCheckBox(tab_3)
+        self.a_17.setObjectName(u"a_17")
+
+        self.gridLayout_14.addWidget(self.a_17, 8, 0, 1, 1)
+
+        self.a_18 = QCheckBox(tab_3)
+        self.a_18.setObjectName(u"a_18")
+
+        self.gridLayout_14.addWidget(self.a_18, 8, 1, 1, 1)
+
+        self.a_19 = QCheckBox(tab_3)
+        self.a_19.setObjectName(u"a_19")
+
+        self.gridLayout_14.addWidget(self.a_19, 9, 0, 1, 1)
+
+        self.a_20 = QCheckBox(tab_3)
+        self.a_20.setObjectName(u"a_20")
+
+        self.gridLayout_14.addWidget(self.a_20, 9, 1, 1, 1)
+
+
+        self.verticalLayout_5.addLayout(self.gridLayout_14)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_5.addItem(self.verticalSpacer)
+
+        self.horizontalLayout_21 = QHBoxLayout()
+        self.horizontalLayout_21.setObjectName(u"horizontalLayout_21")
+        self.a_all = QPushButton(tab_3)
+        self.a_all.setObjectName(u"a_all")
+
+        self.horizontalLayout_21.addWidget(self.a_all)
+
+        self.a_invert = QPushButton(tab_3)
+        self.a_invert.setObjectName(u"a_invert")
+
+        self.horizontalLayout_21.addWidget(self.a_invert)
+
+        self.a_none = QPushButton(tab_3)
+        self.a_none.setObjectName(u"a_none")
+
+        self.horizontalLayout_21.addWidget(self.a_none)
+
+
+        self.verticalLayout_5.addLayout(self.horizontalLayout_21)
+
+
+        self.gridLayout_15.addLayout(self.verticalLayout_5, 0, 0, 1, 1)
+
+
+        self.retranslateUi(tab_3)
+
+        QMetaObject.connectSlotsByName(tab_3)
+    # setupUi
+
+    def retranslateUi(self, tab_3):
+        self.a_1.setText(QCoreApplication.translate("AchievementsTab", u"Home Law Security", None))
+        self.a_2.setText(QCoreApplication.translate("AchievementsTab", u"Nobel Peas Prize", None))
+        self.a_3.setText(QCoreApplication.translate("AchievementsTab", u"Better Off Dead", None))
+        self.a_4.setText(QCoreApplication.translate("AchievementsTab", u"China Shop", None))
+        self.a_5.setText(QCoreApplication.translate("AchievementsTab", u"SPUDOW!!", None))
+        self.a_6.setText(QCoreApplication.translate("AchievementsTab", u"Explodonator", None))
+        self.a_7.setText(QCoreApplication.translate("AchievementsTab", u"Morticulturalist", None))
+        self.a_8.setText(QCoreApplication.translate("AchievementsTab", u"Don't Pea in the Pool", None))
+        self.a_9.setText(QCoreApplication.translate("AchievementsTab", u"Roll Some Heads", None))
+        self.a_10.setText(QCoreApplication.translate("AchievementsTab", u"Grounded", None))
+        self.a_11.setText(QCoreApplication.translate("AchievementsTab", u"Zombologist", None))
+        self.a_12.setText(QCoreApplication.translate("AchievementsTab", u"Penny Pitcher", None))
+        self.a_13.setText(QCoreApplication.translate("AchievementsTab", u"Sunny Days", None))
+        self.a_14.setText(QCoreApplication.translate("AchievementsTab", u"Popcorn Party", None))
+        self.a_15.setText(QCoreApplication.translate("AchievementsTab", u"Good Morning", None))
+        self.a_16.setText(QCoreApplication.translate("AchievementsTab", u"No Fungus Among Us", None))
+        self.a_17.setText(QCoreApplication.translate("AchievementsTab", u"Beyond the Grave", None))
+        self.a_18.setText(QCoreApplication.translate("AchievementsTab", u"Immortal", None))
+        self.a_19.setText(QCoreApplication.translate("AchievementsTab", u"Towering Wisdom", None))
+        self.a_20.setText(QCoreApplication.translate("AchievementsTab", u"Mustache Mode", None))
+        self.a_all.setText(QCoreApplication.translate("AchievementsTab", u"All", None))
+        self.a_invert.setText(QCoreApplication.translate("AchievementsTab", u"Invert", None))
+        self.a_none.setText(QCoreApplication.translate("AchievementsTab", u"None", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,577 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'edit_window_challenges.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QGridLayout, QGroupBox,
+    QHBoxLayout, QLabel, QSizePolicy, QSpacerItem,
+    QSpinBox, QVBoxLayout, QWidget)
+
+class Ui_ChallengesTab(object):
+    def setupUi(self, tab_4):
+        if not tab_4.objectName():
+            tab_4.setObjectName(u"tab_4")
+        self.gridLayout_3 = QGridLayout(tab_4)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.verticalLayout_3 = QVBoxLayout()
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.groupBox = QGroupBox(tab_4)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout_7 = QGridLayout(self.groupBox)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.gridLayout_7.setContentsMargins(-1, 5, -1, 5)
+        self.verticalLayout_4 = QVBoxLayout()
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.groupBox_4 = QGroupBox(self.groupBox)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.gridLayout_9 = QGridLayout(self.groupBox_4)
+        self.gridLayout_9.setObjectName(u"gridLayout_9")
+        self.gridLayout_9.setContentsMargins(-1, 5, -1, 5)
+        self.gridLayout_8 = QGridLayout()
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.label_3 = QLabel(self.groupBox_4)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_5.addWidget(self.label_3)
+
+        self.c_surv_1 = QSpinBox(self.groupBox_4)
+        self.c_surv_1.setObjectName(u"c_surv_1")
+        self.c_surv_1.setMinimum(0)
+        self.c_surv_1.setMaximum(5)
+
+        self.horizontalLayout_5.addWidget(self.c_surv_1)
+
+
+        self.gridLayout_8.addLayout(self.horizontalLayout_5, 0, 0, 1, 1)
+
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.label_7 = QLabel(self.groupBox_4)
+        self.label_7.setObjectName(u"label_7")
+
+        self.horizontalLayout_7.addWidget(self.label_7)
+
+        self.c_surv_3 = QSpinBox(self.groupBox_4)
+        self.c_surv_3.setObjectName(u"c_surv_3")
+        self.c_surv_3.setMaximum(5)
+
+        self.horizontalLayout_7.addWidget(self.c_surv_3)
+
+
+        self.gridLayout_8.addLayout(self.horizontalLayout_7, 0, 2, 1, 1)
+
+        self.horizontalLayout_6 = QHBoxLayout()
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.label_5 = QLabel(self.groupBox_4)
+        self.label_5.setObjectName(u"label_5")
+
+        self.horizontalLayout_6.addWidget(self.label_5)
+
+        self.c_surv_2 = QSpinBox(self.groupBox_4)
+        self.c_surv_2.setObjectName(u"c_surv_2")
+        self.c_surv_2.setMaximum(5)
+
+        self.horizontalLayout_6.addWidget(self.c_surv_2)
+
+
+        self.gridLayout_8.addLayout(self.horizontalLayout_6, 0, 1, 1, 1)
+
+        self.horizontalLayout_8 = QHBoxLayout()
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.label_9 = QLabel(self.groupBox_4)
+        self.label_9.setObjectName(u"label_9")
+
+        self.horizontalLayout_8.addWidget(self.label_9)
+
+        self.c_surv_4 = QSpinBox(self.groupBox_4)
+        self.c_surv_4.setObjectName(u"c_surv_4")
+        self.c_surv_4.setMaximum(5)
+
+        self.horizontalLayout_8.addWidget(self.c_surv_4)
+
+
+        self.gridLayout_8.addLayout(self.horizontalLayout_8, 0, 3, 1, 1)
+
+        self.horizontalLayout_10 = QHBoxLayout()
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.label_13 = QLabel(self.groupBox_4)
+        self.label_13.setObjectName(u"label_13")
+
+        self.horizontalLayout_10.addWidget(self.label_13)
+
+        self.c_surv_5 = QSpinBox(self.groupBox_4)
+        self.c_surv_5.setObjectName(u"c_surv_5")
+        self.c_surv_5.setMaximum(5)
+
+        self.horizontalLayout_10.addWidget(self.c_surv_5)
+
+
+        self.gridLayout_8.addLayout(self.horizontalLayout_10, 0, 4, 1, 1)
+
+
+        self.gridLayout_9.addLayout(self.gridLayout_8, 0, 0, 1, 1)
+
+
+        self.verticalLayout_4.addWidget(self.groupBox_4)
+
+        self.groupBox_5 = QGroupBox(self.groupBox)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.gridLayout_11 = QGridLayout(self.groupBox_5)
+        self.gridLayout_11.setObjectName(u"gridLayout_11")
+        self.gridLayout_11.setContentsMargins(9, 5, -1, 5)
+        self.gridLayout_10 = QGridLayout()
+        self.gridLayout_10.setObjectName(u"gridLayout_10")
+        self.horizontalLayout_11 = QHBoxLayout()
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.label_15 = QLabel(self.groupBox_5)
+        self.label_15.setObjectName(u"label_15")
+
+        self.horizontalLayout_11.addWidget(self.label_15)
+
+        self.c_survhard_1 = QSpinBox(self.groupBox_5)
+        self.c_survhard_1.setObjectName(u"c_survhard_1")
+        self.c_survhard_1.setMaximum(10)
+
+        self.horizontalLayout_11.addWidget(self.c_survhard_1)
+
+
+        self.gridLayout_10.addLayout(self.horizontalLayout_11, 0, 0, 1, 1)
+
+        self.horizontalLayout_12 = QHBoxLayout()
+        self.horizontalLayout_12.setObjectName(u"horizontalLayout_12")
+        self.label_17 = QLabel(self.groupBox_5)
+        self.label_17.setObjectName(u"label_17")
+
+        self.horizontalLayout_12.addWidget(self.label_17)
+
+        self.c_survhard_3 = QSpinBox(self.groupBox_5)
+        self.c_survhard_3.setObjectName(u"c_survhard_3")
+        self.c_survhard_3.setMaximum(10)
+
+        self.horizontalLayout_12.addWidget(self.c_survhard_3)
+
+
+        self.gridLayout_10.addLayout(self.horizontalLayout_12, 0, 2, 1, 1)
+
+        self.horizontalLayout_13 = QHBoxLayout()
+        self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
+        self.label_19 = QLabel(self.groupBox_5)
+        self.label_19.setObjectName(u"label_19")
+
+        self.horizontalLayout_13.addWidget(self.label_19)
+
+        self.c_survhard_2 = QSpinBox(self.groupBox_5)
+        self.c_survhard_2.setObjectName(u"c_survhard_2")
+        self.c_survhard_2.setMaximum(10)
+
+        self.horizontalLayout_13.addWidget(self.c_survhard_2)
+
+
+        self.gridLayout_10.addLayout(self.horizontalLayout_13, 0, 1, 1, 1)
+
+        self.horizontalLayout_14 = QHBoxLayout()
+        self.horizontalLayout_14.setObjectName(u"horizontalLayout_14")
+        self.label_21 = QLabel(self.groupBox_5)
+        self.label_21.setObjectName(u"label_21")
+
+        self.horizontalLayout_14.addWidget(self.label_21)
+
+        self.c_survhard_4 = QSpinBox(self.groupBox_5)
+        self.c_survhard_4.setObjectName(u"c_survhard_4")
+        self.c_survhard_4.setMaximum(10)
+
+        self.horizontalLayout_14.addWidget(self.c_survhard_4)
+
+
+        self.gridLayout_10.addLayout(self.horizontalLayout_14, 0, 3, 1, 1)
+
+        self.horizontalLayout_15 = QHBoxLayout()
+        self.horizontalLayout_15.setObjectName(u"horizontalLayout_15")
+        self.label_23 = QLabel(self.groupBox_5)
+        self.label_23.setObjectName(u"label_23")
+
+        self.horizontalLayout_15.addWidget(self.label_23)
+
+        self.c_survhard_5 = QSpinBox(self.groupBox_5)
+        self.c_survhard_5.setObjectName(u"c_survhard_5")
+        self.c_survhard_5.setMaximum(10)
+
+        self.horizontalLayout_15.addWidget(self.c_survhard_5)
+
+
+        self.gridLayout_10.addLayout(self.horizontalLayout_15, 0, 4, 1, 1)
+
+
+        self.gridLayout_11.addLayout(self.gridLayout_10, 0, 0, 1, 1)
+
+
+        self.verticalLayout_4.addWidget(self.groupBox_5)
+
+
+        self.gridLayout_7.addLayout(self.verticalLayout_4, 0, 0, 1, 1)
+
+        self.horizontalLayout_17 = QHBoxLayout()
+        self.horizontalLayout_17.setObjectName(u"horizontalLayout_17")
+        self.label_27 = QLabel(self.groupBox)
+        self.label_27.setObjectName(u"label_27")
+
+        self.horizontalLayout_17.addWidget(self.label_27)
+
+        self.c_survend = QSpinBox(self.groupBox)
+        self.c_survend.setObjectName(u"c_survend")
+        self.c_survend.setMaximum(2147483647)
+
+        self.horizontalLayout_17.addWidget(self.c_survend)
+
+        self.horizontalSpacer_9 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_17.addItem(self.horizontalSpacer_9)
+
+
+        self.gridLayout_7.addLayout(self.horizontalLayout_17, 1, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(tab_4)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout_4 = QGridLayout(self.groupBox_2)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.gridLayout_4.setContentsMargins(-1, 5, -1, 5)
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.c_mg_4 = QCheckBox(self.groupBox_2)
+        self.c_mg_4.setObjectName(u"c_mg_4")
+
+        self.gridLayout.addWidget(self.c_mg_4, 0, 3, 1, 1)
+
+        self.c_mg_15 = QCheckBox(self.groupBox_2)
+        self.c_mg_15.setObjectName(u"c_mg_15")
+
+        self.gridLayout.addWidget(self.c_mg_15, 2, 4, 1, 1)
+
+        self.c_mg_6 = QCheckBox(self.groupBox_2)
+        self.c_mg_6.setObjectName(u"c_mg_6")
+
+        self.gridLayout.addWidget(self.c_mg_6, 1, 0, 1, 1)
+
+        self.c_mg_13 = QCheckBox(self.groupBox_2)
+        self.c_mg_13.setObjectName(u"c_mg_13")
+
+        self.gridLayout.addWidget(self.c_mg_13, 2, 2, 1, 1)
+
+        self.c_mg_12 = QCheckBox(self.groupBox_2)
+        self.c_mg_12.setObjectName(u"c_mg_12")
+
+        self.gridLayout.addWidget(self.c_mg_12, 2, 1, 1, 1)
+
+        self.c_mg_3 = QCheckBox(self.groupBox_2)
+        self.c_mg_3.setObjectName(u"c_mg_3")
+
+        self.gridLayout.addWidget(self.c_mg_3, 0, 2, 1, 1)
+
+        self.c_mg_1 = QCheckBox(self.groupBox_2)
+        self.c_mg_1.setObjectName(u"c_mg_1")
+
+        self.gridLayout.addWidget(self.c_mg_1, 0, 0, 1, 1)
+
+        self.c_mg_11 = QCheckBox(self.groupBox_2)
+        self.c_mg_11.setObjectName(u"c_mg_11")
+
+        self.gridLayout.addWidget(self.c_mg_11, 2, 0, 1, 1)
+
+        self.c_mg_16 = QCheckBox(self.groupBox_2)
+        self.c_mg_16.setObjectName(u"c_mg_16")
+
+        self.gridLayout.addWidget(self.c_mg_16, 3, 0, 1, 1)
+
+        self.c_mg_18 = QCheckBox(self.groupBox_2)
+        self.c_mg_18.setObjectName(u"c_mg_18")
+
+        self.gridLayout.addWidget(self.c_mg_18, 3, 2, 1, 1)
+
+        self.c_mg_14 = QCheckBox(self.groupBox_2)
+        self.c_mg_14.setObjectName(u"c_mg_14")
+
+        self.gridLayout.addWidget(self.c_mg_14, 2, 3, 1, 1)
+
+        self.c_mg_17 = QCheckBox(self.groupBox_2)
+        self.c_mg_17.setObjectName(u"c_mg_17")
+
+        self.gridLayout.addWidget(self.c_mg_17, 3, 1, 1, 1)
+
+        self.c_mg_10 = QCheckBox(self.groupBox_2)
+        self.c_mg_10.setObjectName(u"c_mg_10")
+
+        self.gridLayout.addWidget(self.c_mg_10, 1, 4, 1, 1)
+
+        self.c_mg_5 = QCheckBox(self.groupBox_2)
+        self.c_mg_5.setObjectName(u"c_mg_5")
+
+        self.gridLayout.addWidget(self.c_mg_5, 0, 4, 1, 1)
+
+        self.c_mg_2 = QCheckBox(self.groupBox_2)
+        self.c_mg_2.setObjectName(u"c_mg_2")
+
+        self.gridLayout.addWidget(self.c_mg_2, 0, 1, 1, 1)
+
+        self.c_mg_9 = QCheckBox(self.groupBox_2)
+        self.c_mg_9.setObjectName(u"c_mg_9")
+
+        self.gridLayout.addWidget(self.c_mg_9, 1, 3, 1, 1)
+
+        self.c_mg_8 = QCheckBox(self.groupBox_2)
+        self.c_mg_8.setObjectName(u"c_mg_8")
+
+        self.gridLayout.addWidget(self.c_mg_8, 1, 2, 1, 1)
+
+        self.c_mg_19 = QCheckBox(self.groupBox_2)
+        self.c_mg_19.setObjectName(u"c_mg_19")
+
+        self.gridLayout.addWidget(self.c_mg_19, 3, 3, 1, 1)
+
+        self.c_mg_20 = QCheckBox(self.groupBox_2)
+        self.c_mg_20.setObjectName(u"c_mg_20")
+
+        self.gridLayout.addWidget(self.c_mg_20, 3, 4, 1, 1)
+
+        self.c_mg_7 = QCheckBox(self.groupBox_2)
+        self.c_mg_7.setObjectName(u"c_mg_7")
+
+        self.gridLayout.addWidget(self.c_mg_7, 1, 1, 1, 1)
+
+
+        self.gridLayout_4.addLayout(self.gridLayout, 0, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(tab_4)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout_6 = QGridLayout(self.groupBox_3)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.gridLayout_6.setContentsMargins(-1, 5, -1, 5)
+        self.gridLayout_5 = QGridLayout()
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.c_pz_1 = QCheckBox(self.groupBox_3)
+        self.c_pz_1.setObjectName(u"c_pz_1")
+
+        self.gridLayout_5.addWidget(self.c_pz_1, 0, 0, 1, 1)
+
+        self.c_pz_13 = QCheckBox(self.groupBox_3)
+        self.c_pz_13.setObjectName(u"c_pz_13")
+
+        self.gridLayout_5.addWidget(self.c_pz_13, 2, 2, 1, 1)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.label = QLabel(self.groupBox_3)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_3.addWidget(self.label)
+
+        self.c_pz_10 = QSpinBox(self.groupBox_3)
+        self.c_pz_10.setObjectName(u"c_pz_10")
+        self.c_pz_10.setMaximum(2147483647)
+
+        self.horizontalLayout_3.addWidget(self.c_pz_10)
+
+
+        self.gridLayout_5.addLayout(self.horizontalLayout_3, 1, 4, 1, 1)
+
+        self.c_pz_4 = QCheckBox(self.groupBox_3)
+        self.c_pz_4.setObjectName(u"c_pz_4")
+
+        self.gridLayout_5.addWidget(self.c_pz_4, 0, 3, 1, 1)
+
+        self.c_pz_7 = QCheckBox(self.groupBox_3)
+        self.c_pz_7.setObjectName(u"c_pz_7")
+
+        self.gridLayout_5.addWidget(self.c_pz_7, 1, 1, 1, 1)
+
+        self.c_pz_2 = QCheckBox(self.groupBox_3)
+        self.c_pz_2.setObjectName(u"c_pz_2")
+
+        self.gridLayout_5.addWidget(self.c_pz_2, 0, 1, 1, 1)
+
+        self.c_pz_6 = QCheckBox(self.groupBox_3)
+        self.c_pz_6.setObjectName(u"c_pz_6")
+
+        self.gridLayout_5.addWidget(self.c_pz_6, 1, 0, 1, 1)
+
+        self.c_pz_14 = QCheckBox(self.groupBox_3)
+        self.c_pz_14.setObjectName(u"c_pz_14")
+
+        self.gridLayout_5.addWidget(self.c_pz_14, 2, 3, 1, 1)
+
+        self.c_pz_9 = QCheckBox(self.groupBox_3)
+        self.c_pz_9.setObjectName(u"c_pz_9")
+
+        self.gridLayout_5.addWidget(self.c_pz_9, 1, 3, 1, 1)
+
+        self.c_pz_3 = QCheckBox(self.groupBox_3)
+        self.c_pz_3.setObjectName(u"c_pz_3")
+
+        self.gridLayout_5.addWidget(self.c_pz_3, 0, 2, 1, 1)
+
+        self.c_pz_12 = QCheckBox(self.groupBox_3)
+        self.c_pz_12.setObjectName(u"c_pz_12")
+
+        self.gridLayout_5.addWidget(self.c_pz_12, 2, 1, 1, 1)
+
+        self.c_pz_8 = QCheckBox(self.groupBox_3)
+        self.c_pz_8.setObjectName(u"c_pz_8")
+
+        self.gridLayout_5.addWidget(self.c_pz_8, 1, 2, 1, 1)
+
+        self.c_pz_11 = QCheckBox(self.groupBox_3)
+        self.c_pz_11.setObjectName(u"c_pz_11")
+
+        self.gridLayout_5.addWidget(self.c_pz_11, 2, 0, 1, 1)
+
+        self.c_pz_5 = QCheckBox(self.groupBox_3)
+        self.c_pz_5.setObjectName(u"c_pz_5")
+
+        self.gridLayout_5.addWidget(self.c_pz_5, 0, 4, 1, 1)
+
+        self.c_pz_15 = QCheckBox(self.groupBox_3)
+        self.c_pz_15.setObjectName(u"c_pz_15")
+
+        self.gridLayout_5.addWidget(self.c_pz_15, 2, 4, 1, 1)
+
+        self.c_pz_16 = QCheckBox(self.groupBox_3)
+        self.c_pz_16.setObjectName(u"c_pz_16")
+
+        self.gridLayout_5.addWidget(self.c_pz_16, 3, 0, 1, 1)
+
+        self.c_pz_17 = QCheckBox(self.groupBox_3)
+        self.c_pz_17.setObjectName(u"c_pz_17")
+
+        self.gridLayout_5.addWidget(self.c_pz_17, 3, 1, 1, 1)
+
+        self.c_pz_18 = QCheckBox(self.groupBox_3)
+        self.c_pz_18.setObjectName(u"c_pz_18")
+
+        self.gridLayout_5.addWidget(self.c_pz_18, 3, 2, 1, 1)
+
+        self.c_pz_19 = QCheckBox(self.groupBox_3)
+        self.c_pz_19.setObjectName(u"c_pz_19")
+
+        self.gridLayout_5.addWidget(self.c_pz_19, 3, 3, 1, 1)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.label_2 = QLabel(self.groupBox_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout_4.addWidget(self.label_2)
+
+        self.c_pz_20 = QSpinBox(self.groupBox_3)
+        self.c_pz_20.setObjectName(u"c_pz_20")
+        self.c_pz_20.setMaximum(2147483647)
+
+        self.horizontalLayout_4.addWidget(self.c_pz_20)
+
+
+        self.gridLayout_5.addLayout(self.horizontalLayout_4, 3, 4, 1, 1)
+
+
+        self.gridLayout_6.addLayout(self.gridLayout_5, 0, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_3)
+
+
+        self.gridLayout_3.addLayout(self.verticalLayout_3, 0, 0, 1, 1)
+
+
+        self.retranslateUi(tab_4)
+
+        QMetaObject.connectSlotsByName(tab_4)
+    # setupUi
+
+    def retranslateUi(self, tab_4):
+        self.groupBox.setTitle(QCoreApplication.translate("ChallengesTab", u"Survivals", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("ChallengesTab", u"Normal", None))
+        self.label_3.setText(QCoreApplication.translate("ChallengesTab", u"Day", None))
+        self.c_surv_1.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_7.setText(QCoreApplication.translate("ChallengesTab", u"Pool", None))
+        self.c_surv_3.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_5.setText(QCoreApplication.translate("ChallengesTab", u"Night", None))
+        self.c_surv_2.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_9.setText(QCoreApplication.translate("ChallengesTab", u"Fog", None))
+        self.c_surv_4.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_13.setText(QCoreApplication.translate("ChallengesTab", u"Roof", None))
+        self.c_surv_5.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("ChallengesTab", u"Hard", None))
+        self.label_15.setText(QCoreApplication.translate("ChallengesTab", u"Day", None))
+        self.c_survhard_1.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_17.setText(QCoreApplication.translate("ChallengesTab", u"Pool", None))
+        self.c_survhard_3.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_19.setText(QCoreApplication.translate("ChallengesTab", u"Night", None))
+        self.c_survhard_2.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_21.setText(QCoreApplication.translate("ChallengesTab", u"Fog", None))
+        self.c_survhard_4.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_23.setText(QCoreApplication.translate("ChallengesTab", u"Roof", None))
+        self.c_survhard_5.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.label_27.setText(QCoreApplication.translate("ChallengesTab", u"Survival Endless:", None))
+        self.c_survend.setSuffix(QCoreApplication.translate("ChallengesTab", u" flags", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("ChallengesTab", u"Mini-games", None))
+        self.c_mg_4.setText(QCoreApplication.translate("ChallengesTab", u"It's Raining Seeds", None))
+        self.c_mg_15.setText(QCoreApplication.translate("ChallengesTab", u"Whack A Zombie", None))
+        self.c_mg_6.setText(QCoreApplication.translate("ChallengesTab", u"Invisi-ghoul", None))
+        self.c_mg_13.setText(QCoreApplication.translate("ChallengesTab", u"Bobsled Bonanza", None))
+        self.c_mg_12.setText(QCoreApplication.translate("ChallengesTab", u"Column Like You See' Em", None))
+        self.c_mg_3.setText(QCoreApplication.translate("ChallengesTab", u"Slot Machine", None))
+        self.c_mg_1.setText(QCoreApplication.translate("ChallengesTab", u"ZomBotany", None))
+        self.c_mg_11.setText(QCoreApplication.translate("ChallengesTab", u"Portal Combat", None))
+        self.c_mg_16.setText(QCoreApplication.translate("ChallengesTab", u"Last Stand", None))
+        self.c_mg_18.setText(QCoreApplication.translate("ChallengesTab", u"Wall-nut Bowling 2", None))
+        self.c_mg_14.setText(QCoreApplication.translate("ChallengesTab", u"Zombie Nimble Zombie Quick", None))
+        self.c_mg_17.setText(QCoreApplication.translate("ChallengesTab", u"ZomBotany 2", None))
+        self.c_mg_10.setText(QCoreApplication.translate("ChallengesTab", u"Big Trouble Little Zombie", None))
+        self.c_mg_5.setText(QCoreApplication.translate("ChallengesTab", u"Beghouled", None))
+        self.c_mg_2.setText(QCoreApplication.translate("ChallengesTab", u"Wall-nut Bowling", None))
+        self.c_mg_9.setText(QCoreApplication.translate("ChallengesTab", u"Beghouled Twist", None))
+        self.c_mg_8.setText(QCoreApplication.translate("ChallengesTab", u"Zombiquarium", None))
+        self.c_mg_19.setText(QCoreApplication.translate("ChallengesTab", u"Pogo Party", None))
+        self.c_mg_20.setText(QCoreApplication.translate("ChallengesTab", u"Dr. Zomboss' Revenge", None))
+        self.c_mg_7.setText(QCoreApplication.translate("ChallengesTab", u"Seeing Stars", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("ChallengesTab", u"Puzzles", None))
+        self.c_pz_1.setText(QCoreApplication.translate("ChallengesTab", u"Vasebreaker", None))
+        self.c_pz_13.setText(QCoreApplication.translate("ChallengesTab", u"Can You Dig it?", None))
+        self.label.setText(QCoreApplication.translate("ChallengesTab", u"Vasebreaker Endless Streak Length", None))
+        self.c_pz_4.setText(QCoreApplication.translate("ChallengesTab", u"Chain Reaction", None))
+        self.c_pz_7.setText(QCoreApplication.translate("ChallengesTab", u"Hokey Pokey", None))
+        self.c_pz_2.setText(QCoreApplication.translate("ChallengesTab", u"To The Left", None))
+        self.c_pz_6.setText(QCoreApplication.translate("ChallengesTab", u"Scary Potter", None))
+        self.c_pz_14.setText(QCoreApplication.translate("ChallengesTab", u"Totally Nuts", None))
+        self.c_pz_9.setText(QCoreApplication.translate("ChallengesTab", u"Ace of Vases", None))
+        self.c_pz_3.setText(QCoreApplication.translate("ChallengesTab", u"Third Vase", None))
+        self.c_pz_12.setText(QCoreApplication.translate("ChallengesTab", u"I, Zombie Too", None))
+        self.c_pz_8.setText(QCoreApplication.translate("ChallengesTab", u"Another Chain Reaction", None))
+        self.c_pz_11.setText(QCoreApplication.translate("ChallengesTab", u"I, Zombie", None))
+        self.c_pz_5.setText(QCoreApplication.translate("ChallengesTab", u"M is for Metal", None))
+        self.c_pz_15.setText(QCoreApplication.translate("ChallengesTab", u"Dead Zeppelin", None))
+        self.c_pz_16.setText(QCoreApplication.translate("ChallengesTab", u"Me Smash!", None))
+        self.c_pz_17.setText(QCoreApplication.translate("ChallengesTab", u"ZomBoogie", None))
+        self.c_pz_18.setText(QCoreApplication.translate("ChallengesTab", u"Three Hit Wonder", None))
+        self.c_pz_19.setText(QCoreApplication.translate("ChallengesTab", u"All your brainz r belong to us", None))
+        self.label_2.setText(QCoreApplication.translate("ChallengesTab", u"I, Zombie Endless Streak Length", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'edit_window_general.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractSpinBox, QApplication, QCheckBox, QComboBox,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QSizePolicy, QSpacerItem, QSpinBox,
+    QVBoxLayout, QWidget)
+
+class Ui_GeneralTab(object):
+    def setupUi(self, tab):
+        if not tab.objectName():
+            tab.setObjectName(u"tab")
+        self.gridLayout_16 = QGridLayout(tab)
+        self.gridLayout_16.setObjectName(u"gridLayout_16")
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label_4 = QLabel(tab)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout.addWidget(self.label_4)
+
+        self.g_name = QLineEdit(tab)
+        self.g_name.setObjectName(u"g_name")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.g_name.sizePolicy().hasHeightForWidth())
+        self.g_name.setSizePolicy(sizePolicy)
+        self.g_name.setMinimumSize(QSize(200, 0))
+
+        self.horizontalLayout.addWidget(self.g_name)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_4)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.horizontalLayout_9 = QHBoxLayout()
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.label_6 = QLabel(tab)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout_9.addWidget(self.label_6)
+
+        self.g_level = QComboBox(tab)
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.addItem("")
+        self.g_level.setObjectName(u"g_level")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.g_level.sizePolicy().hasHeightForWidth())
+        self.g_level.setSizePolicy(sizePolicy1)
+        self.g_level.setMaxVisibleItems(10)
+
+        self.horizontalLayout_9.addWidget(self.g_level)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_3)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_9)
+
+        self.horizontalLayout_22 = QHBoxLayout()
+        self.horizontalLayout_22.setObjectName(u"horizontalLayout_22")
+        self.label_10 = QLabel(tab)
+        self.label_10.setObjectName(u"label_10")
+
+        self.horizontalLayout_22.addWidget(self.label_10)
+
+        self.g_completed = QSpinBox(tab)
+        self.g_completed.setObjectName(u"g_completed")
+        self.g_completed.setMaximum(2147483647)
+
+        self.horizontalLayout_22.addWidget(self.g_completed)
+
+        self.label_18 = QLabel(tab)
+        self.label_18.setObjectName(u"label_18")
+
+        self.horizontalLayout_22.addWidget(self.label_18)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_22.addItem(self.horizontalSpacer_2)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_22)
+
+        self.horizontalLayout_23 = QHBoxLayout()
+        self.horizontalLayout_23.setObjectName(u"horizontalLayout_23")
+        self.label_8 = QLabel(tab)
+        self.label_8.setObjectName(u"label_8")
+
+        self.horizontalLayout_23.addWidget(self.label_8)
+
+        self.label_20 = QLabel(tab)
+        self.label_20.setObjectName(u"label_20")
+
+        self.horizontalLayout_23.addWidget(self.label_20)
+
+        self.g_money = QSpinBox(tab)
+        self.g_money.setObjectName(u"g_money")
+        self.g_money.setMinimumSize(QSize(125, 0))
+        self.g_money.setMaximum(999990)
+        self.g_money.setSingleStep(10)
+        self.g_money.setStepType(QAbstractSpinBox.DefaultStepType)
+
+        self.horizontalLayout_23.addWidget(self.g_money)
+
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_23.addItem(self.horizontalSpacer_5)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_23)
+
+        self.g_minigames_unlocked = QCheckBox(tab)
+        self.g_minigames_unlocked.setObjectName(u"g_minigames_unlocked")
+
+        self.verticalLayout.addWidget(self.g_minigames_unlocked)
+
+        self.g_puzzle_unlocked = QCheckBox(tab)
+        self.g_puzzle_unlocked.setObjectName(u"g_puzzle_unlocked")
+
+        self.verticalLayout.addWidget(self.g_puzzle_unlocked)
+
+        self.g_taco = QCheckBox(tab)
+        self.g_taco.setObjectName(u"g_taco")
+
+        self.verticalLayout.addWidget(self.g_taco)
+
+
+        self.gridLayout_16.addLayout(self.verticalLayout, 0, 0, 1, 1)
+
+        self.groupBox_7 = QGroupBox(tab)
+        self.groupBox_7.setObjectName(u"groupBox_7")
+        self.gridLayout_19 = QGridLayout(self.groupBox_7)
+        self.gridLayout_19.setObjectName(u"gridLayout_19")
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.horizontalLayout_25 = QHBoxLayout()
+        self.horizontalLayout_25.setObjectName(u"horizontalLayout_25")
+        self.horizontalLayout_24 = QHBoxLayout()
+        self.horizontalLayout_24.setObjectName(u"horizontalLayout_24")
+        self.label_11 = QLabel(self.groupBox_7)
+        self.label_11.setObjectName(u"label_11")
+
+        self.horizontalLayout_24.addWidget(self.label_11)
+
+        self.g_slots = QSpinBox(self.groupBox_7)
+        self.g_slots.setObjectName(u"g_slots")
+        self.g_slots.setMinimum(6)
+        self.g_slots.setMaximum(10)
+
+        self.horizontalLayout_24.addWidget(self.g_slots)
+
+
+        self.horizontalLayout_25.addLayout(self.horizontalLayout_24)
+
+        self.g_roof_cleaner = QCheckBox(self.groupBox_7)
+        self.g_roof_cleaner.setObjectName(u"g_roof_cleaner")
+
+        self.horizontalLayout_25.addWidget(self.g_roof_cleaner)
+
+        self.g_pool_cleaner = QCheckBox(self.groupBox_7)
+        self.g_pool_cleaner.setObjectName(u"g_pool_cleaner")
+
+        self.horizontalLayout_25.addWidget(self.g_pool_cleaner)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_25)
+
+        self.horizontalLayout_65 = QHBoxLayout()
+        self.horizontalLayout_65.setObjectName(u"horizontalLayout_65")
+        self.label_66 = QLabel(self.groupBox_7)
+        self.label_66.setObjectName(u"label_66")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.label_66.sizePolicy().hasHeightForWidth())
+        self.label_66.setSizePolicy(sizePolicy2)
+
+        self.horizontalLayout_65.addWidget(self.label_66)
+
+        self.g_rake_uses = QSpinBox(self.groupBox_7)
+        self.g_rake_uses.setObjectName(u"g_rake_uses")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.g_rake_uses.sizePolicy().hasHeightForWidth())
+        self.g_rake_uses.setSizePolicy(sizePolicy3)
+        self.g_rake_uses.setMaximum(999999999)
+
+        self.horizontalLayout_65.addWidget(self.g_rake_uses)
+
+        self.horizontalSpacer_8 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_65.addItem(self.horizontalSpacer_8)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_65)
+
+        self.groupBox_8 = QGroupBox(self.groupBox_7)
+        self.groupBox_8.setObjectName(u"groupBox_8")
+        self.gridLayout_17 = QGridLayout(self.groupBox_8)
+        self.gridLayout_17.setObjectName(u"gridLayout_17")
+        self.gridLayout_18 = QGridLayout()
+        self.gridLayout_18.setObjectName(u"gridLayout_18")
+        self.g_plants_8 = QCheckBox(self.groupBox_8)
+        self.g_plants_8.setObjectName(u"g_plants_8")
+
+        self.gridLayout_18.addWidget(self.g_plants_8, 2, 1, 1, 1)
+
+        self.g_plants_7 = QCheckBox(self.groupBox_8)
+        self.g_plants_7.setObjectName(u"g_plants_7")
+
+        self.gridLayout_18.addWidget(self.g_plants_7, 2, 0, 1, 1)
+
+        self.g_plants_3 = QCheckBox(self.groupBox_8)
+        self.g_plants_3.setObjectName(u"g_plants_3")
+
+        self.gridLayout_18.addWidget(self.g_plants_3, 0, 2, 1, 1)
+
+        self.g_plants_4 = QCheckBox(self.groupBox_8)
+        self.g_plants_4.setObjectName(u"g_plants_4")
+
+        self.gridLayout_18.addWidget(self.g_plants_4, 1, 0, 1, 1)
+
+        self.g_plants_5 = QCheckBox(self.groupBox_8)
+        self.g_plants_5.setObjectName(u"g_plants_5")
+
+        self.gridLayout_18.addWidget(self.g_plants_5, 1, 1, 1, 1)
+
+        self.g_plants_1 = QCheckBox(self.groupBox_8)
+        self.g_plants_1.setObjectName(u"g_plants_1")
+
+        self.gridLayout_18.addWidget(self.g_plants_1, 0, 0, 1, 1)
+
+        self.g_plants_2 = QCheckBox(self.groupBox_8)
+        self.g_plants_2.setObjectName(u"g_plants_2")
+
+        self.gridLayout_18.addWidget(self.g_plants_2, 0, 1, 1, 1)
+
+        self.g_plants_10 = QCheckBox(self.groupBox_8)
+        self.g_plants_10.setObjectName(u"g_plants_10")
+
+        self.gridLayout_18.addWidget(self.g_plants_10, 3, 0, 1, 1)
+
+        self.g_plants_6 = QCheckBox(self.groupBox_8)
+        self.g_plants_6.setObjectName(u"g_plants_6")
+
+        self.gridLayout_18.addWidget(self.g_plants_6, 1, 2, 1, 1)
+
+        self.g_plants_9 = QCheckBox(self.groupBox_8)
+        self.g_plants_9.setObjectName(u"g_plants_9")
+
+        self.gridLayout_18.addWidget(self.g_plants_9, 2, 2, 1, 1)
+
+
+        self.gridLayout_17.addLayout(self.gridLayout_18, 0, 0, 1, 1)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout_17.addItem(self.verticalSpacer_2, 2, 0, 1, 1)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_8)
+
+
+        self.gridLayout_19.addLayout(self.verticalLayout_2, 0, 0, 1, 1)
+
+
+        self.gridLayout_16.addWidget(self.groupBox_7, 2, 0, 1, 1)
+
+
+        self.retranslateUi(tab)
+
+        QMetaObject.connectSlotsByName(tab)
+    # setupUi
+
+    def retranslateUi(self, tab):
+        self.label_4.setText(QCoreApplication.translate("GeneralTab", u"Player name:", None))
+        self.label_6.setText(QCoreApplication.translate("GeneralTab", u"Adventure Mode Level:", None))
+        self.g_level.setItemText(0, QCoreApplication.translate("GeneralTab", u"1-1", None))
+        self.g_level.setItemText(1, QCoreApplication.translate("GeneralTab", u"1-2", None))
+        self.g_level.setItemText(2, QCoreApplication.translate("GeneralTab", u"1-3", None))
+        self.g_level.setItemText(3, QCoreApplication.translate("GeneralTab", u"1-4", None))
+        self.g_level.setItemText(4, QCoreApplication.translate("GeneralTab", u"1-5", None))
+        self.g_level.setItemText(5, QCoreApplication.translate("GeneralTab", u"1-6", None))
+        self.g_level.setItemText(6, QCoreApplication.translate("GeneralTab", u"1-7", None))
+        self.g_level.setItemText(7, QCoreApplication.translate("GeneralTab", u"1-8", None))
+        self.g_level.setItemText(8, QCoreApplication.translate("GeneralTab", u"1-9", None))
+        self.g_level.setItemText(9, QCoreApplication.translate("GeneralTab", u"1-10", None))
+        self.g_level.setItemText(10, QCoreApplication.translate("GeneralTab", u"2-1", None))
+        self.g_level.setItemText(11, QCoreApplication.translate("GeneralTab", u"2-2", None))
+        self.g_level.setItemText(12, QCoreApplication.translate("GeneralTab", u"2-3", None))
+        self.g_level.setItemText(13, QCoreApplication.translate("GeneralTab", u"2-4", None))
+        self.g_level.setItemText(14, QCoreApplication.translate("GeneralTab", u"2-5", None))
+        self.g_level.setItemText(15, QCoreApplication.translate("GeneralTab", u"2-6", None))
+        self.g_level.setItemText(16, QCoreApplication.translate("GeneralTab", u"2-7", None))
+        self.g_level.setItemText(17, QCoreApplication.translate("GeneralTab", u"2-8", None))
+        self.g_level.setItemText(18, QCoreApplication.translate("GeneralTab", u"2-9", None))
+        self.g_level.setItemText(19, QCoreApplication.translate("GeneralTab", u"2-10", None))
+        self.g_level.setItemText(20, QCoreApplication.translate("GeneralTab", u"3-1", None))
+        self.g_level.setItemText(21, QCoreApplication.translate("GeneralTab", u"3-2", None))
+        self.g_level.setItemText(22, QCoreApplication.translate("GeneralTab", u"3-3", None))
+        self.g_level.setItemText(23, QCoreApplication.translate("GeneralTab", u"3-4", None))
+        self.g_level.setItemText(24, QCoreApplication.translate("GeneralTab", u"3-5", None))
+        self.g_level.setItemText(25, QCoreApplication.translate("GeneralTab", u"3-6", None))
+        self.g_level.setItemText(26, QCoreApplication.translate("GeneralTab", u"3-7", None))
+        self.g_level.setItemText(27, QCoreApplication.translate("GeneralTab", u"3-8", None))
+        self.g_level.setItemText(28, QCoreApplication.translate("GeneralTab", u"3-9", None))
+        self.g_level.setItemText(29, QCoreApplication.translate("GeneralTab", u"3-10", None))
+        self.g_level.setItemText(30, QCoreApplication.translate("GeneralTab", u"4-1", None))
+        self.g_level.setItemText(31, QCoreApplication.translate("GeneralTab", u"4-2", None))
+        self.g_level.setItemText(32, QCoreApplication.translate("GeneralTab", u"4-3", None))
+        self.g_level.setItemText(33, QCoreApplication.translate("GeneralTab", u"4-4", None))
+        self.g_level.setItemText(34, QCoreApplication.translate("GeneralTab", u"4-5", None))
+        self.g_level.setItemText(35, QCoreApplication.translate("GeneralTab", u"4-6", None))
+        self.g_level.setItemText(36, QCoreApplication.translate("GeneralTab", u"4-7", None))
+        self.g_level.setItemText(37, QCoreApplication.translate("GeneralTab", u"4-8", None))
+        self.g_level.setItemText(38, QCoreApplication.translate("GeneralTab", u"4-9", None))
+        self.g_level.setItemText(39, QCoreApplication.translate("GeneralTab", u"4-10", None))
+        self.g_level.setItemText(40, QCoreApplication.translate("GeneralTab", u"5-1", None))
+        self.g_level.setItemText(41, QCoreApplication.translate("GeneralTab", u"5-2", None))
+        self.g_level.setItemText(42, QCoreApplication.translate("GeneralTab", u"5-3", None))
+        self.g_level.setItemText(43, QCoreApplication.translate("GeneralTab", u"5-4", None))
+        self.g_level.setItemText(44, QCoreApplication.translate("GeneralTab", u"5-5", None))
+        self.g_level.setItemText(45, QCoreApplication.translate("GeneralTab", u"5-6", None))
+        self.g_level.setItemText(46, QCoreApplication.translate("GeneralTab", u"5-7", None))
+        self.g_level.setItemText(47, QCoreApplication.translate("GeneralTab", u"5-8", None))
+        self.g_level.setItemText(48, QCoreApplication.translate("GeneralTab", u"5-9", None))
+        self.g_level.setItemText(49, QCoreApplication.translate("GeneralTab", u"5-10", None))
+
+        self.label_10.setText(QCoreApplication.translate("GeneralTab", u"Completed Adventure Mode:", None))
+        self.g_completed.setSuffix("")
+        self.label_18.setText(QCoreApplication.translate("GeneralTab", u"times", None))
+        self.label_8.setText(QCoreApplication.translate("GeneralTab", u"Money:", None))
+        self.label_20.setText(QCoreApplication.translate("GeneralTab", u"$", None))
+        self.g_money.setPrefix("")
+        self.g_minigames_unlocked.setText(QCoreApplication.translate("GeneralTab", u"Mini-games unlocked", None))
+        self.g_puzzle_unlocked.setText(QCoreApplication.translate("GeneralTab", u"Puzzle mode unlocked", None))
+        self.g_taco.setText(QCoreApplication.translate("GeneralTab", u"Has Magic Taco", None))
+        self.groupBox_7.setTitle(QCoreApplication.translate("GeneralTab", u"Shop", None))
+        self.label_11.setText(QCoreApplication.translate("GeneralTab", u"Number of slots", None))
+        self.g_roof_cleaner.setText(QCoreApplication.translate("GeneralTab", u"Roof Cleaner", None))
+        self.g_pool_cleaner.setText(QCoreApplication.translate("GeneralTab", u"Pool Cleaner", None))
+        self.label_66.setText(QCoreApplication.translate("GeneralTab", u"Uses of rake:", None))
+        self.groupBox_8.setTitle(QCoreApplication.translate("GeneralTab", u"Plants", None))
+        self.g_plants_8.setText(QCoreApplication.translate("GeneralTab", u"Cob cannon", None))
+        self.g_plants_7.setText(QCoreApplication.translate("GeneralTab", u"Water Melon", None))
+        self.g_plants_3.setText(QCoreApplication.translate("GeneralTab", u"Cattail", None))
+        self.g_plants_4.setText(QCoreApplication.translate("GeneralTab", u"Gloom-shroom", None))
+        self.g_plants_5.setText(QCoreApplication.translate("GeneralTab", u"Spikerock", None))
+        self.g_plants_1.setText(QCoreApplication.translate("GeneralTab", u"Gatling Pea", None))
+        self.g_plants_2.setText(QCoreApplication.translate("GeneralTab", u"Twin Sunflowers", None))
+        self.g_plants_10.setText(QCoreApplication.translate("GeneralTab", u"Wall-nut First Aid", None))
+        self.g_plants_6.setText(QCoreApplication.translate("GeneralTab", u"Gold Magnet", None))
+        self.g_plants_9.setText(QCoreApplication.translate("GeneralTab", u"The Imitater", None))
+        pass
+    # retranslateUi
+
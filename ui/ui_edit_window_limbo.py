@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'edit_window_limbo.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QGridLayout, QGroupBox,
+    QHBoxLayout, QLabel, QSizePolicy, QSpacerItem,
+    QSpinBox, QVBoxLayout, QWidget)
+
+class Ui_LimboTab(object):
+    def setupUi(self, tab_6):
+        if not tab_6.objectName():
+            tab_6.setObjectName(u"tab_6")
+        self.verticalLayout_11 = QVBoxLayout(tab_6)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.groupBox_6 = QGroupBox(tab_6)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.gridLayout_13 = QGridLayout(self.groupBox_6)
+        self.gridLayout_13.setObjectName(u"gridLayout_13")
+        self.gridLayout_13.setContentsMargins(-1, 5, -1, 5)
+        self.gridLayout_12 = QGridLayout()
+        self.gridLayout_12.setObjectName(u"gridLayout_12")
+        self.horizontalLayout_20 = QHBoxLayout()
+        self.horizontalLayout_20.setObjectName(u"horizontalLayout_20")
+        self.label_33 = QLabel(self.groupBox_6)
+        self.label_33.setObjectName(u"label_33")
+
+        self.horizontalLayout_20.addWidget(self.label_33)
+
+        self.l_survend_4 = QSpinBox(self.groupBox_6)
+        self.l_survend_4.setObjectName(u"l_survend_4")
+        self.l_survend_4.setMaximum(2147483647)
+
+        self.horizontalLayout_20.addWidget(self.l_survend_4)
+
+
+        self.gridLayout_12.addLayout(self.horizontalLayout_20, 0, 3, 1, 1)
+
+        self.horizontalLayout_18 = QHBoxLayout()
+        self.horizontalLayout_18.setObjectName(u"horizontalLayout_18")
+        self.label_29 = QLabel(self.groupBox_6)
+        self.label_29.setObjectName(u"label_29")
+
+        self.horizontalLayout_18.addWidget(self.label_29)
+
+        self.l_survend_2 = QSpinBox(self.groupBox_6)
+        self.l_survend_2.setObjectName(u"l_survend_2")
+        self.l_survend_2.setMaximum(2147483647)
+
+        self.horizontalLayout_18.addWidget(self.l_survend_2)
+
+
+        self.gridLayout_12.addLayout(self.horizontalLayout_18, 0, 1, 1, 1)
+
+        self.horizontalLayout_19 = QHBoxLayout()
+        self.horizontalLayout_19.setObjectName(u"horizontalLayout_19")
+        self.label_31 = QLabel(self.groupBox_6)
+        self.label_31.setObjectName(u"label_31")
+
+        self.horizontalLayout_19.addWidget(self.label_31)
+
+        self.l_survend_3 = QSpinBox(self.groupBox_6)
+        self.l_survend_3.setObjectName(u"l_survend_3")
+        self.l_survend_3.setMaximum(2147483647)
+
+        self.horizontalLayout_19.addWidget(self.l_survend_3)
+
+
+        self.gridLayout_12.addLayout(self.horizontalLayout_19, 0, 2, 1, 1)
+
+        self.horizontalLayout_16 = QHBoxLayout()
+        self.horizontalLayout_16.setObjectName(u"horizontalLayout_16")
+        self.label_25 = QLabel(self.groupBox_6)
+        self.label_25.setObjectName(u"label_25")
+
+        self.horizontalLayout_16.addWidget(self.label_25)
+
+        self.l_survend_1 = QSpinBox(self.groupBox_6)
+        self.l_survend_1.setObjectName(u"l_survend_1")
+        self.l_survend_1.setMaximum(2147483647)
+
+        self.horizontalLayout_16.addWidget(self.l_survend_1)
+
+
+        self.gridLayout_12.addLayout(self.horizontalLayout_16, 0, 0, 1, 1)
+
+
+        self.gridLayout_13.addLayout(self.gridLayout_12, 0, 0, 1, 1)
+
+
+        self.verticalLayout_11.addWidget(self.groupBox_6)
+
+        self.groupBox_12 = QGroupBox(tab_6)
+        self.groupBox_12.setObjectName(u"groupBox_12")
+        self.gridLayout_26 = QGridLayout(self.groupBox_12)
+        self.gridLayout_26.setObjectName(u"gridLayout_26")
+        self.l_mg_1 = QCheckBox(self.groupBox_12)
+        self.l_mg_1.setObjectName(u"l_mg_1")
+
+        self.gridLayout_26.addWidget(self.l_mg_1, 0, 0, 1, 1)
+
+        self.l_mg_2 = QCheckBox(self.groupBox_12)
+        self.l_mg_2.setObjectName(u"l_mg_2")
+
+        self.gridLayout_26.addWidget(self.l_mg_2, 0, 1, 1, 1)
+
+        self.l_mg_3 = QCheckBox(self.groupBox_12)
+        self.l_mg_3.setObjectName(u"l_mg_3")
+
+        self.gridLayout_26.addWidget(self.l_mg_3, 0, 2, 1, 1)
+
+        self.l_mg_4 = QCheckBox(self.groupBox_12)
+        self.l_mg_4.setObjectName(u"l_mg_4")
+
+        self.gridLayout_26.addWidget(self.l_mg_4, 0, 3, 1, 1)
+
+        self.l_mg_5 = QCheckBox(self.groupBox_12)
+        self.l_mg_5.setObjectName(u"l_mg_5")
+
+        self.gridLayout_26.addWidget(self.l_mg_5, 0, 4, 1, 1)
+
+        self.l_mg_6 = QCheckBox(self.groupBox_12)
+        self.l_mg_6.setObjectName(u"l_mg_6")
+
+        self.gridLayout_26.addWidget(self.l_mg_6, 1, 0, 1, 1)
+
+        self.l_mg_7 = QCheckBox(self.groupBox_12)
+        self.l_mg_7.setObjectName(u"l_mg_7")
+
+        self.gridLayout_26.addWidget(self.l_mg_7, 1, 1, 1, 1)
+
+        self.l_mg_8 = QCheckBox(self.groupBox_12)
+        self.l_mg_8.setObjectName(u"l_mg_8")
+
+        self.gridLayout_26.addWidget(self.l_mg_8, 1, 2, 1, 1)
+
+        self.l_mg_9 = QCheckBox(self.groupBox_12)
+        self.l_mg_9.setObjectName(u"l_mg_9")
+
+        self.gridLayout_26.addWidget(self.l_mg_9, 1, 3, 1, 1)
+
+        self.l_mg_10 = QCheckBox(self.groupBox_12)
+        self.l_mg_10.setObjectName(u"l_mg_10")
+
+        self.gridLayout_26.addWidget(self.l_mg_10, 1, 4, 1, 1)
+
+        self.l_mg_11 = QCheckBox(self.groupBox_12)
+        self.l_mg_11.setObjectName(u"l_mg_11")
+
+        self.gridLayout_26.addWidget(self.l_mg_11, 2, 0, 1, 1)
+
+        self.l_mg_12 = QCheckBox(self.groupBox_12)
+        self.l_mg_12.setObjectName(u"l_mg_12")
+
+        self.gridLayout_26.addWidget(self.l_mg_12, 2, 1, 1, 1)
+
+        self.l_mg_13 = QCheckBox(self.groupBox_12)
+        self.l_mg_13.setObjectName(u"l_mg_13")
+
+        self.gridLayout_26.addWidget(self.l_mg_13, 2, 2, 1, 1)
+
+        self.l_mg_14 = QCheckBox(self.groupBox_12)
+        self.l_mg_14.setObjectName(u"l_mg_14")
+
+        self.gridLayout_26.addWidget(self.l_mg_14, 2, 3, 1, 1)
+
+        self.l_mg_15 = QCheckBox(self.groupBox_12)
+        self.l_mg_15.setObjectName(u"l_mg_15")
+
+        self.gridLayout_26.addWidget(self.l_mg_15, 2, 4, 1, 1)
+
+        self.l_mg_16 = QCheckBox(self.groupBox_12)
+        self.l_mg_16.setObjectName(u"l_mg_16")
+
+        self.gridLayout_26.addWidget(self.l_mg_16, 3, 0, 1, 1)
+
+
+        self.verticalLayout_11.addWidget(self.groupBox_12)
+
+        self.verticalSpacer_5 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_11.addItem(self.verticalSpacer_5)
+
+
+        self.retranslateUi(tab_6)
+
+        QMetaObject.connectSlotsByName(tab_6)
+    # setupUi
+
+    def retranslateUi(self, tab_6):
+        self.groupBox_6.setTitle(QCoreApplication.translate("LimboTab", u"Survival Endless", None))
+        self.label_33.setText(QCoreApplication.translate("LimboTab", u"Roof", None))
+        self.l_survend_4.setSuffix(QCoreApplication.translate("LimboTab", u" flags", None))
+        self.label_29.setText(QCoreApplication.translate("LimboTab", u"Night", None))
+        self.l_survend_2.setSuffix(QCoreApplication.translate("LimboTab", u" flags", None))
+        self.label_31.setText(QCoreApplication.translate("LimboTab", u"Fog", None))
+        self.l_survend_3.setSuffix(QCoreApplication.translate("LimboTab", u" flags", None))
+        self.label_25.setText(QCoreApplication.translate("LimboTab", u"Day", None))
+        self.l_survend_1.setSuffix(QCoreApplication.translate("LimboTab", u" flags", None))
+        self.groupBox_12.setTitle(QCoreApplication.translate("LimboTab", u"Mini-games", None))
+        self.l_mg_1.setText(QCoreApplication.translate("LimboTab", u"Art Challenge Wall-nut", None))
+        self.l_mg_2.setText(QCoreApplication.translate("LimboTab", u"Sunny Day", None))
+        self.l_mg_3.setText(QCoreApplication.translate("LimboTab", u"Unsodded", None))
+        self.l_mg_4.setText(QCoreApplication.translate("LimboTab", u"Buy Time", None))
+        self.l_mg_5.setText(QCoreApplication.translate("LimboTab", u"Art Challenge Sunflower", None))
+        self.l_mg_6.setText(QCoreApplication.translate("LimboTab", u"Air Raid", None))
+        self.l_mg_7.setText(QCoreApplication.translate("LimboTab", u"Ice Level", None))
+        self.l_mg_8.setText(QCoreApplication.translate("LimboTab", u"Zen Garden", None))
+        self.l_mg_9.setText(QCoreApplication.translate("LimboTab", u"High Gravity", None))
+        self.l_mg_10.setText(QCoreApplication.translate("LimboTab", u"Grave Danger", None))
+        self.l_mg_11.setText(QCoreApplication.translate("LimboTab", u"Can You Dig It?", None))
+        self.l_mg_12.setText(QCoreApplication.translate("LimboTab", u"Dark Stormy Night", None))
+        self.l_mg_13.setText(QCoreApplication.translate("LimboTab", u"Bungee Blitz", None))
+        self.l_mg_14.setText(QCoreApplication.translate("LimboTab", u"Intro", None))
+        self.l_mg_15.setText(QCoreApplication.translate("LimboTab", u"Tree of Wisdom", None))
+        self.l_mg_16.setText(QCoreApplication.translate("LimboTab", u"Upsell", None))
+        pass
+    # retranslateUi
+
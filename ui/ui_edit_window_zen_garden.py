@@ -0,0 +1,829 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'edit_window_zen_garden.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractSpinBox, QApplication, QCheckBox, QComboBox,
+    QDateEdit, QDoubleSpinBox, QGridLayout, QGroupBox,
+    QHBoxLayout, QLabel, QListView, QPushButton,
+    QSizePolicy, QSpacerItem, QSpinBox, QVBoxLayout,
+    QWidget)
+
+class Ui_ZenGardenTab(object):
+    def setupUi(self, tab_2):
+        if not tab_2.objectName():
+            tab_2.setObjectName(u"tab_2")
+        self.gridLayout_22 = QGridLayout(tab_2)
+        self.gridLayout_22.setObjectName(u"gridLayout_22")
+        self.verticalLayout_9 = QVBoxLayout()
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.zg_plants_label = QLabel(tab_2)
+        self.zg_plants_label.setObjectName(u"zg_plants_label")
+
+        self.verticalLayout_9.addWidget(self.zg_plants_label)
+
+        self.zg_plant_list = QListView(tab_2)
+        self.zg_plant_list.setObjectName(u"zg_plant_list")
+
+        self.verticalLayout_9.addWidget(self.zg_plant_list)
+
+        self.horizontalLayout_45 = QHBoxLayout()
+        self.horizontalLayout_45.setObjectName(u"horizontalLayout_45")
+        self.zg_add_plant = QPushButton(tab_2)
+        self.zg_add_plant.setObjectName(u"zg_add_plant")
+
+        self.horizontalLayout_45.addWidget(self.zg_add_plant)
+
+        self.zg_del_plant = QPushButton(tab_2)
+        self.zg_del_plant.setObjectName(u"zg_del_plant")
+        self.zg_del_plant.setEnabled(False)
+
+        self.horizontalLayout_45.addWidget(self.zg_del_plant)
+
+        self.zg_dup_plant = QPushButton(tab_2)
+        self.zg_dup_plant.setObjectName(u"zg_dup_plant")
+        self.zg_dup_plant.setEnabled(False)
+
+        self.horizontalLayout_45.addWidget(self.zg_dup_plant)
+
+
+        self.verticalLayout_9.addLayout(self.horizontalLayout_45)
+
+        self.groupBox_11 = QGroupBox(tab_2)
+        self.groupBox_11.setObjectName(u"groupBox_11")
+        self.groupBox_11.setEnabled(False)
+        self.gridLayout_23 = QGridLayout(self.groupBox_11)
+        self.gridLayout_23.setObjectName(u"gridLayout_23")
+        self.verticalLayout_8 = QVBoxLayout()
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.horizontalLayout_37 = QHBoxLayout()
+        self.horizontalLayout_37.setObjectName(u"horizontalLayout_37")
+        self.label_37 = QLabel(self.groupBox_11)
+        self.label_37.setObjectName(u"label_37")
+
+        self.horizontalLayout_37.addWidget(self.label_37)
+
+        self.zg_plant_type = QComboBox(self.groupBox_11)
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.addItem("")
+        self.zg_plant_type.setObjectName(u"zg_plant_type")
+
+        self.horizontalLayout_37.addWidget(self.zg_plant_type)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_37)
+
+        self.horizontalLayout_38 = QHBoxLayout()
+        self.horizontalLayout_38.setObjectName(u"horizontalLayout_38")
+        self.label_38 = QLabel(self.groupBox_11)
+        self.label_38.setObjectName(u"label_38")
+
+        self.horizontalLayout_38.addWidget(self.label_38)
+
+        self.zg_plant_color = QComboBox(self.groupBox_11)
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.addItem("")
+        self.zg_plant_color.setObjectName(u"zg_plant_color")
+
+        self.horizontalLayout_38.addWidget(self.zg_plant_color)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_38)
+
+        self.horizontalLayout_39 = QHBoxLayout()
+        self.horizontalLayout_39.setObjectName(u"horizontalLayout_39")
+        self.label_39 = QLabel(self.groupBox_11)
+        self.label_39.setObjectName(u"label_39")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_39.sizePolicy().hasHeightForWidth())
+        self.label_39.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_39.addWidget(self.label_39)
+
+        self.zg_plant_row = QSpinBox(self.groupBox_11)
+        self.zg_plant_row.setObjectName(u"zg_plant_row")
+        self.zg_plant_row.setMaximum(9)
+
+        self.horizontalLayout_39.addWidget(self.zg_plant_row)
+
+        self.label_40 = QLabel(self.groupBox_11)
+        self.label_40.setObjectName(u"label_40")
+        sizePolicy.setHeightForWidth(self.label_40.sizePolicy().hasHeightForWidth())
+        self.label_40.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_39.addWidget(self.label_40)
+
+        self.zg_plant_col = QSpinBox(self.groupBox_11)
+        self.zg_plant_col.setObjectName(u"zg_plant_col")
+        self.zg_plant_col.setMaximum(9)
+
+        self.horizontalLayout_39.addWidget(self.zg_plant_col)
+
+        self.label_48 = QLabel(self.groupBox_11)
+        self.label_48.setObjectName(u"label_48")
+
+        self.horizontalLayout_39.addWidget(self.label_48)
+
+        self.zg_plant_loc = QComboBox(self.groupBox_11)
+        self.zg_plant_loc.addItem("")
+        self.zg_plant_loc.addItem("")
+        self.zg_plant_loc.addItem("")
+        self.zg_plant_loc.addItem("")
+        self.zg_plant_loc.setObjectName(u"zg_plant_loc")
+
+        self.horizontalLayout_39.addWidget(self.zg_plant_loc)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_39)
+
+        self.horizontalLayout_40 = QHBoxLayout()
+        self.horizontalLayout_40.setObjectName(u"horizontalLayout_40")
+        self.label_41 = QLabel(self.groupBox_11)
+        self.label_41.setObjectName(u"label_41")
+        sizePolicy.setHeightForWidth(self.label_41.sizePolicy().hasHeightForWidth())
+        self.label_41.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_40.addWidget(self.label_41)
+
+        self.zg_plant_watered = QSpinBox(self.groupBox_11)
+        self.zg_plant_watered.setObjectName(u"zg_plant_watered")
+
+        self.horizontalLayout_40.addWidget(self.zg_plant_watered)
+
+        self.label_42 = QLabel(self.groupBox_11)
+        self.label_42.setObjectName(u"label_42")
+
+        self.horizontalLayout_40.addWidget(self.label_42)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_40)
+
+        self.horizontalLayout_42 = QHBoxLayout()
+        self.horizontalLayout_42.setObjectName(u"horizontalLayout_42")
+        self.label_45 = QLabel(self.groupBox_11)
+        self.label_45.setObjectName(u"label_45")
+
+        self.horizontalLayout_42.addWidget(self.label_45)
+
+        self.dateEdit_4 = QDateEdit(self.groupBox_11)
+        self.dateEdit_4.setObjectName(u"dateEdit_4")
+        self.dateEdit_4.setWrapping(False)
+        self.dateEdit_4.setButtonSymbols(QAbstractSpinBox.UpDownArrows)
+        self.dateEdit_4.setAccelerated(False)
+        self.dateEdit_4.setProperty(u"showGroupSeparator", False)
+        self.dateEdit_4.setCalendarPopup(True)
+        self.dateEdit_4.setDate(QDate(2000, 1, 1))
+
+        self.horizontalLayout_42.addWidget(self.dateEdit_4)
+
+        self.checkBox_88 = QCheckBox(self.groupBox_11)
+        self.checkBox_88.setObjectName(u"checkBox_88")
+
+        self.horizontalLayout_42.addWidget(self.checkBox_88)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_42)
+
+        self.horizontalLayout_41 = QHBoxLayout()
+        self.horizontalLayout_41.setObjectName(u"horizontalLayout_41")
+        self.label_43 = QLabel(self.groupBox_11)
+        self.label_43.setObjectName(u"label_43")
+        sizePolicy.setHeightForWidth(self.label_43.sizePolicy().hasHeightForWidth())
+        self.label_43.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_41.addWidget(self.label_43)
+
+        self.spinBox_28 = QSpinBox(self.groupBox_11)
+        self.spinBox_28.setObjectName(u"spinBox_28")
+
+        self.horizontalLayout_41.addWidget(self.spinBox_28)
+
+        self.label_44 = QLabel(self.groupBox_11)
+        self.label_44.setObjectName(u"label_44")
+
+        self.horizontalLayout_41.addWidget(self.label_44)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_41)
+
+        self.horizontalLayout_43 = QHBoxLayout()
+        self.horizontalLayout_43.setObjectName(u"horizontalLayout_43")
+        self.label_46 = QLabel(self.groupBox_11)
+        self.label_46.setObjectName(u"label_46")
+
+        self.horizontalLayout_43.addWidget(self.label_46)
+
+        self.dateEdit_5 = QDateEdit(self.groupBox_11)
+        self.dateEdit_5.setObjectName(u"dateEdit_5")
+        self.dateEdit_5.setWrapping(False)
+        self.dateEdit_5.setButtonSymbols(QAbstractSpinBox.UpDownArrows)
+        self.dateEdit_5.setAccelerated(False)
+        self.dateEdit_5.setProperty(u"showGroupSeparator", False)
+        self.dateEdit_5.setCalendarPopup(True)
+        self.dateEdit_5.setDate(QDate(2000, 1, 1))
+
+        self.horizontalLayout_43.addWidget(self.dateEdit_5)
+
+        self.checkBox_89 = QCheckBox(self.groupBox_11)
+        self.checkBox_89.setObjectName(u"checkBox_89")
+
+        self.horizontalLayout_43.addWidget(self.checkBox_89)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_43)
+
+        self.horizontalLayout_44 = QHBoxLayout()
+        self.horizontalLayout_44.setObjectName(u"horizontalLayout_44")
+        self.label_47 = QLabel(self.groupBox_11)
+        self.label_47.setObjectName(u"label_47")
+
+        self.horizontalLayout_44.addWidget(self.label_47)
+
+        self.zg_plant_hn = QComboBox(self.groupBox_11)
+        self.zg_plant_hn.addItem("")
+        self.zg_plant_hn.addItem("")
+        self.zg_plant_hn.addItem("")
+        self.zg_plant_hn.setObjectName(u"zg_plant_hn")
+
+        self.horizontalLayout_44.addWidget(self.zg_plant_hn)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_44)
+
+
+        self.gridLayout_23.addLayout(self.verticalLayout_8, 0, 0, 1, 1)
+
+
+        self.verticalLayout_9.addWidget(self.groupBox_11)
+
+
+        self.gridLayout_22.addLayout(self.verticalLayout_9, 0, 1, 1, 1)
+
+        self.verticalLayout_7 = QVBoxLayout()
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.horizontalLayout_26 = QHBoxLayout()
+        self.horizontalLayout_26.setObjectName(u"horizontalLayout_26")
+        self.label_12 = QLabel(tab_2)
+        self.label_12.setObjectName(u"label_12")
+
+        self.horizontalLayout_26.addWidget(self.label_12)
+
+        self.zg_mg1_date = QDateEdit(tab_2)
+        self.zg_mg1_date.setObjectName(u"zg_mg1_date")
+        self.zg_mg1_date.setEnabled(False)
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.zg_mg1_date.sizePolicy().hasHeightForWidth())
+        self.zg_mg1_date.setSizePolicy(sizePolicy1)
+        self.zg_mg1_date.setMinimumSize(QSize(200, 0))
+        self.zg_mg1_date.setWrapping(False)
+        self.zg_mg1_date.setButtonSymbols(QAbstractSpinBox.UpDownArrows)
+        self.zg_mg1_date.setAccelerated(False)
+        self.zg_mg1_date.setProperty(u"showGroupSeparator", False)
+        self.zg_mg1_date.setCalendarPopup(True)
+        self.zg_mg1_date.setDate(QDate(2000, 1, 1))
+
+        self.horizontalLayout_26.addWidget(self.zg_mg1_date)
+
+        self.zg_mg1_never = QCheckBox(tab_2)
+        self.zg_mg1_never.setObjectName(u"zg_mg1_never")
+        self.zg_mg1_never.setChecked(True)
+
+        self.horizontalLayout_26.addWidget(self.zg_mg1_never)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_26)
+
+        self.horizontalLayout_27 = QHBoxLayout()
+        self.horizontalLayout_27.setObjectName(u"horizontalLayout_27")
+        self.label_14 = QLabel(tab_2)
+        self.label_14.setObjectName(u"label_14")
+
+        self.horizontalLayout_27.addWidget(self.label_14)
+
+        self.zg_mg2_date = QDateEdit(tab_2)
+        self.zg_mg2_date.setObjectName(u"zg_mg2_date")
+        self.zg_mg2_date.setEnabled(False)
+        sizePolicy1.setHeightForWidth(self.zg_mg2_date.sizePolicy().hasHeightForWidth())
+        self.zg_mg2_date.setSizePolicy(sizePolicy1)
+        self.zg_mg2_date.setMinimumSize(QSize(200, 0))
+        self.zg_mg2_date.setWrapping(False)
+        self.zg_mg2_date.setButtonSymbols(QAbstractSpinBox.UpDownArrows)
+        self.zg_mg2_date.setAccelerated(False)
+        self.zg_mg2_date.setProperty(u"showGroupSeparator", False)
+        self.zg_mg2_date.setCalendarPopup(True)
+        self.zg_mg2_date.setDate(QDate(2000, 1, 1))
+
+        self.horizontalLayout_27.addWidget(self.zg_mg2_date)
+
+        self.zg_mg2_never = QCheckBox(tab_2)
+        self.zg_mg2_never.setObjectName(u"zg_mg2_never")
+        self.zg_mg2_never.setChecked(True)
+
+        self.horizontalLayout_27.addWidget(self.zg_mg2_never)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_27)
+
+        self.horizontalLayout_28 = QHBoxLayout()
+        self.horizontalLayout_28.setObjectName(u"horizontalLayout_28")
+        self.label_16 = QLabel(tab_2)
+        self.label_16.setObjectName(u"label_16")
+
+        self.horizontalLayout_28.addWidget(self.label_16)
+
+        self.zg_mg3_date = QDateEdit(tab_2)
+        self.zg_mg3_date.setObjectName(u"zg_mg3_date")
+        self.zg_mg3_date.setEnabled(False)
+        sizePolicy1.setHeightForWidth(self.zg_mg3_date.sizePolicy().hasHeightForWidth())
+        self.zg_mg3_date.setSizePolicy(sizePolicy1)
+        self.zg_mg3_date.setMinimumSize(QSize(200, 0))
+        self.zg_mg3_date.setWrapping(False)
+        self.zg_mg3_date.setButtonSymbols(QAbstractSpinBox.UpDownArrows)
+        self.zg_mg3_date.setAccelerated(False)
+        self.zg_mg3_date.setProperty(u"showGroupSeparator", False)
+        self.zg_mg3_date.setCalendarPopup(True)
+        self.zg_mg3_date.setDate(QDate(2000, 1, 1))
+
+        self.horizontalLayout_28.addWidget(self.zg_mg3_date)
+
+        self.zg_mg3_never = QCheckBox(tab_2)
+        self.zg_mg3_never.setObjectName(u"zg_mg3_never")
+        self.zg_mg3_never.setChecked(True)
+
+        self.horizontalLayout_28.addWidget(self.zg_mg3_never)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_28)
+
+        self.horizontalLayout_31 = QHBoxLayout()
+        self.horizontalLayout_31.setObjectName(u"horizontalLayout_31")
+        self.zg_golden_can = QCheckBox(tab_2)
+        self.zg_golden_can.setObjectName(u"zg_golden_can")
+
+        self.horizontalLayout_31.addWidget(self.zg_golden_can)
+
+        self.zg_phonograph = QCheckBox(tab_2)
+        self.zg_phonograph.setObjectName(u"zg_phonograph")
+
+        self.horizontalLayout_31.addWidget(self.zg_phonograph)
+
+        self.zg_glove = QCheckBox(tab_2)
+        self.zg_glove.setObjectName(u"zg_glove")
+
+        self.horizontalLayout_31.addWidget(self.zg_glove)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_31)
+
+        self.horizontalLayout_34 = QHBoxLayout()
+        self.horizontalLayout_34.setObjectName(u"horizontalLayout_34")
+        self.label_35 = QLabel(tab_2)
+        self.label_35.setObjectName(u"label_35")
+
+        self.horizontalLayout_34.addWidget(self.label_35)
+
+        self.zg_fertilizer = QSpinBox(tab_2)
+        self.zg_fertilizer.setObjectName(u"zg_fertilizer")
+        self.zg_fertilizer.setEnabled(False)
+
+        self.horizontalLayout_34.addWidget(self.zg_fertilizer)
+
+        self.zg_fertilizer_np = QCheckBox(tab_2)
+        self.zg_fertilizer_np.setObjectName(u"zg_fertilizer_np")
+        self.zg_fertilizer_np.setChecked(True)
+
+        self.horizontalLayout_34.addWidget(self.zg_fertilizer_np)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_34)
+
+        self.horizontalLayout_35 = QHBoxLayout()
+        self.horizontalLayout_35.setObjectName(u"horizontalLayout_35")
+        self.label_36 = QLabel(tab_2)
+        self.label_36.setObjectName(u"label_36")
+
+        self.horizontalLayout_35.addWidget(self.label_36)
+
+        self.zg_bugspray = QSpinBox(tab_2)
+        self.zg_bugspray.setObjectName(u"zg_bugspray")
+        self.zg_bugspray.setEnabled(False)
+
+        self.horizontalLayout_35.addWidget(self.zg_bugspray)
+
+        self.zg_bugspray_np = QCheckBox(tab_2)
+        self.zg_bugspray_np.setObjectName(u"zg_bugspray_np")
+        self.zg_bugspray_np.setChecked(True)
+
+        self.horizontalLayout_35.addWidget(self.zg_bugspray_np)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_35)
+
+        self.horizontalLayout_36 = QHBoxLayout()
+        self.horizontalLayout_36.setObjectName(u"horizontalLayout_36")
+        self.zg_mushroom_g = QCheckBox(tab_2)
+        self.zg_mushroom_g.setObjectName(u"zg_mushroom_g")
+
+        self.horizontalLayout_36.addWidget(self.zg_mushroom_g)
+
+        self.zg_aquarium_g = QCheckBox(tab_2)
+        self.zg_aquarium_g.setObjectName(u"zg_aquarium_g")
+
+        self.horizontalLayout_36.addWidget(self.zg_aquarium_g)
+
+        self.zg_wheelbarrow = QCheckBox(tab_2)
+        self.zg_wheelbarrow.setObjectName(u"zg_wheelbarrow")
+
+        self.horizontalLayout_36.addWidget(self.zg_wheelbarrow)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_36)
+
+        self.groupBox_10 = QGroupBox(tab_2)
+        self.groupBox_10.setObjectName(u"groupBox_10")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_10)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.zg_snail_purchased = QCheckBox(self.groupBox_10)
+        self.zg_snail_purchased.setObjectName(u"zg_snail_purchased")
+
+        self.verticalLayout_6.addWidget(self.zg_snail_purchased)
+
+        self.horizontalLayout_29 = QHBoxLayout()
+        self.horizontalLayout_29.setObjectName(u"horizontalLayout_29")
+        self.label_22 = QLabel(self.groupBox_10)
+        self.label_22.setObjectName(u"label_22")
+
+        self.horizontalLayout_29.addWidget(self.label_22)
+
+        self.zg_snail_lawoken = QDoubleSpinBox(self.groupBox_10)
+        self.zg_snail_lawoken.setObjectName(u"zg_snail_lawoken")
+        self.zg_snail_lawoken.setEnabled(False)
+        self.zg_snail_lawoken.setDecimals(1)
+
+        self.horizontalLayout_29.addWidget(self.zg_snail_lawoken)
+
+        self.label_24 = QLabel(self.groupBox_10)
+        self.label_24.setObjectName(u"label_24")
+
+        self.horizontalLayout_29.addWidget(self.label_24)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_29)
+
+        self.horizontalLayout_30 = QHBoxLayout()
+        self.horizontalLayout_30.setObjectName(u"horizontalLayout_30")
+        self.label_26 = QLabel(self.groupBox_10)
+        self.label_26.setObjectName(u"label_26")
+
+        self.horizontalLayout_30.addWidget(self.label_26)
+
+        self.zg_snail_lchoco = QDoubleSpinBox(self.groupBox_10)
+        self.zg_snail_lchoco.setObjectName(u"zg_snail_lchoco")
+        self.zg_snail_lchoco.setEnabled(False)
+        self.zg_snail_lchoco.setDecimals(1)
+
+        self.horizontalLayout_30.addWidget(self.zg_snail_lchoco)
+
+        self.label_28 = QLabel(self.groupBox_10)
+        self.label_28.setObjectName(u"label_28")
+
+        self.horizontalLayout_30.addWidget(self.label_28)
+
+        self.zg_snail_lchoco_never = QCheckBox(self.groupBox_10)
+        self.zg_snail_lchoco_never.setObjectName(u"zg_snail_lchoco_never")
+        self.zg_snail_lchoco_never.setChecked(True)
+
+        self.horizontalLayout_30.addWidget(self.zg_snail_lchoco_never)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_30)
+
+        self.horizontalLayout_66 = QHBoxLayout()
+        self.horizontalLayout_66.setObjectName(u"horizontalLayout_66")
+        self.horizontalLayout_67 = QHBoxLayout()
+        self.horizontalLayout_67.setObjectName(u"horizontalLayout_67")
+        self.label_67 = QLabel(self.groupBox_10)
+        self.label_67.setObjectName(u"label_67")
+
+        self.horizontalLayout_67.addWidget(self.label_67)
+
+        self.zg_snail_x = QSpinBox(self.groupBox_10)
+        self.zg_snail_x.setObjectName(u"zg_snail_x")
+
+        self.horizontalLayout_67.addWidget(self.zg_snail_x)
+
+
+        self.horizontalLayout_66.addLayout(self.horizontalLayout_67)
+
+        self.horizontalLayout_68 = QHBoxLayout()
+        self.horizontalLayout_68.setObjectName(u"horizontalLayout_68")
+        self.label_68 = QLabel(self.groupBox_10)
+        self.label_68.setObjectName(u"label_68")
+
+        self.horizontalLayout_68.addWidget(self.label_68)
+
+        self.zg_snail_y = QSpinBox(self.groupBox_10)
+        self.zg_snail_y.setObjectName(u"zg_snail_y")
+
+        self.horizontalLayout_68.addWidget(self.zg_snail_y)
+
+
+        self.horizontalLayout_66.addLayout(self.horizontalLayout_68)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_66)
+
+
+        self.verticalLayout_7.addWidget(self.groupBox_10)
+
+        self.groupBox_9 = QGroupBox(tab_2)
+        self.groupBox_9.setObjectName(u"groupBox_9")
+        self.gridLayout_21 = QGridLayout(self.groupBox_9)
+        self.gridLayout_21.setObjectName(u"gridLayout_21")
+        self.gridLayout_20 = QGridLayout()
+        self.gridLayout_20.setObjectName(u"gridLayout_20")
+        self.zg_food_purchased = QCheckBox(self.groupBox_9)
+        self.zg_food_purchased.setObjectName(u"zg_food_purchased")
+
+        self.gridLayout_20.addWidget(self.zg_food_purchased, 1, 0, 1, 1)
+
+        self.zg_tree_purchased = QCheckBox(self.groupBox_9)
+        self.zg_tree_purchased.setObjectName(u"zg_tree_purchased")
+
+        self.gridLayout_20.addWidget(self.zg_tree_purchased, 0, 0, 1, 1)
+
+        self.horizontalLayout_32 = QHBoxLayout()
+        self.horizontalLayout_32.setObjectName(u"horizontalLayout_32")
+        self.label_30 = QLabel(self.groupBox_9)
+        self.label_30.setObjectName(u"label_30")
+
+        self.horizontalLayout_32.addWidget(self.label_30)
+
+        self.zg_tree_height = QSpinBox(self.groupBox_9)
+        self.zg_tree_height.setObjectName(u"zg_tree_height")
+
+        self.horizontalLayout_32.addWidget(self.zg_tree_height)
+
+        self.label_32 = QLabel(self.groupBox_9)
+        self.label_32.setObjectName(u"label_32")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.label_32.sizePolicy().hasHeightForWidth())
+        self.label_32.setSizePolicy(sizePolicy2)
+
+        self.horizontalLayout_32.addWidget(self.label_32)
+
+
+        self.gridLayout_20.addLayout(self.horizontalLayout_32, 0, 1, 1, 1)
+
+        self.horizontalLayout_33 = QHBoxLayout()
+        self.horizontalLayout_33.setObjectName(u"horizontalLayout_33")
+        self.label_34 = QLabel(self.groupBox_9)
+        self.label_34.setObjectName(u"label_34")
+
+        self.horizontalLayout_33.addWidget(self.label_34)
+
+        self.zg_tree_food = QSpinBox(self.groupBox_9)
+        self.zg_tree_food.setObjectName(u"zg_tree_food")
+        self.zg_tree_food.setEnabled(False)
+
+        self.horizontalLayout_33.addWidget(self.zg_tree_food)
+
+
+        self.gridLayout_20.addLayout(self.horizontalLayout_33, 1, 1, 1, 1)
+
+
+        self.gridLayout_21.addLayout(self.gridLayout_20, 0, 0, 1, 1)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout_21.addItem(self.verticalSpacer_3, 1, 0, 1, 1)
+
+
+        self.verticalLayout_7.addWidget(self.groupBox_9)
+
+
+        self.gridLayout_22.addLayout(self.verticalLayout_7, 0, 0, 1, 1)
+
+
+        self.retranslateUi(tab_2)
+
+        self.zg_plant_color.setCurrentIndex(1)
+
+
+        QMetaObject.connectSlotsByName(tab_2)
+    # setupUi
+
+    def retranslateUi(self, tab_2):
+        self.zg_plants_label.setText(QCoreApplication.translate("ZenGardenTab", u"Plants:", None))
+        self.zg_add_plant.setText(QCoreApplication.translate("ZenGardenTab", u"Add", None))
+        self.zg_del_plant.setText(QCoreApplication.translate("ZenGardenTab", u"Delete", None))
+        self.zg_dup_plant.setText(QCoreApplication.translate("ZenGardenTab", u"Duplicate", None))
+        self.groupBox_11.setTitle(QCoreApplication.translate("ZenGardenTab", u"Plant Properties", None))
+        self.label_37.setText(QCoreApplication.translate("ZenGardenTab", u"Plant Type:", None))
+        self.zg_plant_type.setItemText(0, QCoreApplication.translate("ZenGardenTab", u"Peashooter", None))
+        self.zg_plant_type.setItemText(1, QCoreApplication.translate("ZenGardenTab", u"Sunflower", None))
+        self.zg_plant_type.setItemText(2, QCoreApplication.translate("ZenGardenTab", u"Cherry Bomb", None))
+        self.zg_plant_type.setItemText(3, QCoreApplication.translate("ZenGardenTab", u"Wall-nut", None))
+        self.zg_plant_type.setItemText(4, QCoreApplication.translate("ZenGardenTab", u"Potato Mine", None))
+        self.zg_plant_type.setItemText(5, QCoreApplication.translate("ZenGardenTab", u"Snow Pea", None))
+        self.zg_plant_type.setItemText(6, QCoreApplication.translate("ZenGardenTab", u"Chomper", None))
+        self.zg_plant_type.setItemText(7, QCoreApplication.translate("ZenGardenTab", u"Repeater", None))
+        self.zg_plant_type.setItemText(8, QCoreApplication.translate("ZenGardenTab", u"Puff-shroom", None))
+        self.zg_plant_type.setItemText(9, QCoreApplication.translate("ZenGardenTab", u"Sun-shroom", None))
+        self.zg_plant_type.setItemText(10, QCoreApplication.translate("ZenGardenTab", u"Fume-shroom", None))
+        self.zg_plant_type.setItemText(11, QCoreApplication.translate("ZenGardenTab", u"Grave Buster", None))
+        self.zg_plant_type.setItemText(12, QCoreApplication.translate("ZenGardenTab", u"Hypno-shroom", None))
+        self.zg_plant_type.setItemText(13, QCoreApplication.translate("ZenGardenTab", u"Scaredy-shroom", None))
+        self.zg_plant_type.setItemText(14, QCoreApplication.translate("ZenGardenTab", u"Ice-shroom", None))
+        self.zg_plant_type.setItemText(15, QCoreApplication.translate("ZenGardenTab", u"Doom-shroom", None))
+        self.zg_plant_type.setItemText(16, QCoreApplication.translate("ZenGardenTab", u"Lily Pad", None))
+        self.zg_plant_type.setItemText(17, QCoreApplication.translate("ZenGardenTab", u"Squash", None))
+        self.zg_plant_type.setItemText(18, QCoreApplication.translate("ZenGardenTab", u"Threepeater", None))
+        self.zg_plant_type.setItemText(19, QCoreApplication.translate("ZenGardenTab", u"Tangle Kelp", None))
+        self.zg_plant_type.setItemText(20, QCoreApplication.translate("ZenGardenTab", u"Jalapeno", None))
+        self.zg_plant_type.setItemText(21, QCoreApplication.translate("ZenGardenTab", u"Spikeweed", None))
+        self.zg_plant_type.setItemText(22, QCoreApplication.translate("ZenGardenTab", u"Torchwood", None))
+        self.zg_plant_type.setItemText(23, QCoreApplication.translate("ZenGardenTab", u"Tall-nut", None))
+        self.zg_plant_type.setItemText(24, QCoreApplication.translate("ZenGardenTab", u"Sea-shroom", None))
+        self.zg_plant_type.setItemText(25, QCoreApplication.translate("ZenGardenTab", u"Plantern", None))
+        self.zg_plant_type.setItemText(26, QCoreApplication.translate("ZenGardenTab", u"Cactus", None))
+        self.zg_plant_type.setItemText(27, QCoreApplication.translate("ZenGardenTab", u"Blover", None))
+        self.zg_plant_type.setItemText(28, QCoreApplication.translate("ZenGardenTab", u"Split Pea", None))
+        self.zg_plant_type.setItemText(29, QCoreApplication.translate("ZenGardenTab", u"Starfruit", None))
+        self.zg_plant_type.setItemText(30, QCoreApplication.translate("ZenGardenTab", u"Pumpkin", None))
+        self.zg_plant_type.setItemText(31, QCoreApplication.translate("ZenGardenTab", u"Magnet-shroom", None))
+        self.zg_plant_type.setItemText(32, QCoreApplication.translate("ZenGardenTab", u"Cabbage-pult", None))
+        self.zg_plant_type.setItemText(33, QCoreApplication.translate("ZenGardenTab", u"Flower Pot", None))
+        self.zg_plant_type.setItemText(34, QCoreApplication.translate("ZenGardenTab", u"Kernel-pult", None))
+        self.zg_plant_type.setItemText(35, QCoreApplication.translate("ZenGardenTab", u"Coffee Bean", None))
+        self.zg_plant_type.setItemText(36, QCoreApplication.translate("ZenGardenTab", u"Garlic", None))
+        self.zg_plant_type.setItemText(37, QCoreApplication.translate("ZenGardenTab", u"Umbrella Leaf", None))
+        self.zg_plant_type.setItemText(38, QCoreApplication.translate("ZenGardenTab", u"Marigold", None))
+        self.zg_plant_type.setItemText(39, QCoreApplication.translate("ZenGardenTab", u"Melon-pult", None))
+        self.zg_plant_type.setItemText(40, QCoreApplication.translate("ZenGardenTab", u"Gatling Pea", None))
+        self.zg_plant_type.setItemText(41, QCoreApplication.translate("ZenGardenTab", u"Twin Sunflower", None))
+        self.zg_plant_type.setItemText(42, QCoreApplication.translate("ZenGardenTab", u"Gloom-shroom", None))
+        self.zg_plant_type.setItemText(43, QCoreApplication.translate("ZenGardenTab", u"Cattail", None))
+        self.zg_plant_type.setItemText(44, QCoreApplication.translate("ZenGardenTab", u"Winter Melon", None))
+        self.zg_plant_type.setItemText(45, QCoreApplication.translate("ZenGardenTab", u"Gold Magnet", None))
+        self.zg_plant_type.setItemText(46, QCoreApplication.translate("ZenGardenTab", u"Spikerock", None))
+        self.zg_plant_type.setItemText(47, QCoreApplication.translate("ZenGardenTab", u"Cob Cannon", None))
+        self.zg_plant_type.setItemText(48, QCoreApplication.translate("ZenGardenTab", u"Imitater", None))
+        self.zg_plant_type.setItemText(49, QCoreApplication.translate("ZenGardenTab", u"Explode-o-nut", None))
+        self.zg_plant_type.setItemText(50, QCoreApplication.translate("ZenGardenTab", u"Giant Wall-nut", None))
+        self.zg_plant_type.setItemText(51, QCoreApplication.translate("ZenGardenTab", u"Sprout", None))
+        self.zg_plant_type.setItemText(52, QCoreApplication.translate("ZenGardenTab", u"Left-facing Repeater", None))
+
+        self.label_38.setText(QCoreApplication.translate("ZenGardenTab", u"Color:", None))
+        self.zg_plant_color.setItemText(0, QCoreApplication.translate("ZenGardenTab", u"Low saturation", None))
+        self.zg_plant_color.setItemText(1, QCoreApplication.translate("ZenGardenTab", u"Default color", None))
+        self.zg_plant_color.setItemText(2, QCoreApplication.translate("ZenGardenTab", u"Magenta", None))
+        self.zg_plant_color.setItemText(3, QCoreApplication.translate("ZenGardenTab", u"Orange", None))
+        self.zg_plant_color.setItemText(4, QCoreApplication.translate("ZenGardenTab", u"Pink", None))
+        self.zg_plant_color.setItemText(5, QCoreApplication.translate("ZenGardenTab", u"Cyan", None))
+        self.zg_plant_color.setItemText(6, QCoreApplication.translate("ZenGardenTab", u"Red", None))
+        self.zg_plant_color.setItemText(7, QCoreApplication.translate("ZenGardenTab", u"Blue", None))
+        self.zg_plant_color.setItemText(8, QCoreApplication.translate("ZenGardenTab", u"Purple", None))
+        self.zg_plant_color.setItemText(9, QCoreApplication.translate("ZenGardenTab", u"Light purple", None))
+        self.zg_plant_color.setItemText(10, QCoreApplication.translate("ZenGardenTab", u"Yellow", None))
+        self.zg_plant_color.setItemText(11, QCoreApplication.translate("ZenGardenTab", u"Light green", None))
+
+        self.label_39.setText(QCoreApplication.translate("ZenGardenTab", u"Row:", None))
+        self.label_40.setText(QCoreApplication.translate("ZenGardenTab", u"Column:", None))
+        self.label_48.setText(QCoreApplication.translate("ZenGardenTab", u"Location:", None))
+        self.zg_plant_loc.setItemText(0, QCoreApplication.translate("ZenGardenTab", u"Zen Garden", None))
+        self.zg_plant_loc.setItemText(1, QCoreApplication.translate("ZenGardenTab", u"Mushroom Garden", None))
+        self.zg_plant_loc.setItemText(2, QCoreApplication.translate("ZenGardenTab", u"Aquarium Garden", None))
+        self.zg_plant_loc.setItemText(3, QCoreApplication.translate("ZenGardenTab", u"Wheelbarrow", None))
+
+        self.label_41.setText(QCoreApplication.translate("ZenGardenTab", u"Watered:", None))
+        self.label_42.setText(QCoreApplication.translate("ZenGardenTab", u"times", None))
+        self.label_45.setText(QCoreApplication.translate("ZenGardenTab", u"Last watered:", None))
+        self.dateEdit_4.setDisplayFormat(QCoreApplication.translate("ZenGardenTab", u"dddd, MMMM dd, yyyy", None))
+        self.checkBox_88.setText(QCoreApplication.translate("ZenGardenTab", u"Never", None))
+        self.label_43.setText(QCoreApplication.translate("ZenGardenTab", u"Fertilized:", None))
+        self.label_44.setText(QCoreApplication.translate("ZenGardenTab", u"times", None))
+        self.label_46.setText(QCoreApplication.translate("ZenGardenTab", u"Last fertilized:", None))
+        self.dateEdit_5.setDisplayFormat(QCoreApplication.translate("ZenGardenTab", u"dddd, MMMM dd, yyyy", None))
+        self.checkBox_89.setText(QCoreApplication.translate("ZenGardenTab", u"Never", None))
+        self.label_47.setText(QCoreApplication.translate("ZenGardenTab", u"Needs for happiness:", None))
+        self.zg_plant_hn.setItemText(0, QCoreApplication.translate("ZenGardenTab", u"Nothing", None))
+        self.zg_plant_hn.setItemText(1, QCoreApplication.translate("ZenGardenTab", u"Phonograph", None))
+        self.zg_plant_hn.setItemText(2, QCoreApplication.translate("ZenGardenTab", u"Bug Spray", None))
+
+        self.label_12.setText(QCoreApplication.translate("ZenGardenTab", u"Marigold 1 last purchased on:", None))
+        self.zg_mg1_date.setDisplayFormat(QCoreApplication.translate("ZenGardenTab", u"dddd, MMMM d, yyyy", None))
+        self.zg_mg1_never.setText(QCoreApplication.translate("ZenGardenTab", u"Never", None))
+        self.label_14.setText(QCoreApplication.translate("ZenGardenTab", u"Marigold 2 last purchased on:", None))
+        self.zg_mg2_date.setDisplayFormat(QCoreApplication.translate("ZenGardenTab", u"dddd, MMMM d, yyyy", None))
+        self.zg_mg2_never.setText(QCoreApplication.translate("ZenGardenTab", u"Never", None))
+        self.label_16.setText(QCoreApplication.translate("ZenGardenTab", u"Marigold 3 last purchased on:", None))
+        self.zg_mg3_date.setDisplayFormat(QCoreApplication.translate("ZenGardenTab", u"dddd, MMMM d, yyyy", None))
+        self.zg_mg3_never.setText(QCoreApplication.translate("ZenGardenTab", u"Never", None))
+        self.zg_golden_can.setText(QCoreApplication.translate("ZenGardenTab", u"Golden Watering can", None))
+        self.zg_phonograph.setText(QCoreApplication.translate("ZenGardenTab", u"Phonograph", None))
+        self.zg_glove.setText(QCoreApplication.translate("ZenGardenTab", u"Gardening Glove", None))
+        self.label_35.setText(QCoreApplication.translate("ZenGardenTab", u"Fertilizer:", None))
+        self.zg_fertilizer_np.setText(QCoreApplication.translate("ZenGardenTab", u"Never Purchased", None))
+        self.label_36.setText(QCoreApplication.translate("ZenGardenTab", u"Bug spray:", None))
+        self.zg_bugspray_np.setText(QCoreApplication.translate("ZenGardenTab", u"Never Purchased", None))
+        self.zg_mushroom_g.setText(QCoreApplication.translate("ZenGardenTab", u"Mushroom Garden", None))
+        self.zg_aquarium_g.setText(QCoreApplication.translate("ZenGardenTab", u"Aquarium Garden", None))
+        self.zg_wheelbarrow.setText(QCoreApplication.translate("ZenGardenTab", u"Wheel barrow", None))
+        self.groupBox_10.setTitle(QCoreApplication.translate("ZenGardenTab", u"Stinky the Snail", None))
+        self.zg_snail_purchased.setText(QCoreApplication.translate("ZenGardenTab", u"Purchased", None))
+        self.label_22.setText(QCoreApplication.translate("ZenGardenTab", u"Last awoken:", None))
+        self.label_24.setText(QCoreApplication.translate("ZenGardenTab", u"minutes ago", None))
+        self.label_26.setText(QCoreApplication.translate("ZenGardenTab", u"Last chocolate:", None))
+        self.label_28.setText(QCoreApplication.translate("ZenGardenTab", u"minutes ago", None))
+        self.zg_snail_lchoco_never.setText(QCoreApplication.translate("ZenGardenTab", u"Never", None))
+        self.label_67.setText(QCoreApplication.translate("ZenGardenTab", u"Position X:", None))
+        self.label_68.setText(QCoreApplication.translate("ZenGardenTab", u"Position Y:", None))
+        self.groupBox_9.setTitle(QCoreApplication.translate("ZenGardenTab", u"Tree of Wisdom", None))
+        self.zg_food_purchased.setText(QCoreApplication.translate("ZenGardenTab", u"Purchased food", None))
+        self.zg_tree_purchased.setText(QCoreApplication.translate("ZenGardenTab", u"Purchased tree", None))
+        self.label_30.setText(QCoreApplication.translate("ZenGardenTab", u"Height:", None))
+        self.label_32.setText(QCoreApplication.translate("ZenGardenTab", u"feet", None))
+        self.label_34.setText(QCoreApplication.translate("ZenGardenTab", u"Food:", None))
+        pass
+    # retranslateUi
+
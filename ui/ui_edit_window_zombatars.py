@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'edit_window_zombatars.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QGridLayout,
+    QGroupBox, QHBoxLayout, QLabel, QListWidget,
+    QListWidgetItem, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_ZombatarsTab(object):
+    def setupUi(self, tab_5):
+        if not tab_5.objectName():
+            tab_5.setObjectName(u"tab_5")
+        self.gridLayout_25 = QGridLayout(tab_5)
+        self.gridLayout_25.setObjectName(u"gridLayout_25")
+        self.horizontalLayout_46 = QHBoxLayout()
+        self.horizontalLayout_46.setObjectName(u"horizontalLayout_46")
+        self.z_license = QCheckBox(tab_5)
+        self.z_license.setObjectName(u"z_license")
+
+        self.horizontalLayout_46.addWidget(self.z_license)
+
+        self.z_created_before = QCheckBox(tab_5)
+        self.z_created_before.setObjectName(u"z_created_before")
+
+        self.horizontalLayout_46.addWidget(self.z_created_before)
+
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_46.addItem(self.horizontalSpacer_7)
+
+
+        self.gridLayout_25.addLayout(self.horizontalLayout_46, 0, 0, 1, 2)
+
+        self.verticalLayout_10 = QVBoxLayout()
+        self.verticalLayout_10.setSpacing(6)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.listWidget_2 = QListWidget(tab_5)
+        self.listWidget_2.setObjectName(u"listWidget_2")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.listWidget_2.sizePolicy().hasHeightForWidth())
+        self.listWidget_2.setSizePolicy(sizePolicy)
+
+        self.verticalLayout_10.addWidget(self.listWidget_2)
+
+        self.horizontalLayout_47 = QHBoxLayout()
+        self.horizontalLayout_47.setObjectName(u"horizontalLayout_47")
+        self.pushButton_9 = QPushButton(tab_5)
+        self.pushButton_9.setObjectName(u"pushButton_9")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.pushButton_9.sizePolicy().hasHeightForWidth())
+        self.pushButton_9.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_47.addWidget(self.pushButton_9)
+
+        self.pushButton_11 = QPushButton(tab_5)
+        self.pushButton_11.setObjectName(u"pushButton_11")
+        self.pushButton_11.setEnabled(False)
+        sizePolicy1.setHeightForWidth(self.pushButton_11.sizePolicy().hasHeightForWidth())
+        self.pushButton_11.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_47.addWidget(self.pushButton_11)
+
+        self.pushButton_10 = QPushButton(tab_5)
+        self.pushButton_10.setObjectName(u"pushButton_10")
+        self.pushButton_10.setEnabled(False)
+        sizePolicy1.setHeightForWidth(self.pushButton_10.sizePolicy().hasHeightForWidth())
+        self.pushButton_10.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_47.addWidget(self.pushButton_10)
+
+
+        self.verticalLayout_10.addLayout(self.horizontalLayout_47)
+
+
+        self.gridLayout_25.addLayout(self.verticalLayout_10, 1, 0, 1, 1)
+
+        self.groupBox_13 = QGroupBox(tab_5)
+        self.groupBox_13.setObjectName(u"groupBox_13")
+        self.groupBox_13.setEnabled(False)
+        self.gridLayout_24 = QGridLayout(self.groupBox_13)
+        self.gridLayout_24.setObjectName(u"gridLayout_24")
+        self.gridLayout_27 = QGridLayout()
+        self.gridLayout_27.setObjectName(u"gridLayout_27")
+        self.horizontalLayout_54 = QHBoxLayout()
+        self.horizontalLayout_54.setObjectName(u"horizontalLayout_54")
+        self.label_55 = QLabel(self.groupBox_13)
+        self.label_55.setObjectName(u"label_55")
+
+        self.horizontalLayout_54.addWidget(self.label_55)
+
+        self.comboBox_11 = QComboBox(self.groupBox_13)
+        self.comboBox_11.setObjectName(u"comboBox_11")
+
+        self.horizontalLayout_54.addWidget(self.comboBox_11)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_54, 3, 1, 1, 1)
+
+        self.horizontalLayout_50 = QHBoxLayout()
+        self.horizontalLayout_50.setObjectName(u"horizontalLayout_50")
+        self.label_51 = QLabel(self.groupBox_13)
+        self.label_51.setObjectName(u"label_51")
+
+        self.horizontalLayout_50.addWidget(self.label_51)
+
+        self.comboBox_7 = QComboBox(self.groupBox_13)
+        self.comboBox_7.setObjectName(u"comboBox_7")
+
+        self.horizontalLayout_50.addWidget(self.comboBox_7)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_50, 1, 1, 1, 1)
+
+        self.horizontalLayout_63 = QHBoxLayout()
+        self.horizontalLayout_63.setObjectName(u"horizontalLayout_63")
+        self.label_64 = QLabel(self.groupBox_13)
+        self.label_64.setObjectName(u"label_64")
+
+        self.horizontalLayout_63.addWidget(self.label_64)
+
+        self.comboBox_20 = QComboBox(self.groupBox_13)
+        self.comboBox_20.setObjectName(u"comboBox_20")
+
+        self.horizontalLayout_63.addWidget(self.comboBox_20)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_63, 8, 0, 1, 1)
+
+        self.horizontalLayout_52 = QHBoxLayout()
+        self.horizontalLayout_52.setObjectName(u"horizontalLayout_52")
+        self.label_53 = QLabel(self.groupBox_13)
+        self.label_53.setObjectName(u"label_53")
+
+        self.horizontalLayout_52.addWidget(self.label_53)
+
+        self.comboBox_9 = QComboBox(self.groupBox_13)
+        self.comboBox_9.setObjectName(u"comboBox_9")
+
+        self.horizontalLayout_52.addWidget(self.comboBox_9)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_52, 2, 1, 1, 1)
+
+        self.horizontalLayout_55 = QHBoxLayout()
+        self.horizontalLayout_55.setObjectName(u"horizontalLayout_55")
+        self.label_56 = QLabel(self.groupBox_13)
+        self.label_56.setObjectName(u"label_56")
+
+        self.horizontalLayout_55.addWidget(self.label_56)
+
+        self.comboBox_12 = QComboBox(self.groupBox_13)
+        self.comboBox_12.setObjectName(u"comboBox_12")
+
+        self.horizontalLayout_55.addWidget(self.comboBox_12)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_55, 4, 0, 1, 1)
+
+        self.horizontalLayout_60 = QHBoxLayout()
+        self.horizontalLayout_60.setObjectName(u"horizontalLayout_60")
+        self.label_61 = QLabel(self.groupBox_13)
+        self.label_61.setObjectName(u"label_61")
+
+        self.horizontalLayout_60.addWidget(self.label_61)
+
+        self.comboBox_17 = QComboBox(self.groupBox_13)
+        self.comboBox_17.setObjectName(u"comboBox_17")
+
+        self.horizontalLayout_60.addWidget(self.comboBox_17)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_60, 6, 1, 1, 1)
+
+        self.horizontalLayout_56 = QHBoxLayout()
+        self.horizontalLayout_56.setObjectName(u"horizontalLayout_56")
+        self.label_57 = QLabel(self.groupBox_13)
+        self.label_57.setObjectName(u"label_57")
+
+        self.horizontalLayout_56.addWidget(self.label_57)
+
+        self.comboBox_13 = QComboBox(self.groupBox_13)
+        self.comboBox_13.setObjectName(u"comboBox_13")
+
+        self.horizontalLayout_56.addWidget(self.comboBox_13)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_56, 4, 1, 1, 1)
+
+        self.horizontalLayout_59 = QHBoxLayout()
+        self.horizontalLayout_59.setObjectName(u"horizontalLayout_59")
+        self.label_60 = QLabel(self.groupBox_13)
+        self.label_60.setObjectName(u"label_60")
+
+        self.horizontalLayout_59.addWidget(self.label_60)
+
+        self.comboBox_16 = QComboBox(self.groupBox_13)
+        self.comboBox_16.setObjectName(u"comboBox_16")
+
+        self.horizontalLayout_59.addWidget(self.comboBox_16)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_59, 6, 0, 1, 1)
+
+        self.horizontalLayout_48 = QHBoxLayout()
+        self.horizontalLayout_48.setObjectName(u"horizontalLayout_48")
+        self.label_49 = QLabel(self.groupBox_13)
+        self.label_49.setObjectName(u"label_49")
+
+        self.horizontalLayout_48.addWidget(self.label_49)
+
+        self.comboBox_5 = QComboBox(self.groupBox_13)
+        self.comboBox_5.setObjectName(u"comboBox_5")
+
+        self.horizontalLayout_48.addWidget(self.comboBox_5)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_48, 0, 0, 1, 1)
+
+        self.horizontalLayout_58 = QHBoxLayout()
+        self.horizontalLayout_58.setObjectName(u"horizontalLayout_58")
+        self.label_59 = QLabel(self.groupBox_13)
+        self.label_59.setObjectName(u"label_59")
+
+        self.horizontalLayout_58.addWidget(self.label_59)
+
+        self.comboBox_15 = QComboBox(self.groupBox_13)
+        self.comboBox_15.setObjectName(u"comboBox_15")
+
+        self.horizontalLayout_58.addWidget(self.comboBox_15)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_58, 5, 1, 1, 1)
+
+        self.horizontalLayout_49 = QHBoxLayout()
+        self.horizontalLayout_49.setObjectName(u"horizontalLayout_49")
+        self.label_50 = QLabel(self.groupBox_13)
+        self.label_50.setObjectName(u"label_50")
+
+        self.horizontalLayout_49.addWidget(self.label_50)
+
+        self.comboBox_6 = QComboBox(self.groupBox_13)
+        self.comboBox_6.setObjectName(u"comboBox_6")
+
+        self.horizontalLayout_49.addWidget(self.comboBox_6)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_49, 1, 0, 1, 1)
+
+        self.horizontalLayout_53 = QHBoxLayout()
+        self.horizontalLayout_53.setObjectName(u"horizontalLayout_53")
+        self.label_54 = QLabel(self.groupBox_13)
+        self.label_54.setObjectName(u"label_54")
+
+        self.horizontalLayout_53.addWidget(self.label_54)
+
+        self.comboBox_10 = QComboBox(self.groupBox_13)
+        self.comboBox_10.setObjectName(u"comboBox_10")
+
+        self.horizontalLayout_53.addWidget(self.comboBox_10)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_53, 3, 0, 1, 1)
+
+        self.horizontalLayout_62 = QHBoxLayout()
+        self.horizontalLayout_62.setObjectName(u"horizontalLayout_62")
+        self.label_63 = QLabel(self.groupBox_13)
+        self.label_63.setObjectName(u"label_63")
+
+        self.horizontalLayout_62.addWidget(self.label_63)
+
+        self.comboBox_19 = QComboBox(self.groupBox_13)
+        self.comboBox_19.setObjectName(u"comboBox_19")
+
+        self.horizontalLayout_62.addWidget(self.comboBox_19)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_62, 7, 1, 1, 1)
+
+        self.horizontalLayout_61 = QHBoxLayout()
+        self.horizontalLayout_61.setObjectName(u"horizontalLayout_61")
+        self.label_62 = QLabel(self.groupBox_13)
+        self.label_62.setObjectName(u"label_62")
+
+        self.horizontalLayout_61.addWidget(self.label_62)
+
+        self.comboBox_18 = QComboBox(self.groupBox_13)
+        self.comboBox_18.setObjectName(u"comboBox_18")
+
+        self.horizontalLayout_61.addWidget(self.comboBox_18)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_61, 7, 0, 1, 1)
+
+        self.horizontalLayout_64 = QHBoxLayout()
+        self.horizontalLayout_64.setObjectName(u"horizontalLayout_64")
+        self.label_65 = QLabel(self.groupBox_13)
+        self.label_65.setObjectName(u"label_65")
+
+        self.horizontalLayout_64.addWidget(self.label_65)
+
+        self.comboBox_21 = QComboBox(self.groupBox_13)
+        self.comboBox_21.setObjectName(u"comboBox_21")
+
+        self.horizontalLayout_64.addWidget(self.comboBox_21)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_64, 8, 1, 1, 1)
+
+        self.horizontalLayout_57 = QHBoxLayout()
+        self.horizontalLayout_57.setObjectName(u"horizontalLayout_57")
+        self.label_58 = QLabel(self.groupBox_13)
+        self.label_58.setObjectName(u"label_58")
+
+        self.horizontalLayout_57.addWidget(self.label_58)
+
+        self.comboBox_14 = QComboBox(self.groupBox_13)
+        self.comboBox_14.setObjectName(u"comboBox_14")
+
+        self.horizontalLayout_57.addWidget(self.comboBox_14)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_57, 5, 0, 1, 1)
+
+        self.horizontalLayout_51 = QHBoxLayout()
+        self.horizontalLayout_51.setObjectName(u"horizontalLayout_51")
+        self.label_52 = QLabel(self.groupBox_13)
+        self.label_52.setObjectName(u"label_52")
+
+        self.horizontalLayout_51.addWidget(self.label_52)
+
+        self.comboBox_8 = QComboBox(self.groupBox_13)
+        self.comboBox_8.setObjectName(u"comboBox_8")
+
+        self.horizontalLayout_51.addWidget(self.comboBox_8)
+
+
+        self.gridLayout_27.addLayout(self.horizontalLayout_51, 2, 0, 1, 1)
+
+        self.verticalSpacer_4 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.gridLayout_27.addItem(self.verticalSpacer_4, 9, 1, 1, 1)
+
+
+        self.gridLayout_24.addLayout(self.gridLayout_27, 0, 0, 1, 1)
+
+
+        self.gridLayout_25.addWidget(self.groupBox_13, 1, 1, 1, 1)
+
+
+        self.retranslateUi(tab_5)
+
+        QMetaObject.connectSlotsByName(tab_5)
+    # setupUi
+
+    def retranslateUi(self, tab_5):
+        self.z_license.setText(QCoreApplication.translate("ZombatarsTab", u"Accepted Zombatar License", None))
+        self.z_created_before.setText(QCoreApplication.translate("ZombatarsTab", u"Has created at least one Zombatar before", None))
+        self.pushButton_9.setText(QCoreApplication.translate("ZombatarsTab", u"Add", None))
+        self.pushButton_11.setText(QCoreApplication.translate("ZombatarsTab", u"Duplicate", None))
+        self.pushButton_10.setText(QCoreApplication.translate("ZombatarsTab", u"Delete", None))
+        self.groupBox_13.setTitle(QCoreApplication.translate("ZombatarsTab", u"Zombatar Properties", None))
+        self.label_55.setText(QCoreApplication.translate("ZombatarsTab", u"Accessories color:", None))
+        self.label_51.setText(QCoreApplication.translate("ZombatarsTab", u"Clothes color:", None))
+        self.label_64.setText(QCoreApplication.translate("ZombatarsTab", u"Backdrop type:", None))
+        self.label_53.setText(QCoreApplication.translate("ZombatarsTab", u"Tidbits color:", None))
+        self.label_56.setText(QCoreApplication.translate("ZombatarsTab", u"Facial hair type:", None))
+        self.label_61.setText(QCoreApplication.translate("ZombatarsTab", u"Eyewear color:", None))
+        self.label_57.setText(QCoreApplication.translate("ZombatarsTab", u"Facial hair color:", None))
+        self.label_60.setText(QCoreApplication.translate("ZombatarsTab", u"Eyewear type:", None))
+        self.label_49.setText(QCoreApplication.translate("ZombatarsTab", u"Skin color:", None))
+        self.label_59.setText(QCoreApplication.translate("ZombatarsTab", u"Hair color:", None))
+        self.label_50.setText(QCoreApplication.translate("ZombatarsTab", u"Clothes type:", None))
+        self.label_54.setText(QCoreApplication.translate("ZombatarsTab", u"Accessories type:", None))
+        self.label_63.setText(QCoreApplication.translate("ZombatarsTab", u"Hat color:", None))
+        self.label_62.setText(QCoreApplication.translate("ZombatarsTab", u"Hat type:", None))
+        self.label_65.setText(QCoreApplication.translate("ZombatarsTab", u"Backdrop color:", None))
+        self.label_58.setText(QCoreApplication.translate("ZombatarsTab", u"Hair type:", None))
+        self.label_52.setText(QCoreApplication.translate("ZombatarsTab", u"Tidbits type:", None))
+        pass
+    # retranslateUi
+
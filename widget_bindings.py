@@ -0,0 +1,218 @@
+from typing import Any, Callable, NamedTuple
+from PySide6 import QtCore
+
+class Binder(NamedTuple):
+  load: Callable[[Any, Any], None]
+  # None for widgets that are only displayed
+  read: Callable[[Any], Any] | None
+
+EPOCH = QtCore.QDate(2000, 1, 1)
+
+def _load_level(widget, level):
+  widget.setCurrentIndex(((level % 10) - 1) + (int(level / 11) * 10))
+
+def _load_days(widgets, days):
+  date, never = widgets
+  date.setDate(EPOCH.addDays(days))
+  never.setChecked(days == 0)
+
+def _load_amount(widgets, amount):
+  value, none = widgets
+  value.setValue(0 if amount == 0 else amount - 1000)
+  none.setChecked(amount == 0)
+
+TEXT = Binder(lambda widget, value: widget.setText(value), None)
+LEVEL = Binder(_load_level, None)
+CHECKED = Binder(lambda widget, value: widget.setChecked(bool(value)), lambda widget: widget.isChecked())
+NOT_ZERO = Binder(lambda widget, value: widget.setChecked(value != 0), None)
+VALUE = Binder(lambda widget, value: widget.setValue(value), lambda widget: widget.value())
+DAYS_OR_NEVER = Binder(_load_days, lambda widgets: 0 if widgets[1].isChecked() else EPOCH.daysTo(widgets[0].date()))
+AMOUNT_OR_NONE = Binder(_load_amount, lambda widgets: 0 if widgets[1].isChecked() else widgets[0].value() + 1000)
+
+# (path, widget name or tuple of widget names, binder) for every widget showing a user field
+WIDGET_BINDINGS = (
+  ('general.name', 'g_name', TEXT),
+  ('general.level', 'g_level', LEVEL),
+  ('general.completed', 'g_completed', VALUE),
+  ('general.money', 'g_money', VALUE),
+  ('general.minigames_unlocked', 'g_minigames_unlocked', CHECKED),
+  ('general.puzzles_unlocked', 'g_puzzle_unlocked', CHECKED),
+  ('general.has_taco', 'g_taco', CHECKED),
+  ('general.shop.slots', 'g_slots', VALUE),
+  ('general.shop.pool_cleaner', 'g_pool_cleaner', CHECKED),
+  ('general.shop.roof_cleaner', 'g_roof_cleaner', CHECKED),
+  ('general.shop.rake_uses', 'g_rake_uses', VALUE),
+  ('general.shop.plants.gatling_pea', 'g_plants_1', CHECKED),
+  ('general.shop.plants.twin_sunflower', 'g_plants_2', CHECKED),
+  ('general.shop.plants.cattail', 'g_plants_3', CHECKED),
+  ('general.shop.plants.gloom_shroom', 'g_plants_4', CHECKED),
+  ('general.shop.plants.spikerock', 'g_plants_5', CHECKED),
+  ('general.shop.plants.gold_magnet', 'g_plants_6', CHECKED),
+  ('general.shop.plants.winter_melon', 'g_plants_7', CHECKED),
+  ('general.shop.plants.cob_cannon', 'g_plants_8', CHECKED),
+  ('general.shop.plants.imitater', 'g_plants_9', CHECKED),
+  ('zen_garden.golden_can', 'zg_golden_can', CHECKED),
+  ('zen_garden.phonograph', 'zg_phonograph', CHECKED),
+  ('zen_garden.glove', 'zg_glove', CHECKED),
+  ('zen_garden.aquarium_garden', 'zg_aquarium_g', CHECKED),
+  ('zen_garden.mushroom_garden', 'zg_mushroom_g', CHECKED),
+  ('zen_garden.wheel_barrow', 'zg_wheelbarrow', CHECKED),
+  ('zen_garden.marigold1_date', ('zg_mg1_date', 'zg_mg1_never'), DAYS_OR_NEVER),
+  ('zen_garden.marigold2_date', ('zg_mg2_date', 'zg_mg2_never'), DAYS_OR_NEVER),
+  ('zen_garden.marigold3_date', ('zg_mg3_date', 'zg_mg3_never'), DAYS_OR_NEVER),
+  ('zen_garden.fertilizer', ('zg_fertilizer', 'zg_fertilizer_np'), AMOUNT_OR_NONE),
+  ('zen_garden.bug_spray', ('zg_bugspray', 'zg_bugspray_np'), AMOUNT_OR_NONE),
+  ('zen_garden.snail.last_awoken', 'zg_snail_purchased', NOT_ZERO),
+  ('zen_garden.snail.x', 'zg_snail_x', VALUE),
+  ('zen_garden.snail.y', 'zg_snail_y', VALUE),
+  ('achievements.home_lawn_security', 'a_1', CHECKED),
+  ('achievements.nobel_peas_prize', 'a_2', CHECKED),
+  ('achievements.better_off_dead', 'a_3', CHECKED),
+  ('achievements.china_shop', 'a_4', CHECKED),
+  ('achievements.spudow!', 'a_5', CHECKED),
+  ('achievements.explodonator', 'a_6', CHECKED),
+  ('achievements.morticulturalist', 'a_7', CHECKED),
+  ('achievements.dont_pea_in_the_pool', 'a_8', CHECKED),
+  ('achievements.roll_some_heads', 'a_9', CHECKED),
+  ('achievements.grounded', 'a_10', CHECKED),
+  ('achievements.zombologist', 'a_11', CHECKED),
+  ('achievements.penny_pitcher', 'a_12', CHECKED),
+  ('achievements.sunny_days', 'a_13', CHECKED),
+  ('achievements.popcorn_party', 'a_14', CHECKED),
+  ('achievements.good_morning', 'a_15', CHECKED),
+  ('achievements.no_fungus_among_us', 'a_16', CHECKED),
+  ('achievements.beyond_the_grave', 'a_17', CHECKED),
+  ('achievements.immortal', 'a_18', CHECKED),
+  ('achievements.towering_wisdom', 'a_19', CHECKED),
+  ('achievements.mustache_mode', 'a_20', CHECKED),
+  ('challenges.survivals.normal.day', 'c_surv_1', VALUE),
+  ('challenges.survivals.normal.night', 'c_surv_2', VALUE),
+  ('challenges.survivals.normal.pool', 'c_surv_3', VALUE),
+  ('challenges.survivals.normal.fog', 'c_surv_4', VALUE),
+  ('challenges.survivals.normal.roof', 'c_surv_5', VALUE),
+  ('challenges.survivals.hard.day', 'c_survhard_1', VALUE),
+  ('challenges.survivals.hard.night', 'c_survhard_2', VALUE),
+  ('challenges.survivals.hard.pool', 'c_survhard_3', VALUE),
+  ('challenges.survivals.hard.fog', 'c_survhard_4', VALUE),
+  ('challenges.survivals.hard.roof', 'c_survhard_5', VALUE),
+  ('challenges.survivals.endless', 'c_survend', VALUE),
+  ('challenges.minigames.zombotany', 'c_mg_1', CHECKED),
+  ('challenges.minigames.wallnut_bowling', 'c_mg_2', CHECKED),
+  ('challenges.minigames.slot_machine', 'c_mg_3', CHECKED),
+  ('challenges.minigames.its_raining_seeds', 'c_mg_4', CHECKED),
+  ('challenges.minigames.beghouled', 'c_mg_5', CHECKED),
+  ('challenges.minigames.invisighoul', 'c_mg_6', CHECKED),
+  ('challenges.minigames.seeing_stars', 'c_mg_7', CHECKED),
+  ('challenges.minigames.zombiquarium', 'c_mg_8', CHECKED),
+  ('challenges.minigames.beghouled_twist', 'c_mg_9', CHECKED),
+  ('challenges.minigames.big_trouble_little_zombie', 'c_mg_10', CHECKED),
+  ('challenges.minigames.portal_combat', 'c_mg_11', CHECKED),
+  ('challenges.minigames.column_like_you_see_em', 'c_mg_12', CHECKED),
+  ('challenges.minigames.bobsled_bonanza', 'c_mg_13', CHECKED),
+  ('challenges.minigames.zombie_n_zombie_q', 'c_mg_14', CHECKED),
+  ('challenges.minigames.whack_a_zombie', 'c_mg_15', CHECKED),
+  ('challenges.minigames.last_stand', 'c_mg_16', CHECKED),
+  ('challenges.minigames.zombotany2', 'c_mg_17', CHECKED),
+  ('challenges.minigames.wallnut_bowling2', 'c_mg_18', CHECKED),
+  ('challenges.minigames.pogo_party', 'c_mg_19', CHECKED),
+  ('challenges.minigames.dr_zomboss_revenge', 'c_mg_20', CHECKED),
+  ('challenges.puzzles.vasebreaker', 'c_pz_1', CHECKED),
+  ('challenges.puzzles.to_the_left', 'c_pz_2', CHECKED),
+  ('challenges.puzzles.third_vase', 'c_pz_3', CHECKED),
+  ('challenges.puzzles.chain_reaction', 'c_pz_4', CHECKED),
+  ('challenges.puzzles.m_is_for_metal', 'c_pz_5', CHECKED),
+  ('challenges.puzzles.scary_potter', 'c_pz_6', CHECKED),
+  ('challenges.puzzles.hokey_pokey', 'c_pz_7', CHECKED),
+  ('challenges.puzzles.another_chain_reaction', 'c_pz_8', CHECKED),
+  ('challenges.puzzles.ace_of_vases', 'c_pz_9', CHECKED),
+  ('challenges.puzzles.vasebreaker_endless', 'c_pz_10', VALUE),
+  ('challenges.puzzles.izombie', 'c_pz_11', CHECKED),
+  ('challenges.puzzles.izombie_too', 'c_pz_12', CHECKED),
+  ('challenges.puzzles.can_you_dig_it', 'c_pz_13', CHECKED),
+  ('challenges.puzzles.totally_nuts', 'c_pz_14', CHECKED),
+  ('challenges.puzzles.dead_zeppelin', 'c_pz_15', CHECKED),
+  ('challenges.puzzles.me_smash', 'c_pz_16', CHECKED),
+  ('challenges.puzzles.zomboggie', 'c_pz_17', CHECKED),
+  ('challenges.puzzles.tree_hit_wonder', 'c_pz_18', CHECKED),
+  ('challenges.puzzles.all_your_brainz', 'c_pz_19', CHECKED),
+  ('challenges.puzzles.izombie_endless', 'c_pz_20', VALUE),
+  ('limbo.survival_endless.day', 'l_survend_1', VALUE),
+  ('limbo.survival_endless.night', 'l_survend_2', VALUE),
+  ('limbo.survival_endless.fog', 'l_survend_3', VALUE),
+  ('limbo.survival_endless.roof', 'l_survend_4', VALUE),
+  ('limbo.minigames.art_wallnut', 'l_mg_1', CHECKED),
+  ('limbo.minigames.sunny_day', 'l_mg_2', CHECKED),
+  ('limbo.minigames.unsodded', 'l_mg_3', CHECKED),
+  ('limbo.minigames.buy_time', 'l_mg_4', CHECKED),
+  ('limbo.minigames.art_sunflower', 'l_mg_5', CHECKED),
+  ('limbo.minigames.air_raid', 'l_mg_6', CHECKED),
+  ('limbo.minigames.ice_level', 'l_mg_7', CHECKED),
+  ('limbo.minigames.zen_garden', 'l_mg_8', CHECKED),
+  ('limbo.minigames.high_gravity', 'l_mg_9', CHECKED),
+  ('limbo.minigames.grave_danger', 'l_mg_10', CHECKED),
+  ('limbo.minigames.can_you_dig_it', 'l_mg_11', CHECKED),
+  ('limbo.minigames.dark_night', 'l_mg_12', CHECKED),
+  ('limbo.minigames.bungee_blitz', 'l_mg_13', CHECKED),
+  ('limbo.minigames.intro', 'l_mg_14', CHECKED),
+  ('limbo.minigames.tree', 'l_mg_15', CHECKED),
+  ('limbo.minigames.upsell', 'l_mg_16', CHECKED),
+  ('zombatar.license', 'z_license', CHECKED),
+  ('zombatar.created_before', 'z_created_before', CHECKED),
+)
+
+BINDINGS = tuple((tuple(path.split('.')), names, binder) for path, names, binder in WIDGET_BINDINGS)
+
+# top level section -> its bindings, so each tab can be filled on its own
+SECTION_BINDINGS = {}
+for binding in BINDINGS:
+  SECTION_BINDINGS.setdefault(binding[0][0], []).append(binding)
+SECTION_BINDINGS = {section: tuple(bindings) for section, bindings in SECTION_BINDINGS.items()}
+
+def _widgets(ui, names):
+  if isinstance(names, tuple):
+    return tuple(getattr(ui, name) for name in names)
+  return getattr(ui, names)
+
+def _value(data, path):
+  for key in path:
+    data = data[key]
+  return data
+
+# signal an editable widget emits when its value changes, the first one it has is used
+CHANGE_SIGNALS = ('toggled', 'valueChanged', 'dateChanged', 'currentIndexChanged')
+
+def connect_bindings(ui, bindings, slot):
+  for binding in bindings:
+    path, names, binder = binding
+    if binder.read is None:
+      continue
+
+    widgets = _widgets(ui, names)
+    for widget in (widgets if isinstance(widgets, tuple) else (widgets,)):
+      signal = next(getattr(widget, name) for name in CHANGE_SIGNALS if hasattr(widget, name))
+      signal.connect(lambda *args, binding=binding: slot(binding))
+
+def load_bindings(ui, data, bindings=BINDINGS):
+  # path -> value read back from the widgets, so untouched widgets are never written back
+  loaded = {}
+  for path, names, binder in bindings:
+    widgets = _widgets(ui, names)
+    blocked = [(widget, widget.blockSignals(True)) for widget in (widgets if isinstance(widgets, tuple) else (widgets,))]
+    binder.load(widgets, _value(data, path))
+    for widget, was_blocked in blocked:
+      widget.blockSignals(was_blocked)
+
+    if binder.read is not None:
+      loaded[path] = binder.read(widgets)
+
+  return loaded
+
+def store_bindings(ui, data, loaded, bindings=BINDINGS):
+  for path, names, binder in bindings:
+    if binder.read is None or path not in loaded:
+      continue
+
+    value = binder.read(_widgets(ui, names))
+    if value != loaded[path]:
+      _value(data, path[:-1])[path[-1]] = value
+      loaded[path] = value
@@ -0,0 +1,44 @@
+import threading
+from PySide6 import QtCore
+
+class WorkerSignals(QtCore.QObject):
+  finished = QtCore.Signal(object)
+  failed = QtCore.Signal(object)
+  progress = QtCore.Signal(int, int)
+
+class Worker(QtCore.QRunnable):
+  def __init__(self, fn, *args, **kwargs) -> None:
+    super().__init__()
+    self.signals = WorkerSignals()
+    self.__fn = fn
+    self.__args = args
+    self.__kwargs = kwargs
+    self.__cancelled = threading.Event()
+
+  def cancel(self):
+    self.__cancelled.set()
+
+  def is_cancelled(self):
+    return self.__cancelled.is_set()
+
+  def __progress(self, done, total):
+    if not self.is_cancelled():
+      self.signals.progress.emit(done, total)
+
+  def run(self):
+    if self.is_cancelled():
+      return
+
+    try:
+      result = self.__fn(*self.__args, progress=self.__progress, is_cancelled=self.is_cancelled, **self.__kwargs)
+    except Exception as error:
+      if not self.is_cancelled():
+        self.signals.failed.emit(error)
+      return
+
+    if not self.is_cancelled():
+      self.signals.finished.emit(result)
+
+def start(worker, pool=None):
+  (pool or QtCore.QThreadPool.globalInstance()).start(worker)
+  return worker